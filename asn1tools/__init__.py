@@ -24,6 +24,7 @@ except ImportError:
 from .compiler import compile_dict
 from .compiler import compile_string
 from .compiler import compile_files
+from .compiler import load
 from .compiler import pre_process_dict
 from .parser import parse_string
 from .parser import parse_files
@@ -35,6 +36,7 @@ from .errors import CompileError
 from .errors import ConstraintsError
 from . source import c
 from . source import rust
+from . import parallel
 from .version import __version__
 
 
@@ -104,18 +106,14 @@ def _compile_files(specs, input_codec, output_codec, cache_dir):
             raise Exception('Expected one .py-file, but got {}.'.format(py_count))
 
         module = _import_module(specs[0])
-        parsed = module.SPECIFICATION
-        input_spec = compile_dict(parsed, input_codec)
-        output_spec = compile_dict(parsed, output_codec)
+        compiled = compile_dict(module.SPECIFICATION,
+                                codecs=[input_codec, output_codec])
     else:
-        input_spec = compile_files(specs,
-                                   input_codec,
-                                   cache_dir=cache_dir)
-        output_spec = compile_files(specs,
-                                    output_codec,
-                                    cache_dir=cache_dir)
+        compiled = compile_files(specs,
+                                 cache_dir=cache_dir,
+                                 codecs=[input_codec, output_codec])
 
-    return input_spec, output_spec
+    return compiled[input_codec], compiled[output_codec]
 
 
 def _do_convert(args):
@@ -150,7 +148,7 @@ def _do_convert(args):
                            args.hexstring)
 
 
-def _handle_command_compile(line):
+def _handle_command_compile(line, cache_dir):
     parser = ArgumentParser(prog='compile')
     parser.add_argument('-i', '--input-codec',
                         choices=('ber', 'der', 'jer', 'oer', 'per', 'uper', 'xer'),
@@ -163,7 +161,9 @@ def _handle_command_compile(line):
                         default='gser',
                         help='Output codec (default: %(default)s).')
     parser.add_argument('-c', '--cache-dir',
-                        help='Cache directory.')
+                        default=cache_dir,
+                        help=('Cache directory. Only modified files are parsed '
+                              'when compiling again (default: %(default)s).'))
     parser.add_argument('specification',
                         nargs='+',
                         help='ASN.1 specification as one or more .asn files.')
@@ -229,6 +229,7 @@ def _do_shell(_args):
     completer = WordCompleter(commands, WORD=True)
     user_home = os.path.expanduser('~')
     history = FileHistory(os.path.join(user_home, '.asn1tools-history.txt'))
+    cache_dir = os.path.join(user_home, '.asn1tools-cache')
     session = PromptSession(completer=completer,
                             complete_while_typing=True,
                             auto_suggest=AutoSuggestFromHistory(),
@@ -250,7 +251,9 @@ def _do_shell(_args):
 
         if line:
             if line.startswith('compile'):
-                input_spec, output_spec, output_codec = _handle_command_compile(line)
+                input_spec, output_spec, output_codec = _handle_command_compile(
+                    line,
+                    cache_dir)
             elif line.startswith('convert'):
                 _handle_command_convert(line,
                                         input_spec,
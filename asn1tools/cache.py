@@ -0,0 +1,142 @@
+"""A file system cache of compiled specifications.
+
+"""
+
+import os
+import sys
+import pickle
+import hashlib
+import tempfile
+
+from .version import __version__
+
+
+class Cache(object):
+    """A cache of compiled specifications in given directory
+    `directory`.
+
+    Entries are pickled compiled specifications, keyed by a hash of
+    the specification files contents, the compile options, the
+    asn1tools version and the Python version. A second, small index
+    entry keyed by the files modification times and sizes makes it
+    possible to find an entry without reading the specification
+    files.
+
+    Files are written atomically, so the cache can be shared by many
+    processes. The least recently used entries are removed when the
+    total size of the cache exceeds `size_limit` bytes.
+
+    """
+
+    def __init__(self, directory, size_limit=2 ** 30):
+        self._directory = directory
+        self._size_limit = size_limit
+
+    def get(self, filenames, options, compile_):
+        """Returns the compiled specification of given files and options,
+        either from the cache, or by calling `compile_` and adding the
+        result to the cache.
+
+        """
+
+        options = '\n'.join([
+            __version__,
+            '{}.{}'.format(*sys.version_info[:2]),
+            repr(options)
+        ]).encode('utf-8')
+
+        stat_key = self._stat_key(filenames, options)
+
+        try:
+            key = self._read(stat_key + '.index').decode('ascii')
+            compiled = pickle.loads(self._read(key + '.pickle'))
+        except Exception:
+            key = self._content_key(filenames, options)
+
+            try:
+                compiled = pickle.loads(self._read(key + '.pickle'))
+            except Exception:
+                compiled = compile_()
+                self._write(key + '.pickle', pickle.dumps(compiled, -1))
+                self._evict()
+
+            self._write(stat_key + '.index', key.encode('ascii'))
+
+        return compiled
+
+    def _stat_key(self, filenames, options):
+        key = hashlib.sha256(options)
+
+        for filename in filenames:
+            stat = os.stat(filename)
+            key.update('\n{}\n{}\n{}'.format(os.path.abspath(filename),
+                                             stat.st_mtime_ns,
+                                             stat.st_size).encode('utf-8'))
+
+        return key.hexdigest()
+
+    def _content_key(self, filenames, options):
+        key = hashlib.sha256(options)
+
+        for filename in filenames:
+            with open(filename, 'rb') as fin:
+                contents = fin.read()
+
+            key.update(b'\n%d\n' % len(contents))
+            key.update(contents)
+
+        return key.hexdigest()
+
+    def _read(self, name):
+        path = os.path.join(self._directory, name)
+
+        with open(path, 'rb') as fin:
+            data = fin.read()
+
+        # The modification time is the last access time, used when
+        # removing least recently used entries.
+        os.utime(path)
+
+        return data
+
+    def _write(self, name, data):
+        os.makedirs(self._directory, exist_ok=True)
+        fd, path = tempfile.mkstemp(dir=self._directory, suffix='.tmp')
+
+        try:
+            with os.fdopen(fd, 'wb') as fout:
+                fout.write(data)
+
+            os.replace(path, os.path.join(self._directory, name))
+        except BaseException:
+            os.remove(path)
+            raise
+
+    def _evict(self):
+        entries = []
+        size = 0
+
+        for entry in os.scandir(self._directory):
+            if not entry.name.endswith(('.pickle', '.index')):
+                continue
+
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+            size += stat.st_size
+
+        entries.sort()
+
+        for _, entry_size, path in entries:
+            if size <= self._size_limit:
+                break
+
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+            size -= entry_size
@@ -6,6 +6,7 @@ import time
 import math
 import binascii
 from copy import copy
+from collections.abc import Mapping
 import datetime
 
 from ..parser import EXTENSION_MARKER
@@ -199,6 +200,22 @@ def encode_length_definite(length):
     return encoded
 
 
+def insert_length_definite(encoded, offset):
+    """Set the length of the contents from given offset to the end of
+    given encoded data. A single byte length placeholder is expected
+    right before the offset, which is widened if the long form is
+    needed.
+
+    """
+
+    length = len(encoded) - offset
+
+    if length <= 127:
+        encoded[offset - 1] = length
+    else:
+        encoded[offset - 1:offset] = encode_length_definite(length)
+
+
 def decode_length(encoded, offset, enforce_definite=True):
     """
     Decode definite or indefinite length of an ASN.1 node
@@ -298,6 +315,70 @@ def read_tag(data, offset):
     return data[offset:skip_tag(data, offset)]
 
 
+def decode_tag_value(data, offset, max_length):
+    """
+    Read the tag at offset as an integer, see tag_value(). Raises
+    IndexError if out of data.
+    :param bytes data:
+    :param int offset:
+    :param int max_length: Maximum tag length in bytes
+    :return: Tuple of (tag value, end offset). The tag value is None if
+             the tag is longer than the maximum length
+    """
+    value = data[offset]
+    end_offset = offset + max_length
+    offset += 1
+
+    if value & 0x1f == 0x1f:
+        byte = 0x80
+
+        while byte & 0x80:
+            if offset >= end_offset:
+                return None, offset
+
+            byte = data[offset]
+            value <<= 8
+            value |= byte
+            offset += 1
+
+    return value, offset
+
+
+def read_tag_value(data, offset):
+    """
+    Same as read_tag(), but returns the tag as an integer, see
+    tag_value()
+    :param bytes data:
+    :param int offset:
+    :return:
+    """
+    end_offset = skip_tag(data, offset)
+
+    if end_offset == offset + 1:
+        return data[offset]
+
+    return tag_value(data[offset:end_offset])
+
+
+def tag_value(tag):
+    """
+    Get given encoded tag as an integer, to be compared with
+    read_tag_value() instead of comparing byte strings
+    :param bytes tag:
+    :return:
+    """
+    return int.from_bytes(tag, 'big')
+
+
+def tag_from_value(value):
+    """
+    Get the encoded tag of given tag_value() integer
+    :param int value:
+    :return:
+    """
+    return value.to_bytes(max((value.bit_length() + 7) // 8, 1), 'big')
+
+
 def skip_tag_length_contents(data, offset):
     """
     Get offset position at end of node (skip tag, length and contents)
@@ -310,6 +391,26 @@ def skip_tag_length_contents(data, offset):
     return sum(decode_length(data, offset))
 
 
+def skip_element(data, offset):
+    """
+    Get offset position at end of node (skip tag, length and contents),
+    for both definite and indefinite length nodes
+    :param data:
+    :param offset:
+    :return:
+    """
+    offset = skip_tag(data, offset)
+    length, offset = decode_length(data, offset, enforce_definite=False)
+
+    if length is not None:
+        return offset + length
+
+    while data[offset:offset + 2] != b'\x00\x00':
+        offset = skip_element(data, offset)
+
+    return offset + 2
+
+
 def encode_real(data):
     if data == float('inf'):
         data = b'\x40'
@@ -476,9 +577,11 @@ class Type(BaseType):
         if number is None:
             self.tag = None
             self.tag_len = None
+            self.tag_value = None
         else:
             self.tag = encode_tag(number, flags)
             self.tag_len = len(self.tag)
+            self.tag_value = tag_value(self.tag)
 
     def decode(self, data, offset, values=None):
         """
@@ -490,6 +593,16 @@ class Type(BaseType):
         """
         raise NotImplementedError()
 
+    def decode_lazy(self, data, offset):
+        """
+        Same as decode(), but SEQUENCE and SET values are decoded as
+        LazyMembers objects
+        :param bytes data: Binary ASN1 data to decode
+        :param int offset: Current byte offset
+        :return: Tuple of (decoded_value, end_offset)
+        """
+        return self.decode(data, offset)
+
     def encode(self, data, encoded, values=None):
         """
         Encode value into byte data
@@ -500,9 +613,23 @@ class Type(BaseType):
         """
         raise NotImplementedError()
 
+    def encode_checked(self, data, encoded, checker):
+        """
+        Same as encode(), but the types of given data are checked with
+        given type checker first. Types with members check and encode
+        each member in turn instead
+        :param data: Value to be encoded
+        :param bytearray encoded: Existing byte data to add encoded data to
+        :param checker: Type checker of this type
+        :return: None (extend 'encoded' bytearray)
+        """
+        checker.encode(data)
+        self.encode(data, encoded)
+
     def set_tag(self, number, flags):
         self.tag = encode_tag(number, flags)
         self.tag_len = len(self.tag)
+        self.tag_value = tag_value(self.tag)
 
     def format_tag(self):
         """
@@ -531,13 +658,16 @@ class StandardDecodeMixin(object):
         :return: Tuple of (decoded_value, end_offset)
         """
         start_offset = offset
-        offset += self.tag_len
 
         # Validate tag
-        tag_data = data[start_offset:offset]
-        if tag_data != self.tag:
+        try:
+            tag, offset = decode_tag_value(data, offset, self.tag_len)
+        except IndexError:
+            tag = None
+
+        if tag != self.tag_value:
             # Check for missing data
-            if len(tag_data) != self.tag_len:
+            if start_offset + self.tag_len > len(data):
                 raise OutOfByteDataError('Ran out of data when reading tag',
                                          offset=start_offset)
             # return TAG_MISMATCH Instead of raising DecodeTagError for better performance so that MembersType does
@@ -550,6 +680,38 @@ class StandardDecodeMixin(object):
 
         return self.decode_content(data, offset, length)
 
+    def decode_lazy(self, data, offset):
+        """
+        Same as decode(), but decodes content with decode_content_lazy()
+        :param bytes data: Binary ASN1 data to decode
+        :param int offset: Current byte offset
+        :return: Tuple of (decoded_value, end_offset)
+        """
+        start_offset = offset
+
+        try:
+            tag, offset = decode_tag_value(data, offset, self.tag_len)
+        except IndexError:
+            tag = None
+
+        if tag != self.tag_value:
+            if start_offset + self.tag_len > len(data):
+                raise OutOfByteDataError('Ran out of data when reading tag',
+                                         offset=start_offset)
+
+            return TAG_MISMATCH, start_offset
+
+        length, offset = decode_length(data, offset, enforce_definite=not self.indefinite_allowed)
+
+        return self.decode_content_lazy(data, offset, length)
+
+    def decode_content_lazy(self, data, offset, length):
+        """
+        Same as decode_content(), but SEQUENCE and SET values are
+        decoded as LazyMembers objects
+        """
+        return self.decode_content(data, offset, length)
+
     def decode_content(self, data, offset, length):
         """
         Type-specific logic to decode content
@@ -573,8 +735,10 @@ class StandardEncodeMixin(object):
         :param values:
         :return:
         """
-        encoded_data = bytearray(self.encode_content(data, values=values))
-        encoded.extend(self.tag + encode_length_definite(len(encoded_data)) + encoded_data)
+        encoded_data = self.encode_content(data, values=values)
+        encoded.extend(self.tag)
+        encoded.extend(encode_length_definite(len(encoded_data)))
+        encoded.extend(encoded_data)
 
     def encode_content(self, data, values=None):
         """
@@ -586,6 +750,55 @@ class StandardEncodeMixin(object):
         raise NotImplementedError()
 
 
+class ConstructedEncodeMixin(object):
+    """
+    Type class mixin for constructed types, encoding the contents straight
+    into the encoded data instead of into a temporary buffer. The length
+    is inserted before the contents when their size is known.
+    """
+    def encode(self, data, encoded, values=None):
+        """
+        Encode value into byte data
+        :param data: Value to be encoded
+        :param bytearray encoded: Existing byte data to add encoded data to
+        :param values:
+        :return:
+        """
+        encoded.extend(self.tag)
+        encoded.append(0)
+        offset = len(encoded)
+        self.encode_content_into(data, encoded)
+        insert_length_definite(encoded, offset)
+
+    def encode_checked(self, data, encoded, checker):
+        encoded.extend(self.tag)
+        encoded.append(0)
+        offset = len(encoded)
+        self.encode_content_into_checked(data, encoded, checker)
+        insert_length_definite(encoded, offset)
+
+    def encode_content_into(self, data, encoded):
+        """
+        Encode data value contents into given bytearray
+        :param data:
+        :param bytearray encoded:
+        :return:
+        """
+        raise NotImplementedError()
+
+    def encode_content_into_checked(self, data, encoded, checker):
+        """
+        Same as encode_content_into(), but the types of given data are
+        checked with given type checker as well
+        :param data:
+        :param bytearray encoded:
+        :param checker: Type checker of this type
+        :return:
+        """
+        checker.encode(data)
+        self.encode_content_into(data, encoded)
+
+
 class PrimitiveOrConstructedType(Type):
     """
     Base type class for types which can be either primitive or constructed (BitString, OctetString, String)
@@ -599,12 +812,13 @@ class PrimitiveOrConstructedType(Type):
         self.segment = segment
         self.constructed_tag = copy(self.tag)
         self.constructed_tag[0] |= Encoding.CONSTRUCTED
+        self.constructed_tag_value = tag_value(self.constructed_tag)
 
     def set_tag(self, number, flags):
-        self.tag = encode_tag(number, flags)
+        super(PrimitiveOrConstructedType, self).set_tag(number, flags)
         self.constructed_tag = copy(self.tag)
         self.constructed_tag[0] |= Encoding.CONSTRUCTED
-        self.tag_len = len(self.tag)
+        self.constructed_tag_value = tag_value(self.constructed_tag)
 
     def decode(self, data, start_offset, values=None):
         """
@@ -612,15 +826,17 @@ class PrimitiveOrConstructedType(Type):
         Return decoded value and new offset
         """
 
-        offset = start_offset + self.tag_len
-        tag = data[start_offset:offset]
+        try:
+            tag, offset = decode_tag_value(data, start_offset, self.tag_len)
+        except IndexError:
+            tag = None
 
         # Validate tag
-        if tag == self.tag:
+        if tag == self.tag_value:
             is_primitive = True
-        elif tag == self.constructed_tag:
+        elif tag == self.constructed_tag_value:
             is_primitive = False
-        elif len(tag) != self.tag_len:
+        elif start_offset + self.tag_len > len(data):
             # Detect out of data
             raise OutOfByteDataError('Ran out of data when reading tag',
                                      offset=start_offset)
@@ -680,7 +896,7 @@ class StringType(StandardEncodeMixin, PrimitiveOrConstructedType):
         return bytearray().join(segments).decode(self.ENCODING)
 
 
-class MembersType(StandardEncodeMixin, StandardDecodeMixin, Type):
+class MembersType(ConstructedEncodeMixin, StandardDecodeMixin, Type):
     indefinite_allowed = True
 
     def __init__(self, name, tag_name, tag, root_members, additions):
@@ -690,39 +906,51 @@ class MembersType(StandardEncodeMixin, StandardDecodeMixin, Type):
                                           Encoding.CONSTRUCTED)
         self.root_members = root_members
         self.additions = additions
+        self.addition_members = flatten(additions) if additions else []
+        # Built on first decode, when all recursive types are known.
+        self.member_indexes = None
 
     def set_tag(self, number, flags):
         super(MembersType, self).set_tag(number,
                                          flags | Encoding.CONSTRUCTED)
 
-    def encode_content(self, data, values=None):
-        encoded_members = bytearray()
-
+    def encode_content_into(self, data, encoded):
         for member in self.root_members:
-            self.encode_member(member, data, encoded_members)
+            self.encode_member(member, data, encoded)
+
+        if self.additions:
+            self.encode_additions(data, encoded)
+
+    def encode_content_into_checked(self, data, encoded, checker):
+        checker.encode_type(data)
 
+        for member in self.root_members:
+            self.encode_member_checked(member, data, encoded, checker)
 
         if self.additions:
-            self.encode_additions(data, encoded_members)
+            # Errors are ignored when encoding additions, so check them
+            # first.
+            for member in self.addition_members:
+                self.check_member(member, data, checker)
 
-        return encoded_members
+            self.encode_additions(data, encoded)
 
     def encode_additions(self, data, encoded_members):
-        try:
-            for addition in self.additions:
-                encoded_addition = bytearray()
+        for addition in self.additions:
+            offset = len(encoded_members)
 
+            try:
                 if isinstance(addition, list):
                     for member in addition:
-                        self.encode_member(member, data, encoded_addition)
+                        self.encode_member(member, data, encoded_members)
                 else:
                     self.encode_member(addition,
                                        data,
-                                       encoded_addition)
-
-                encoded_members.extend(encoded_addition)
-        except EncodeError:
-            pass
+                                       encoded_members)
+            except EncodeError:
+                # Drop the partially encoded addition.
+                del encoded_members[offset:]
+                break
 
     def encode_member(self, member, data, encoded_members):
         name = member.name
@@ -746,18 +974,66 @@ class MembersType(StandardEncodeMixin, StandardDecodeMixin, Type):
                 name,
                 data))
 
+    def encode_member_checked(self, member, data, encoded_members, checker):
+        name = member.name
+
+        if (name in data
+            and not isinstance(member, AnyDefinedBy)
+            and not member.has_default()):
+            try:
+                member.encode_checked(data[name],
+                                      encoded_members,
+                                      checker.name_to_member[name])
+            except ErrorWithLocation as e:
+                # Add member location
+                e.add_location(member)
+                raise e
+        else:
+            # Checked before compared to the default value.
+            self.check_member(member, data, checker)
+            self.encode_member(member, data, encoded_members)
+
+    def check_member(self, member, data, checker):
+        name = member.name
+
+        if name in data:
+            try:
+                checker.name_to_member[name].encode(data[name])
+            except ErrorWithLocation as e:
+                # Add member location
+                e.add_location(member)
+                raise e
+
+    def get_member_indexes(self):
+        if self.member_indexes is None:
+            self.member_indexes = (build_member_index(self.root_members),
+                                   build_member_index(self.addition_members))
+
+        return self.member_indexes
+
     def decode_content(self, data, offset, length):
 
         end_offset = None if length is None else offset + length
 
         values = {}
+        root_index, addition_index = self.get_member_indexes()
 
-        offset, out_of_data = self.decode_members(self.root_members, data, values, offset, end_offset)
+        offset, out_of_data = self.decode_members(self.root_members,
+                                                  data,
+                                                  values,
+                                                  offset,
+                                                  end_offset,
+                                                  member_index=root_index)
 
         # Decode additions (even if out of data already, so defaults can be added)
         if self.additions:
-            offset, out_of_data = self.decode_members(flatten(self.additions), data, values, offset, end_offset,
-                                                      ignore_missing=True)
+            offset, out_of_data = self.decode_members(self.addition_members,
+                                                      data,
+                                                      values,
+                                                      offset,
+                                                      end_offset,
+                                                      ignore_missing=True,
+                                                      member_index=addition_index)
 
         if out_of_data:
             return values, offset
@@ -769,7 +1045,56 @@ class MembersType(StandardEncodeMixin, StandardDecodeMixin, Type):
             # Extra data is allowed in cases of versioned additions
             return values, end_offset
 
-    def decode_members(self, members, data, values, offset, end_offset, ignore_missing=False):
+    def decode_content_lazy(self, data, offset, length):
+        """
+        Same as decode_content(), but only finds the member
+        encodings. Member values are decoded when accessed in the
+        returned LazyMembers
+        :param bytes data: Binary ASN1 data to decode
+        :param int offset: Offset for start of content bytes
+        :param int length: Length of content bytes (None if indefinite)
+        :return: Tuple of (LazyMembers, end_offset)
+        """
+        end_offset = None if length is None else offset + length
+        values = {}
+        root_index, addition_index = self.get_member_indexes()
+        offset, out_of_data = self.decode_members(self.root_members,
+                                                  data,
+                                                  values,
+                                                  offset,
+                                                  end_offset,
+                                                  lazy=True,
+                                                  member_index=root_index)
+
+        if self.additions:
+            offset, out_of_data = self.decode_members(self.addition_members,
+                                                      data,
+                                                      values,
+                                                      offset,
+                                                      end_offset,
+                                                      ignore_missing=True,
+                                                      lazy=True,
+                                                      member_index=addition_index)
+
+        if out_of_data:
+            return LazyMembers(self, values, data), offset
+
+        if end_offset is None:
+            raise NoEndOfContentsTagError(
+                'Could not find end-of-contents tag for indefinite length field.',
+                offset=offset)
+        else:
+            return LazyMembers(self, values, data), end_offset
+
+    def decode_members(self,
+                       members,
+                       data,
+                       values,
+                       offset,
+                       end_offset,
+                       ignore_missing=False,
+                       lazy=False,
+                       member_index=None):
         """
         Decode values for members from data starting from offset
         Supports member data encoded in different order than members specified
@@ -779,12 +1104,22 @@ class MembersType(StandardEncodeMixin, StandardDecodeMixin, Type):
         :param int offset:
         :param int end_offset: End offset of member data (None if indefinite length field)
         :param bool ignore_missing: Whether to not raise DecodeError for missing mandatory fields with no defaults
+        :param bool lazy: Whether to only find member encodings, and add
+            EncodedMember objects to values
+        :param dict member_index: Index of members by tag from
+            build_member_index(), if any
         :return:
         """
         # Decode member values from data
-        remaining_members = members
+        if member_index is None:
+            remaining_members = members
+            out_of_data = False
+        else:
+            remaining_members, offset, out_of_data = self.dispatch_members(
+                members, member_index, data, values, offset, end_offset, lazy)
+
         # Outer loop to enable decoding members out of order
-        while True:
+        while not out_of_data:
             undecoded_members = []
             decode_success = False  # Whether at least one member was successfully decoded
 
@@ -798,12 +1133,7 @@ class MembersType(StandardEncodeMixin, StandardDecodeMixin, Type):
                     continue
 
                 # Attempt decode
-                try:
-                    value, offset = member.decode(data, offset, values=values)
-                except ErrorWithLocation as e:
-                    # Add member location
-                    e.add_location(member)
-                    raise e
+                value, offset = self.decode_member(member, data, values, offset, lazy)
 
                 if value == TAG_MISMATCH:
                     undecoded_members.append(member)
@@ -838,6 +1168,93 @@ class MembersType(StandardEncodeMixin, StandardDecodeMixin, Type):
                 raise DecodeTagError(member, data, offset, location=member)
         return offset, out_of_data
 
+    def decode_member(self, member, data, values, offset, lazy):
+        try:
+            if lazy:
+                return find_member(member, data, offset)
+            else:
+                return member.decode(data, offset, values=values)
+        except ErrorWithLocation as e:
+            # Add member location
+            e.add_location(member)
+            raise e
+
+    def dispatch_members(self,
+                         members,
+                         member_index,
+                         data,
+                         values,
+                         offset,
+                         end_offset,
+                         lazy):
+        """
+        Decode members by looking up the member of each tag in given index, in
+        the same order as trying to decode each remaining member would. Stops at
+        the first tag not matching any remaining member, leaving it to
+        decode_members()
+        :return: Tuple of (remaining members, offset, out_of_data)
+        """
+        number_of_members = len(members)
+        decoded = [False] * number_of_members
+        # Position of the next member to try in the current pass over
+        # the remaining members.
+        position = 0
+
+        while True:
+            out_of_data, offset = is_end_of_data(data, offset, end_offset)
+
+            if out_of_data:
+                break
+
+            value = TAG_MISMATCH
+
+            # Members are usually encoded in order, so try the next one
+            # before looking up the tag.
+            if position < number_of_members and not decoded[position]:
+                member_position = position
+                value, offset = self.decode_member(members[member_position],
+                                                   data,
+                                                   values,
+                                                   offset,
+                                                   lazy)
+
+            if value == TAG_MISMATCH:
+                try:
+                    positions = member_index.get(read_tag_value(data, offset), ())
+                except OutOfByteDataError:
+                    positions = ()
+
+                member_position = find_member_position(positions, decoded, position)
+
+                if member_position is None and position > 0:
+                    # Start a new pass over the remaining members.
+                    position = 0
+                    member_position = find_member_position(positions, decoded, 0)
+
+                if member_position is None:
+                    break
+
+                value, offset = self.decode_member(members[member_position],
+                                                   data,
+                                                   values,
+                                                   offset,
+                                                   lazy)
+
+                if value == TAG_MISMATCH:
+                    break
+
+            decoded[member_position] = True
+            values[members[member_position].name] = value
+            position = member_position + 1
+
+        remaining_members = [
+            member
+            for member_position, member in enumerate(members)
+            if not decoded[member_position]
+        ]
+
+        return remaining_members, offset, out_of_data
+
     def __repr__(self):
         return '{}({}, [{}])'.format(
             self.__class__.__name__,
@@ -845,7 +1262,157 @@ class MembersType(StandardEncodeMixin, StandardDecodeMixin, Type):
             ', '.join([repr(member) for member in self.root_members]))
 
 
-class ArrayType(StandardEncodeMixin, StandardDecodeMixin, Type):
+class EncodedMember(object):
+    """
+    Location of a not yet decoded member in a LazyMembers object
+    """
+    __slots__ = ('member', 'offset')
+
+    def __init__(self, member, offset):
+        self.member = member
+        self.offset = offset
+
+
+class LazyMembers(Mapping):
+    """
+    Read-only mapping of SEQUENCE or SET member names to values. A
+    member value is decoded the first time it is accessed
+    """
+
+    def __init__(self, type_, values, data):
+        """
+
+        :param MembersType type_: SEQUENCE or SET type
+        :param dict values: Member values and EncodedMember objects
+        :param bytes data: Binary ASN1 data
+        """
+        self._type = type_
+        self._values = values
+        self._data = data
+
+    def __getitem__(self, name):
+        value = self._values[name]
+
+        if isinstance(value, EncodedMember):
+            member = value.member
+
+            try:
+                if isinstance(member, AnyDefinedBy):
+                    value, _ = member.decode(self._data, value.offset, self)
+                else:
+                    value, _ = member.decode_lazy(self._data, value.offset)
+            except ErrorWithLocation as e:
+                # Add member location
+                e.add_location(member)
+                e.add_location(self._type)
+                raise e
+
+            self._values[name] = value
+
+        return value
+
+    def __iter__(self):
+        return iter(self._values)
+
+    def __len__(self):
+        return len(self._values)
+
+    def __repr__(self):
+        return repr(dict(self))
+
+
+def materialize(value):
+    """
+    Decode all members of given LazyMembers object, recursively
+    :param value:
+    :return: Decoded value with dictionaries instead of LazyMembers objects
+    """
+    if isinstance(value, LazyMembers):
+        return {name: materialize(value[name]) for name in value}
+    elif isinstance(value, tuple) and len(value) == 2:
+        # CHOICE.
+        return (value[0], materialize(value[1]))
+    else:
+        return value
+
+
+def get_member_tags(member):
+    """
+    Get set of tags given member may be encoded with
+    :param Type member:
+    :return: Set of tag values, or None if any tag may match
+    """
+    if isinstance(member, Recursive):
+        return get_member_tags(member.inner)
+    elif isinstance(member, Choice):
+        if member.has_extension_marker:
+            return None
+
+        return set(member.tag_to_member)
+    elif isinstance(member, (Any, AnyDefinedBy)):
+        return None
+
+    tags = {member.tag_value}
+
+    if hasattr(member, 'constructed_tag_value'):
+        tags.add(member.constructed_tag_value)
+
+    return tags
+
+
+def build_member_index(members):
+    """
+    Map tag values to positions of members that may be encoded with them
+    :param list members: List of member types
+    :return: Dictionary of tag values to lists of member positions, or None
+             if a member may match any tag
+    """
+    member_index = {}
+
+    for member_position, member in enumerate(members):
+        tags = get_member_tags(member)
+
+        if tags is None:
+            return None
+
+        for tag in tags:
+            member_index.setdefault(tag, []).append(member_position)
+
+    return member_index
+
+
+def find_member_position(positions, decoded, position):
+    """
+    Find first not yet decoded member position from given position
+    :param list positions: Member positions in increasing order
+    :param list decoded: Whether each member is decoded
+    :param int position:
+    :return: Member position, or None if not found
+    """
+    for member_position in positions:
+        if member_position >= position and not decoded[member_position]:
+            return member_position
+
+    return None
+
+
+def find_member(member, data, offset):
+    """
+    Find the encoding of given member at offset without decoding it
+    :param Type member:
+    :param bytes data:
+    :param int offset:
+    :return: Tuple of (EncodedMember or TAG_MISMATCH, end_offset)
+    """
+    tags = get_member_tags(member)
+
+    if tags is not None and read_tag_value(data, offset) not in tags:
+        return TAG_MISMATCH, offset
+
+    return EncodedMember(member, offset), skip_element(data, offset)
+
+
+class ArrayType(ConstructedEncodeMixin, StandardDecodeMixin, Type):
     indefinite_allowed = True
 
     def __init__(self, name, tag_name, tag, element_type):
@@ -859,13 +1426,17 @@ class ArrayType(StandardEncodeMixin, StandardDecodeMixin, Type):
         super(ArrayType, self).set_tag(number,
                                        flags | Encoding.CONSTRUCTED)
 
-    def encode_content(self, data, values=None):
-        encoded_elements = bytearray()
-
+    def encode_content_into(self, data, encoded):
         for entry in data:
-            self.element_type.encode(entry, encoded_elements)
+            self.element_type.encode(entry, encoded)
+
+    def encode_content_into_checked(self, data, encoded, checker):
+        checker.encode_type(data)
+        element_type = self.element_type
+        element_checker = checker.element_type
 
-        return encoded_elements
+        for entry in data:
+            element_type.encode_checked(entry, encoded, element_checker)
 
     def decode_content(self, data, offset, length):
 
@@ -1176,10 +1747,10 @@ class Choice(Type):
             else:
                 tags = self.get_member_tags(member.inner)
         else:
-            tags.append(bytes(member.tag))
+            tags.append(member.tag_value)
 
-            if hasattr(member, 'constructed_tag'):
-                tags.append(bytes(member.constructed_tag))
+            if hasattr(member, 'constructed_tag_value'):
+                tags.append(member.constructed_tag_value)
 
         return tags
 
@@ -1192,7 +1763,7 @@ class Choice(Type):
         return tags
 
     def format_tag(self):
-        return [format_bytes(tag) for tag in self.tag_to_member]
+        return [format_bytes(tag_from_value(tag)) for tag in self.tag_to_member]
 
     def format_names(self):
         return format_or(sorted([member.name for member in self.members]))
@@ -1212,8 +1783,19 @@ class Choice(Type):
             e.add_location(member)
             raise e
 
+    def encode_checked(self, data, encoded, checker):
+        member_checker = checker.encode_type(data)
+        member = self.name_to_member[data[0]]
+
+        try:
+            member.encode_checked(data[1], encoded, member_checker)
+        except ErrorWithLocation as e:
+            # Add member location
+            e.add_location(member)
+            raise e
+
     def decode(self, data, offset, values=None):
-        tag = bytes(read_tag(data, offset))
+        tag = read_tag_value(data, offset)
 
         if tag in self.tag_to_member:
             member = self.tag_to_member[tag]
@@ -1232,6 +1814,23 @@ class Choice(Type):
 
         return (member.name, decoded), offset
 
+    def decode_lazy(self, data, offset):
+        tag = read_tag_value(data, offset)
+
+        if tag not in self.tag_to_member:
+            return self.decode(data, offset)
+
+        member = self.tag_to_member[tag]
+
+        try:
+            decoded, offset = member.decode_lazy(data, offset)
+        except ErrorWithLocation as e:
+            # Add member location
+            e.add_location(member)
+            raise e
+
+        return (member.name, decoded), offset
+
     def __repr__(self):
         return 'Choice({}, [{}])'.format(
             self.name,
@@ -1456,7 +2055,7 @@ class AnyDefinedBy(Type):
             return data[start:end_offset], end_offset
 
 
-class ExplicitTag(StandardEncodeMixin, StandardDecodeMixin, Type):
+class ExplicitTag(ConstructedEncodeMixin, StandardDecodeMixin, Type):
     # no_error_location = True
     indefinite_allowed = True
 
@@ -1480,14 +2079,20 @@ class ExplicitTag(StandardEncodeMixin, StandardDecodeMixin, Type):
         super(ExplicitTag, self).set_tag(number,
                                          flags | Encoding.CONSTRUCTED)
 
-    def encode_content(self, data, values=None):
-        encoded_inner = bytearray()
-        self.inner.encode(data, encoded_inner)
-        return encoded_inner
+    def encode_content_into(self, data, encoded):
+        self.inner.encode(data, encoded)
+
+    def encode_content_into_checked(self, data, encoded, checker):
+        self.inner.encode_checked(data, encoded, checker)
 
     def decode_content(self, data, offset, length):
+        return self.decode_inner(data, offset, length, self.inner.decode)
 
-        values, end_offset = self.inner.decode(data, offset)
+    def decode_content_lazy(self, data, offset, length):
+        return self.decode_inner(data, offset, length, self.inner.decode_lazy)
+
+    def decode_inner(self, data, offset, length, decode):
+        values, end_offset = decode(data, offset)
 
         check_decode_error(self.inner, values, data, offset)
 
@@ -1532,6 +2137,9 @@ class Recursive(compiler.Recursive, Type):
     def decode(self, data, offset, values=None):
         return self.inner.decode(data, offset)
 
+    def decode_lazy(self, data, offset):
+        return self.inner.decode_lazy(data, offset)
+
 
 class CompiledType(compiler.CompiledType):
 
@@ -1546,6 +2154,17 @@ class CompiledType(compiler.CompiledType):
 
         return encoded
 
+    def check_types_and_encode(self, data):
+        encoded = bytearray()
+        try:
+            self._type.encode_checked(data, encoded, self.type_checker.type)
+        except ErrorWithLocation as e:
+            # Add member location
+            e.add_location(self._type)
+            raise e
+
+        return encoded
+
     def decode(self, data):
         return self.decode_with_length(data)[0]
 
@@ -1565,6 +2184,122 @@ class CompiledType(compiler.CompiledType):
             raise e
         return decoded, offset
 
+    def decode_lazy(self, data):
+        if not isinstance(data, bytes):
+            data = bytes(data)
+
+        try:
+            decoded, offset = self._type.decode_lazy(data, 0)
+            # Raise DecodeError
+            check_decode_error(self._type, decoded, data, offset)
+        except ErrorWithLocation as e:
+            # Add member location
+            e.add_location(self._type)
+            raise e
+
+        return decoded
+
+    def extract(self, data, paths):
+        decoded = self.decode_lazy(data)
+        extracted = {}
+
+        for path in paths:
+            try:
+                value = compiler.get_path_value(decoded, path.split('.'))
+            except KeyError:
+                continue
+
+            extracted[path] = materialize(value)
+
+        return extracted
+
+    def iter_decode(self, data, chunk_size=65536):
+        """
+        Decode concatenated encodings read from given file object or
+        iterable of bytes-like chunks, and yield each decoded value as
+        soon as all of its data has been read.
+        :param data:
+        :param int chunk_size: Number of bytes to read at a time from a file object
+        :return:
+        """
+        if hasattr(data, 'read'):
+            chunks = iter(lambda: data.read(chunk_size), b'')
+        else:
+            chunks = iter(data)
+
+        encoded = bytearray()
+        # Number of bytes needed before trying to find the end of the
+        # next encoding.
+        needed = 0
+        consumed = 0
+        # Whether there is data not yet searched for encodings.
+        unsearched = False
+
+        while True:
+            chunk = next(chunks, None)
+
+            if chunk is not None:
+                encoded += chunk
+                unsearched = True
+
+                if len(encoded) < needed:
+                    continue
+            elif not unsearched:
+                break
+
+            offset = 0
+            needed = 0
+            unsearched = False
+
+            while offset < len(encoded):
+                try:
+                    end_offset = skip_element(encoded, offset)
+                except MissingDataError as e:
+                    needed = e.offset + e.expected_length - offset
+                    break
+                except OutOfByteDataError:
+                    # The end of an indefinite length encoding is searched
+                    # for from its start, so wait for twice as much data
+                    # to not search it once per chunk.
+                    needed = 2 * (len(encoded) - offset)
+                    break
+                except DecodeError as e:
+                    add_offset(e, consumed)
+                    raise e
+
+                try:
+                    decoded, _ = self._type.decode(encoded, offset)
+                    check_decode_error(self._type, decoded, encoded, offset)
+                except DecodeError as e:
+                    # Add member location
+                    e.add_location(self._type)
+                    add_offset(e, consumed)
+                    raise e
+
+                offset = end_offset
+
+                yield decoded
+
+            # Only keep data of the next encoding.
+            del encoded[:offset]
+            consumed += offset
+
+        if encoded:
+            raise OutOfByteDataError(
+                'Expected more data after {} byte(s).'.format(len(encoded)),
+                offset=consumed)
+
+
+def add_offset(error, offset):
+    """
+    Add given offset to the offset of given decode error
+    :param DecodeError error:
+    :param int offset:
+    :return:
+    """
+    if error.offset is not None:
+        error.offset += offset
+
 
 def get_tag_no_encoding(member):
     value = (member.tag[0] & ~Encoding.CONSTRUCTED)
@@ -5,6 +5,7 @@
 import binascii
 import sys
 from operator import attrgetter
+from collections.abc import Mapping
 import bitstruct
 
 from copy import copy
@@ -25,6 +26,25 @@ def flatten(dlist):
     return flist
 
 
+def get_path_value(value, names):
+    """Returns the value at given path in given decoded value. The path
+    is a list of SEQUENCE and SET member names and CHOICE alternative
+    names. Raises KeyError if the path is not found.
+
+    """
+
+    for name in names:
+        if isinstance(value, Mapping):
+            value = value[name]
+        elif isinstance(value, tuple) and value[0] == name:
+            # CHOICE.
+            value = value[1]
+        else:
+            raise KeyError(name)
+
+    return value
+
+
 def is_object_class_type_name(type_name):
     return '&' in type_name
 
@@ -104,6 +124,16 @@ class CompiledType(object):
     def check_constraints(self, data):
         return self.constraints_checker.encode(data)
 
+    def check_types_and_encode(self, data, **kwargs):
+        """Check the types of given data and encode it. Codecs may do both
+        in a single pass over the data.
+
+        """
+
+        self.check_types(data)
+
+        return self.encode(data, **kwargs)
+
     def encode(self, data):
         raise NotImplementedError('This codec does not support encode().')
 
@@ -113,6 +143,23 @@ class CompiledType(object):
     def decode_with_length(self, data):
         raise NotImplementedError('This codec does not support decode_with_length().')
 
+    def decode_lazy(self, data):
+        raise NotImplementedError('This codec does not support lazy decoding.')
+
+    def extract(self, data, paths):
+        raise NotImplementedError('This codec does not support extract().')
+
+    def iter_decode(self, data):
+        raise NotImplementedError('This codec does not support iter_decode().')
+
+    def encode_many(self, data, **kwargs):
+        for item in data:
+            yield self.encode(item, **kwargs)
+
+    def decode_many(self, data):
+        for item in data:
+            yield self.decode(item)
+
     def __repr__(self):
         return repr(self._type)
 
@@ -185,6 +232,21 @@ class CompiledOpenTypes(CompiledType):
     def decode(self, data):
         return self._type.decode(data)
 
+    def encode_many(self, data, **kwargs):
+        return self._type.encode_many(data, **kwargs)
+
+    def decode_many(self, data):
+        return self._type.decode_many(data)
+
+    def decode_lazy(self, data):
+        return self._type.decode_lazy(data)
+
+    def extract(self, data, paths):
+        return self._type.extract(data, paths)
+
+    def iter_decode(self, data):
+        return self._type.iter_decode(data)
+
 
 class Compiler(object):
 
@@ -194,6 +256,7 @@ class Compiler(object):
         self._types_backtrace = []
         self.recursive_types = []
         self.compiled = {}
+        self.processed = {}
         self.current_type_descriptor = None
 
     def types_backtrace_push(self, type_name):
@@ -206,42 +269,73 @@ class Compiler(object):
     def types_backtrace(self):
         return self._types_backtrace
 
-    def process(self):
-        self.pre_process()
-
-        compiled = {}
+    def process(self, pre_process=True):
+        if pre_process:
+            self.pre_process()
 
         for module_name in self._specification:
-            items = self._specification[module_name]['types'].items()
-
-            for type_name, type_descriptor in items:
-                self.types_backtrace_push(type_name)
-                compiled_type = self.process_type(type_name,
-                                                  type_descriptor,
-                                                  module_name)
-                compiled_type.type_name = type_name
-                compiled_type.module_name = module_name
-                compiled_open_types = self.compile_open_types(type_name,
-                                                              type_descriptor,
-                                                              module_name)
+            for type_name in self._specification[module_name]['types']:
+                self.process_top_level_type(type_name, module_name)
+
+        self.resolve_recursive_types()
 
-                if compiled_open_types:
-                    compiled_type = CompiledOpenTypes(compiled_open_types,
-                                                      compiled_type)
+        return self.processed
 
-                self.types_backtrace_pop()
+    def process_lazy(self, type_name, module_name):
+        """Returns given compiled top level type, compiling it and all
+        types it depends on the first time it is called. The
+        specification must be pre-processed before calling this
+        method.
 
-                if module_name not in compiled:
-                    compiled[module_name] = {}
+        """
 
-                compiled[module_name][type_name] = compiled_type
+        try:
+            return self.processed[module_name][type_name]
+        except KeyError:
+            pass
 
-        for recursive_type in self.recursive_types:
-            compiled_module = compiled[recursive_type.module_name]
-            inner_type = compiled_module[recursive_type.type_name].type
-            recursive_type.set_inner_type(inner_type)
+        compiled_type = self.process_top_level_type(type_name, module_name)
+        self.resolve_recursive_types()
 
-        return compiled
+        return compiled_type
+
+    def process_top_level_type(self, type_name, module_name):
+        type_descriptor = self._specification[module_name]['types'][type_name]
+        self.types_backtrace_push(type_name)
+        compiled_type = self.process_type(type_name,
+                                          type_descriptor,
+                                          module_name)
+        compiled_type.type_name = type_name
+        compiled_type.module_name = module_name
+        compiled_open_types = self.compile_open_types(type_name,
+                                                      type_descriptor,
+                                                      module_name)
+
+        if compiled_open_types:
+            compiled_type = CompiledOpenTypes(compiled_open_types,
+                                              compiled_type)
+
+        self.types_backtrace_pop()
+
+        if module_name not in self.processed:
+            self.processed[module_name] = {}
+
+        self.processed[module_name][type_name] = compiled_type
+
+        return compiled_type
+
+    def resolve_recursive_types(self):
+        # Recursive types refer to top level types, which are
+        # compiled here if not already done. That may add more
+        # recursive types to the list.
+        while self.recursive_types:
+            recursive_types = self.recursive_types
+            self.recursive_types = []
+
+            for recursive_type in recursive_types:
+                inner_type = self.process_lazy(recursive_type.type_name,
+                                               recursive_type.module_name).type
+                recursive_type.set_inner_type(inner_type)
 
     def pre_process(self):
         for module_name, module in self._specification.items():
@@ -30,6 +30,8 @@ STRING_TYPES = [
     'ObjectDescriptor'
 ]
 
+INFINITY = float('inf')
+
 TIME_TYPES = [
     'UTCTime',
     'GeneralizedTime',
@@ -45,6 +47,8 @@ class Type(object):
         self.name = name
         self.minimum = 'MIN'
         self.maximum = 'MAX'
+        self.lower = -INFINITY
+        self.upper = INFINITY
 
     def set_range(self, minimum, maximum, has_extension_marker):
         if has_extension_marker:
@@ -59,6 +63,10 @@ class Type(object):
         self.minimum = minimum
         self.maximum = maximum
 
+        # Numeric bounds makes range checks a single comparison.
+        self.lower = -INFINITY if minimum == 'MIN' else minimum
+        self.upper = INFINITY if maximum == 'MAX' else maximum
+
     def set_size_range(self, minimum, maximum, has_extension_marker):
         self.set_range(minimum, maximum, has_extension_marker)
 
@@ -69,10 +77,7 @@ class Type(object):
         self.set_range(minimum, maximum, has_extension_marker)
 
     def is_in_range(self, value):
-        minimum_ok = (not self.has_lower_bound()) or (value >= self.minimum)
-        maximum_ok = (not self.has_upper_bound()) or (value <= self.maximum)
-
-        return minimum_ok and maximum_ok
+        return self.lower <= value <= self.upper
 
     def set_default(self, value):
         pass
@@ -86,6 +91,14 @@ class Type(object):
     def is_bound(self):
         return self.has_lower_bound() and self.has_upper_bound()
 
+    def is_constrained(self):
+        """Returns ``False`` if encode() never raises an error, in which
+        case there is no need to call it.
+
+        """
+
+        return self.has_lower_bound() or self.has_upper_bound()
+
     def encode(self, data):
         raise NotImplementedError('To be implemented by subclasses.')
 
@@ -108,17 +121,29 @@ class String(Type):
 
         self.permitted_alphabet = permitted_alphabet
 
+        if permitted_alphabet is None:
+            self.permitted_characters = None
+        else:
+            self.permitted_characters = frozenset(permitted_alphabet)
+
+    def is_constrained(self):
+        return (super(String, self).is_constrained()
+                or self.permitted_alphabet is not None)
+
     def encode(self, data):
         length = len(data)
 
-        if not self.is_in_range(length):
+        if not self.lower <= length <= self.upper:
             raise ConstraintsError(
                 'Expected between {} and {} characters, but got {}.'.format(
                     self.minimum,
                     self.maximum,
                     length))
 
-        if self.permitted_alphabet is None:
+        if self.permitted_characters is None:
+            return
+
+        if self.permitted_characters.issuperset(data):
             return
 
         for character in data:
@@ -143,7 +168,7 @@ class Integer(Type):
         super(Integer, self).__init__(name)
 
     def encode(self, data):
-        if not self.is_in_range(data):
+        if not self.lower <= data <= self.upper:
             raise ConstraintsError(
                 'Expected an integer between {} and {}, but got {}.'.format(
                     self.minimum,
@@ -172,7 +197,7 @@ class BitString(Type):
     def encode(self, data):
         number_of_bits = data[1]
 
-        if not self.is_in_range(number_of_bits):
+        if not self.lower <= number_of_bits <= self.upper:
             raise ConstraintsError(
                 'Expected between {} and {} bits, but got {}.'.format(
                     self.minimum,
@@ -195,7 +220,7 @@ class Bytes(Type):
     def encode(self, data):
         length = len(data)
 
-        if not self.is_in_range(length):
+        if not self.lower <= length <= self.upper:
             raise ConstraintsError(
                 'Expected between {} and {} bytes, but got {}.'.format(
                     self.minimum,
@@ -208,9 +233,16 @@ class Dict(Type):
     def __init__(self, name, members):
         super(Dict, self).__init__(name)
         self.members = members
+        # Only members with constraints are checked.
+        self.constrained_members = [
+            member for member in members if member.is_constrained()
+        ]
+
+    def is_constrained(self):
+        return len(self.constrained_members) > 0
 
     def encode(self, data):
-        for member in self.members:
+        for member in self.constrained_members:
             name = member.name
 
             if name in data:
@@ -228,19 +260,27 @@ class List(Type):
         super(List, self).__init__(name)
         self.element_type = element_type
         self.set_size_range(minimum, maximum, has_extension_marker)
+        self.is_element_type_constrained = element_type.is_constrained()
+
+    def is_constrained(self):
+        return (super(List, self).is_constrained()
+                or self.is_element_type_constrained)
 
     def encode(self, data):
         length = len(data)
 
-        if not self.is_in_range(length):
+        if not self.lower <= length <= self.upper:
             raise ConstraintsError(
                 'Expected a list of between {} and {} elements, but got {}.'.format(
                     self.minimum,
                     self.maximum,
                     length))
 
-        for entry in data:
-            self.element_type.encode(entry)
+        if self.is_element_type_constrained:
+            encode = self.element_type.encode
+
+            for entry in data:
+                encode(entry)
 
 
 class Choice(Type):
@@ -249,23 +289,35 @@ class Choice(Type):
         super(Choice, self).__init__(name)
         self.members = members
         self.name_to_member = {member.name: member for member in self.members}
+        # Only members with constraints are checked.
+        self.name_to_constrained_member = {
+            member.name: member
+            for member in self.members
+            if member.is_constrained()
+        }
         self.has_extension_marker = has_extension_marker
 
+    def is_constrained(self):
+        return (not self.has_extension_marker
+                or len(self.name_to_constrained_member) > 0)
+
     def format_names(self):
         return format_or(sorted(self.name_to_member))
 
     def encode(self, data):
         value = data[0]
 
-        if value in self.name_to_member:
-            member = self.name_to_member[value]
-        elif self.has_extension_marker:
-            return
-        else:
+        try:
+            member = self.name_to_constrained_member[value]
+        except KeyError:
+            if value in self.name_to_member or self.has_extension_marker:
+                return
+
             raise ConstraintsError(
                 "Expected choice {}, but got '{}'.".format(
                     self.format_names(),
                     value))
+
         try:
             member.encode(data[1])
         except ErrorWithLocation as e:
@@ -319,6 +371,10 @@ class Recursive(compiler.Recursive, Type):
         self.module_name = module_name
         self.inner = None
 
+    def is_constrained(self):
+        # The inner type is not yet known.
+        return True
+
     def set_inner_type(self, inner):
         self.inner = copy(inner)
 
@@ -328,7 +384,14 @@ class Recursive(compiler.Recursive, Type):
 
 class CompiledType(compiler.CompiledType):
 
+    def __init__(self, type_):
+        super(CompiledType, self).__init__(type_)
+        self.is_constrained = type_.is_constrained()
+
     def encode(self, data):
+        if not self.is_constrained:
+            return
+
         try:
             self._type.encode(data)
         except ErrorWithLocation as e:
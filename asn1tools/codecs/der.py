@@ -9,6 +9,7 @@ from . import restricted_generalized_time_to_datetime
 from . import restricted_generalized_time_from_datetime
 from .compiler import clean_bit_string_value
 from .ber import Class, DecodeTagError, StandardEncodeMixin
+from .ber import ConstructedEncodeMixin
 from .ber import Encoding
 from .ber import Tag
 from .ber import encode_length_definite
@@ -36,6 +37,19 @@ from .ber import decode_length
 from .ber import decode_real
 
 
+def is_sorted(elements):
+    """
+    Check if given list is in ascending order
+    :param list elements:
+    :return:
+    """
+    for i in range(1, len(elements)):
+        if elements[i - 1] > elements[i]:
+            return False
+
+    return True
+
+
 class Type(ber.StandardDecodeMixin, ber.Type):
 
     def set_tag(self, number, flags):
@@ -63,7 +77,7 @@ class StringType(StandardEncodeMixin, Type):
         return data[offset:end_offset].decode(self.ENCODING), end_offset
 
 
-class ArrayType(StandardEncodeMixin, Type):
+class ArrayType(ConstructedEncodeMixin, Type):
 
     def __init__(self, name, tag_name, tag, element_type):
         super(ArrayType, self).__init__(name,
@@ -76,13 +90,17 @@ class ArrayType(StandardEncodeMixin, Type):
         super(ArrayType, self).set_tag(number,
                                        flags | Encoding.CONSTRUCTED)
 
-    def encode_content(self, data, values=None):
-        encoded_elements = bytearray()
-
+    def encode_content_into(self, data, encoded):
         for entry in data:
-            self.element_type.encode(entry, encoded_elements)
+            self.element_type.encode(entry, encoded)
 
-        return encoded_elements
+    def encode_content_into_checked(self, data, encoded, checker):
+        checker.encode_type(data)
+        element_type = self.element_type
+        element_checker = checker.element_type
+
+        for entry in data:
+            element_type.encode_checked(entry, encoded, element_checker)
 
     def decode_content(self, data, offset, length):
         decoded = []
@@ -195,6 +213,29 @@ class SetOf(ArrayType):
                                     Tag.SET,
                                     element_type)
 
+    def encode_content_into(self, data, encoded):
+        """
+        Encode each element once and sort the encodings in ascending
+        order, as required by DER. Elements already in order are not
+        sorted and moved
+        """
+        offset = len(encoded)
+        elements = []
+
+        for entry in data:
+            start = len(encoded)
+            self.element_type.encode(entry, encoded)
+            elements.append(encoded[start:])
+
+        if not is_sorted(elements):
+            elements.sort()
+            encoded[offset:] = b''.join(elements)
+
+    def encode_content_into_checked(self, data, encoded, checker):
+        # Check all elements before encoding and sorting them.
+        checker.encode(data)
+        self.encode_content_into(data, encoded)
+
 
 class UTF8String(StringType):
 
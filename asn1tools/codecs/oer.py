@@ -2,7 +2,6 @@
 
 """
 
-import binascii
 from copy import copy
 import struct
 from operator import attrgetter
@@ -46,36 +45,50 @@ def encode_tag(number, flags):
 
 
 class Encoder(object):
+    """Encodes into a byte buffer. OER is byte aligned, except for
+    preambles and presence bitmaps. Their bits are written into the
+    last byte of the buffer, and set later by backpatching if needed.
+
+    """
 
     def __init__(self):
-        self.number_of_bits = 0
-        self.value = 0
+        self.buf = bytearray()
+        self.number_of_unused_bits = 0
 
     def __iadd__(self, other):
-        self.append_non_negative_binary_integer(other.value,
-                                                other.number_of_bits)
+        if self.number_of_unused_bits == 0 and other.number_of_unused_bits == 0:
+            self.buf += other.buf
+        else:
+            self.append_bits(other.buf, other.number_of_bits)
 
         return self
 
+    @property
+    def number_of_bits(self):
+        return 8 * len(self.buf) - self.number_of_unused_bits
+
     def number_of_bytes(self):
-        return (self.number_of_bits + 7) // 8
+        return len(self.buf)
 
     def set_bit(self, offset):
-        self.value |= (1 << (self.number_of_bits - offset - 1))
+        self.buf[offset >> 3] |= (0x80 >> (offset & 0x7))
 
     def align(self):
-        width = (8 * self.number_of_bytes() - self.number_of_bits)
-        self.number_of_bits += width
-        self.value <<= width
+        self.number_of_unused_bits = 0
 
     def append_bit(self, bit):
         """Append given bit.
 
         """
 
-        self.number_of_bits += 1
-        self.value <<= 1
-        self.value |= bit
+        if self.number_of_unused_bits == 0:
+            self.buf.append(0)
+            self.number_of_unused_bits = 8
+
+        self.number_of_unused_bits -= 1
+
+        if bit:
+            self.buf[-1] |= (1 << self.number_of_unused_bits)
 
     def append_bits(self, data, number_of_bits):
         """Append given bits.
@@ -85,195 +98,229 @@ class Encoder(object):
         if number_of_bits == 0:
             return
 
-        value = int(binascii.hexlify(data), 16)
-        value >>= (8 * len(data) - number_of_bits)
+        number_of_bytes = ((number_of_bits + 7) // 8)
+        value = int.from_bytes(data[:number_of_bytes], 'big')
+        value >>= (8 * number_of_bytes - number_of_bits)
 
         self.append_non_negative_binary_integer(value, number_of_bits)
 
     def append_u8(self, value):
-        return self.append_non_negative_binary_integer(value, 8)
+        if self.number_of_unused_bits == 0:
+            self.buf.append(value)
+        else:
+            self.append_non_negative_binary_integer(value, 8)
 
     def append_bytes(self, data):
         """Append given data.
 
         """
 
-        self.append_bits(data, 8 * len(data))
+        if self.number_of_unused_bits == 0:
+            self.buf += data
+        else:
+            self.append_bits(data, 8 * len(data))
 
     def as_bytearray(self):
         """Return the bits as a bytearray.
 
         """
 
-        if self.number_of_bits == 0:
-            return bytearray()
-
-        data = self.value
-        data |= (0x80 << self.number_of_bits)
-        data = hex(data)[4:].rstrip('L')
-
-        return bytearray(binascii.unhexlify(data))
+        return self.buf
 
     def append_length_determinant(self, value):
         if value < 128:
-            self.append_non_negative_binary_integer(value, 8)
+            self.append_u8(value)
         else:
-            encoded = bytearray()
-
-            while value > 0:
-                encoded.append(value & 0xff)
-                value >>= 8
-
-            length = len(encoded)
+            length = ((value.bit_length() + 7) // 8)
 
             if length > 127:
                 raise EncodeError('Length determinant {} is too big.'.format(value))
 
             self.append_u8(0x80 | length)
-            self.append_bytes(encoded[::-1])
+            self.append_bytes(value.to_bytes(length, 'big'))
 
     def append_non_negative_binary_integer(self, value, number_of_bits):
         """Append given integer value.
 
         """
 
-        self.number_of_bits += number_of_bits
-        self.value <<= number_of_bits
-        self.value |= value
+        if self.number_of_unused_bits == 0 and (number_of_bits & 0x7) == 0:
+            self.buf += value.to_bytes(number_of_bits >> 3, 'big')
 
-    def append_integer(self, value):
-        number_of_bits = value.bit_length()
+            return
 
-        if value < 0:
-            number_of_bytes = ((number_of_bits + 7) // 8)
-            value = ((1 << (8 * number_of_bytes)) + value)
+        if self.number_of_unused_bits > 0:
+            # Merge the used bits of the last byte with the value.
+            number_of_used_bits = (8 - self.number_of_unused_bits)
+            value |= ((self.buf.pop() >> self.number_of_unused_bits)
+                      << number_of_bits)
+            number_of_bits += number_of_used_bits
 
-            if (value & (1 << (8 * number_of_bytes - 1))) == 0:
-                value |= (0xff << (8 * number_of_bytes))
-                number_of_bytes += 1
-        elif value > 0:
-            number_of_bytes = ((number_of_bits + 7) // 8)
+        self.number_of_unused_bits = (-number_of_bits & 0x7)
+        number_of_bits += self.number_of_unused_bits
+        self.buf += (value << self.number_of_unused_bits).to_bytes(
+            number_of_bits >> 3,
+            'big')
 
-            if number_of_bits == (8 * number_of_bytes):
-                number_of_bytes += 1
+    def append_integer(self, value):
+        if value < 0:
+            number_of_bytes = (((~value).bit_length() + 8) // 8)
         else:
-            number_of_bytes = 1
+            number_of_bytes = ((value.bit_length() + 8) // 8)
 
         self.append_length_determinant(number_of_bytes)
-        self.append_non_negative_binary_integer(value, 8 * number_of_bytes)
+        self.append_bytes(value.to_bytes(number_of_bytes, 'big', signed=True))
 
     def append_unsigned_integer(self, value):
-        number_of_bits = max(value.bit_length(), 1)
-        number_of_bytes = ((number_of_bits + 7) // 8)
+        number_of_bytes = ((max(value.bit_length(), 1) + 7) // 8)
         self.append_length_determinant(number_of_bytes)
-        self.append_non_negative_binary_integer(value, 8 * number_of_bytes)
+        self.append_bytes(value.to_bytes(number_of_bytes, 'big'))
 
     def __repr__(self):
         return format_bytes(self.as_bytearray())
 
 
 class Decoder(object):
+    """Decodes from a memoryview of given data. Bits are only read in
+    preambles and presence bitmaps, which are always followed by
+    align(), so all other reads are byte aligned.
 
-    def __init__(self, encoded):
-        self.number_of_bits = (8 * len(encoded))
-        self.total_number_of_bits = self.number_of_bits
+    """
 
-        if len(encoded) > 0:
-            self.value = int(binascii.hexlify(encoded), 16)
-        else:
-            self.value = 0
+    def __init__(self, encoded):
+        self.buf = memoryview(encoded)
+        self.length = len(self.buf)
+        self.offset = 0
+        self.bit_offset = 0
 
     def align(self):
-        width = (self.number_of_bits & 0x7)
-        self.number_of_bits -= width
+        if self.bit_offset > 0:
+            self.offset += 1
+            self.bit_offset = 0
 
     def number_of_read_bits(self):
-        return self.total_number_of_bits - self.number_of_bits
+        return 8 * self.offset + self.bit_offset
 
     def skip_bits(self, number_of_bits):
-        if number_of_bits > self.number_of_bits:
-            raise OutOfDataError(self.number_of_read_bits())
+        end = self.number_of_read_bits() + number_of_bits
 
-        self.number_of_bits -= number_of_bits
-
-    def peek_bit(self):
-        return ((self.value >> (self.number_of_bits - 1)) & 1)
+        if end > 8 * self.length:
+            raise OutOfDataError(self.number_of_read_bits())
 
-    def clear_bit(self):
-        self.value &= (1 << (self.number_of_bits - 1)) - 1
+        self.offset = (end >> 3)
+        self.bit_offset = (end & 0x7)
 
     def read_bit(self):
         """Read a bit.
 
         """
 
-        if self.number_of_bits == 0:
+        if self.offset == self.length:
+            raise OutOfDataError(self.number_of_read_bits())
+
+        value = ((self.buf[self.offset] >> (7 - self.bit_offset)) & 1)
+        self.bit_offset += 1
+
+        if self.bit_offset == 8:
+            self.offset += 1
+            self.bit_offset = 0
+
+        return value
+
+    def read_byte(self):
+        if self.offset == self.length:
             raise OutOfDataError(self.number_of_read_bits())
 
-        self.number_of_bits -= 1
+        value = self.buf[self.offset]
+        self.offset += 1
 
-        return ((self.value >> self.number_of_bits) & 1)
+        return value
 
-    def read_bits(self, number_of_bits):
-        """Read given number of bits.
+    def read_view(self, number_of_bytes):
+        """Read given number of bytes as a memoryview of the data, without
+        copying it.
 
         """
 
-        if number_of_bits > self.number_of_bits:
-            raise OutOfDataError(self.number_of_read_bits())
+        offset = self.offset
+        end = offset + number_of_bytes
 
-        self.number_of_bits -= number_of_bits
-        mask = ((1 << number_of_bits) - 1)
-        value = ((self.value >> self.number_of_bits) & mask)
-        value &= mask
-        value |= (0x80 << number_of_bits)
+        if end > self.length:
+            raise OutOfDataError(self.number_of_read_bits())
 
-        return binascii.unhexlify(hex(value)[4:].rstrip('L'))
+        self.offset = end
 
-    def read_byte(self):
-        return self.read_non_negative_binary_integer(8)
+        return self.buf[offset:end]
 
     def read_bytes(self, number_of_bytes):
-        return self.read_bits(8 * number_of_bytes)
+        return self.read_view(number_of_bytes).tobytes()
 
-    def read_non_negative_binary_integer(self, number_of_bits):
-        """Read an integer value of given number of bits.
+    def read_struct(self, struct_):
+        """Read a value of given precompiled struct.
 
         """
 
-        if number_of_bits > self.number_of_bits:
+        offset = self.offset
+
+        if offset + struct_.size > self.length:
+            raise OutOfDataError(self.number_of_read_bits())
+
+        self.offset += struct_.size
+
+        return struct_.unpack_from(self.buf, offset)[0]
+
+    def read_structs(self, struct_, number_of_values):
+        """Read given number of consecutive values of given precompiled
+        struct.
+
+        """
+
+        offset = self.offset
+        end = offset + number_of_values * struct_.size
+
+        if end > self.length:
+            # Fail at the first value that does not fit.
+            self.offset += struct_.size * ((self.length - offset) // struct_.size)
+
             raise OutOfDataError(self.number_of_read_bits())
 
-        self.number_of_bits -= number_of_bits
-        mask = ((1 << number_of_bits) - 1)
+        self.offset = end
 
-        return ((self.value >> self.number_of_bits) & mask)
+        return list(struct.unpack_from(
+            '>{}{}'.format(number_of_values, struct_.format[1:]),
+            self.buf,
+            offset))
+
+    def read_non_negative_binary_integer(self, number_of_bits):
+        """Read an integer value of given number of bits.
+
+        """
+
+        offset = self.number_of_read_bits()
+        self.skip_bits(number_of_bits)
+        end = offset + number_of_bits
+        value = int.from_bytes(self.buf[offset >> 3:(end + 7) >> 3], 'big')
+        value >>= (-end & 0x7)
+
+        return value & ((1 << number_of_bits) - 1)
 
     def read_length_determinant(self):
         value = self.read_byte()
 
         if value & 0x80:
-            length = (value & 0x7f)
-            value = self.read_non_negative_binary_integer(8 * length)
+            value = int.from_bytes(self.read_view(value & 0x7f), 'big')
 
         return value
 
     def read_integer(self):
-        number_of_bytes = self.read_length_determinant()
-        number_of_bits = 8 * number_of_bytes
-        value = self.read_non_negative_binary_integer(number_of_bits)
+        return self.read_signed_integer(self.read_length_determinant())
 
-        if value & (1 << (number_of_bits - 1)):
-            value -= (1 << number_of_bits) - 1
-            value -= 1
-
-        return value
+    def read_signed_integer(self, number_of_bytes):
+        return int.from_bytes(self.read_view(number_of_bytes), 'big', signed=True)
 
     def read_unsigned_integer(self):
-        number_of_bytes = self.read_length_determinant()
-        number_of_bits = 8 * number_of_bytes
-
-        return self.read_non_negative_binary_integer(number_of_bits)
+        return int.from_bytes(self.read_view(self.read_length_determinant()),
+                              'big')
 
     def read_tag(self):
         byte = self.read_byte()
@@ -313,6 +360,13 @@ class Type(BaseType):
     def set_restricted_to_range(self, minimum, maximum, has_extension_marker):
         pass
 
+    def decode_many(self, decoder, number_of_values):
+        """Decode given number of consecutive values of this type.
+
+        """
+
+        return [self.decode(decoder) for _ in range(number_of_values)]
+
 
 class KnownMultiplierStringType(Type):
 
@@ -349,7 +403,7 @@ class KnownMultiplierStringType(Type):
         else:
             number_of_bytes = self.number_of_bytes
 
-        return decoder.read_bytes(number_of_bytes).decode(self.ENCODING)
+        return str(decoder.read_view(number_of_bytes), self.ENCODING)
 
 
 class MembersType(Type):
@@ -540,13 +594,8 @@ class ArrayType(Type):
 
     def decode(self, decoder):
         length = decoder.read_unsigned_integer()
-        decoded = []
-
-        for _ in range(length):
-            decoded_element = self.element_type.decode(decoder)
-            decoded.append(decoded_element)
 
-        return decoded
+        return self.element_type.decode_many(decoder, length)
 
     def __repr__(self):
         return '{}({}, {})'.format(self.__class__.__name__,
@@ -556,6 +605,8 @@ class ArrayType(Type):
 
 class Boolean(Type):
 
+    STRUCT = struct.Struct('>B')
+
     def __init__(self, name):
         super(Boolean, self).__init__(name,
                                       'BOOLEAN',
@@ -567,6 +618,12 @@ class Boolean(Type):
     def decode(self, decoder):
         return bool(decoder.read_byte())
 
+    def decode_many(self, decoder, number_of_values):
+        return [
+            bool(value)
+            for value in decoder.read_structs(self.STRUCT, number_of_values)
+        ]
+
 
 class Integer(Type):
 
@@ -577,6 +634,7 @@ class Integer(Type):
         self.has_extension_marker = False
         self.length = None
         self.fmt = None
+        self.struct = None
         self.signed = True
 
     def set_restricted_to_range(self, minimum, maximum, has_extension_marker):
@@ -614,22 +672,31 @@ class Integer(Type):
             self.length = 8
             self.fmt = '>q'
 
+        if self.fmt is not None:
+            self.struct = struct.Struct(self.fmt)
+
     def encode(self, data, encoder):
-        if self.fmt:
-            encoder.append_bytes(struct.pack(self.fmt, data))
+        if self.struct:
+            encoder.append_bytes(self.struct.pack(data))
         elif self.signed:
             encoder.append_integer(data)
         else:
             encoder.append_unsigned_integer(data)
 
     def decode(self, decoder):
-        if self.fmt:
-            return struct.unpack(self.fmt, decoder.read_bytes(self.length))[0]
+        if self.struct:
+            return decoder.read_struct(self.struct)
         elif self.signed:
             return decoder.read_integer()
         else:
             return decoder.read_unsigned_integer()
 
+    def decode_many(self, decoder, number_of_values):
+        if self.struct:
+            return decoder.read_structs(self.struct, number_of_values)
+        else:
+            return super(Integer, self).decode_many(decoder, number_of_values)
+
 
 class Real(Type):
 
@@ -656,6 +723,11 @@ class Real(Type):
                 self.length = None
                 self.fmt = None
 
+        if self.fmt is None:
+            self.struct = None
+        else:
+            self.struct = struct.Struct(self.fmt)
+
     def unpack_with_components(self, with_components):
         with_components = dict(with_components)
 
@@ -687,7 +759,7 @@ class Real(Type):
             encoder.append_bytes(encoded)
         else:
             try:
-                encoder.append_bytes(struct.pack(self.fmt, data))
+                encoder.append_bytes(self.struct.pack(data))
             except (struct.error, OverflowError):
                 raise EncodeError(
                     'Expected an IEEE 754 {} bits floating point number, but '
@@ -698,9 +770,15 @@ class Real(Type):
         if self.fmt is None:
             length = decoder.read_length_determinant()
 
-            return der.decode_real(bytearray(decoder.read_bytes(length)))
+            return der.decode_real(bytearray(decoder.read_view(length)))
         else:
-            return struct.unpack(self.fmt, decoder.read_bytes(self.length))[0]
+            return decoder.read_struct(self.struct)
+
+    def decode_many(self, decoder, number_of_values):
+        if self.struct is None:
+            return super(Real, self).decode_many(decoder, number_of_values)
+        else:
+            return decoder.read_structs(self.struct, number_of_values)
 
 
 class Null(Type):
@@ -810,7 +888,7 @@ class ObjectIdentifier(Type):
 
     def decode(self, decoder):
         length = decoder.read_length_determinant()
-        data = decoder.read_bytes(length)
+        data = decoder.read_view(length)
 
         return decode_object_identifier(bytearray(data), 0, len(data))
 
@@ -854,11 +932,10 @@ class Enumerated(Type):
             encoder.set_bit(offset)
 
     def decode(self, decoder):
-        if decoder.peek_bit():
-            decoder.clear_bit()
-            value = decoder.read_integer()
-        else:
-            value = decoder.read_byte()
+        value = decoder.read_byte()
+
+        if value & 0x80:
+            value = decoder.read_signed_integer(value & 0x7f)
 
         if value in self.value_to_data:
             return self.value_to_data[value]
@@ -1269,7 +1346,7 @@ class CompiledType(compiler.CompiledType):
         return encoder.as_bytearray()
 
     def decode(self, data):
-        decoder = Decoder(bytearray(data))
+        decoder = Decoder(data)
         try:
             return self._type.decode(decoder)
         except ErrorWithLocation as e:
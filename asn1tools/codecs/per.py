@@ -4,9 +4,9 @@
 
 from operator import attrgetter
 from operator import itemgetter
-import binascii
 import string
 import datetime
+import struct
 
 from ..parser import EXTENSION_MARKER
 from . import BaseType, format_bytes, ErrorWithLocation
@@ -54,17 +54,6 @@ def to_int(chars):
     return num
 
 
-def to_byte_array(num, number_of_bits):
-    byte_array = bytearray()
-
-    while number_of_bits > 0:
-        byte_array.insert(0, (num & 0xff))
-        num >>= 8
-        number_of_bits -= 8
-
-    return byte_array
-
-
 def integer_as_number_of_bits(size):
     """Returns the minimum number of bits needed to fit given positive
     integer.
@@ -95,6 +84,51 @@ def integer_as_number_of_bits_power_of_two(size):
         return bit_length_pow_2
 
 
+def paths_as_tree(paths):
+    """Returns given dotted paths as a tree of dictionaries, with None as
+    leaves.
+
+    """
+
+    tree = {}
+
+    for path in paths:
+        names = path.split('.')
+        node = tree
+
+        for name in names[:-1]:
+            if name in node and node[name] is None:
+                break
+
+            node = node.setdefault(name, {})
+        else:
+            node[names[-1]] = None
+
+    return tree
+
+
+def extract_member(member, decoder, tree, prefix, extracted):
+    """Decode given member if it is a leaf in given tree, extract from it
+    if it is a node, or skip it otherwise.
+
+    """
+
+    try:
+        if member.name not in tree:
+            member.skip(decoder)
+        elif tree[member.name] is None:
+            extracted[prefix + member.name] = member.decode(decoder)
+        else:
+            member.extract(decoder,
+                           tree[member.name],
+                           prefix + member.name + '.',
+                           extracted)
+    except ErrorWithLocation as e:
+        # Add member location
+        e.add_location(member)
+        raise e
+
+
 def size_as_number_of_bytes(size):
     """Returns the minimum number of bytes needed to fit given positive
     integer.
@@ -113,6 +147,13 @@ def size_as_number_of_bytes(size):
         return number_of_bits // 8
 
 
+def add_minimum(values, minimum):
+    if minimum == 0:
+        return values
+
+    return [value + minimum for value in values]
+
+
 CLASS_PRIO = {
     'UNIVERSAL': 0,
     'APPLICATION': 1,
@@ -120,12 +161,22 @@ CLASS_PRIO = {
     'PRIVATE': 3
 }
 
+# Struct format characters of unsigned integers of given number of
+# bits.
+STRUCT_FORMATS = {
+    8: 'B',
+    16: 'H',
+    32: 'I',
+    64: 'Q'
+}
+
 
 class PermittedAlphabet(object):
 
     def __init__(self, encode_map, decode_map):
         self.encode_map = encode_map
         self.decode_map = decode_map
+        self._tables = {}
 
     def __len__(self):
         return len(self.encode_map)
@@ -148,66 +199,132 @@ class PermittedAlphabet(object):
                 "Expected a value in {}, but got {:d}.".format(
                     list(self.decode_map), value))
 
+    def get_tables(self, bits_per_character):
+        """Returns the permitted characters, the encode table and the
+        decode table of given number of bits per character, or None if
+        more than 8 bits are used per character. They are created on
+        first use.
+
+        The encode table maps characters to their values as strings of
+        binary digits, for str.translate(). The decode table is
+        indexed by value, with None for values not in the alphabet.
+        Surrogates are left out, as they are not characters.
+
+        """
+
+        if bits_per_character > 8:
+            return None
+
+        try:
+            return self._tables[bits_per_character]
+        except KeyError:
+            pass
+
+        code_points = [
+            character
+            for character in self.encode_map
+            if not 0xd800 <= character <= 0xdfff
+        ]
+
+        if bits_per_character == 0:
+            encode_table = dict.fromkeys(code_points, '')
+        else:
+            digits_format = '0{}b'.format(bits_per_character)
+            encode_table = {
+                character: format(self.encode_map[character], digits_format)
+                for character in code_points
+            }
+
+        decode_table = (1 << bits_per_character) * [None]
+
+        for character in code_points:
+            decode_table[self.encode_map[character]] = chr(character)
+
+        tables = (frozenset([chr(character) for character in code_points]),
+                  encode_table,
+                  decode_table)
+        self._tables[bits_per_character] = tables
+
+        return tables
+
 
 class Encoder(object):
+    """Bit writer packing encoded bits into a growable bytearray. Bits
+    are collected in a small integer cache and flushed to the buffer
+    as whole bytes.
+
+    """
 
     def __init__(self):
-        self.number_of_bits = 0
-        self.value = 0
-        self.chunks_number_of_bits = 0
-        self.chunks = []
+        self.buf = bytearray()
+        self.cache = 0
+        self.cache_bits = 0
 
     def __iadd__(self, other):
-        for value, number_of_bits in other.chunks:
-            self.append_non_negative_binary_integer(value, number_of_bits)
-
-        self.append_non_negative_binary_integer(other.value,
-                                                other.number_of_bits)
+        self.append_bits(other.buf, 8 * len(other.buf))
+        self.append_non_negative_binary_integer(other.cache,
+                                                other.cache_bits)
 
         return self
 
+    @property
+    def number_of_bits(self):
+        return 8 * len(self.buf) + self.cache_bits
+
     def reset(self):
-        self.number_of_bits = 0
-        self.value = 0
-        self.chunks_number_of_bits = 0
-        self.chunks = []
+        del self.buf[:]
+        self.cache = 0
+        self.cache_bits = 0
 
     def are_all_bits_zero(self):
-        return not (any([value for value, _ in self.chunks]) or self.value)
+        return not (any(self.buf) or self.cache)
 
     def number_of_bytes(self):
-        return (self.chunks_number_of_bits + self.number_of_bits + 7) // 8
+        return (self.number_of_bits + 7) // 8
 
     def offset(self):
-        return (len(self.chunks), self.number_of_bits)
+        return self.number_of_bits
 
     def set_bit(self, offset):
-        chunk_offset, bit_offset = offset
+        buf_number_of_bits = 8 * len(self.buf)
 
-        if len(self.chunks) == chunk_offset:
-            self.value |= (1 << (self.number_of_bits - bit_offset - 1))
+        if offset < buf_number_of_bits:
+            self.buf[offset >> 3] |= (0x80 >> (offset & 0x7))
         else:
-            chunk = self.chunks[chunk_offset]
-            chunk[0] |= (1 << (chunk[1] - bit_offset - 1))
+            offset -= buf_number_of_bits
+            self.cache |= (1 << (self.cache_bits - offset - 1))
+
+    def flush(self):
+        """Move all complete bytes in the bit cache to the buffer.
+
+        """
+
+        number_of_rest_bits = (self.cache_bits & 0x7)
+        number_of_bytes = (self.cache_bits >> 3)
+        self.buf += (self.cache >> number_of_rest_bits).to_bytes(number_of_bytes,
+                                                                 'big')
+        self.cache &= ((1 << number_of_rest_bits) - 1)
+        self.cache_bits = number_of_rest_bits
 
     def align(self):
         self.align_always()
 
     def align_always(self):
-        width = 8 * self.number_of_bytes()
-        width -= self.chunks_number_of_bits
-        width -= self.number_of_bits
-        self.number_of_bits += width
-        self.value <<= width
+        width = (-self.cache_bits & 0x7)
+        self.cache <<= width
+        self.cache_bits += width
 
     def append_bit(self, bit):
         """Append given bit.
 
         """
 
-        self.number_of_bits += 1
-        self.value <<= 1
-        self.value |= bit
+        self.cache <<= 1
+        self.cache |= bit
+        self.cache_bits += 1
+
+        if self.cache_bits >= 64:
+            self.flush()
 
     def append_bits(self, data, number_of_bits):
         """Append given bits.
@@ -217,25 +334,39 @@ class Encoder(object):
         if number_of_bits == 0:
             return
 
-        value = int(binascii.hexlify(data), 16)
-        value >>= (8 * len(data) - number_of_bits)
+        number_of_bytes, number_of_rest_bits = divmod(number_of_bits, 8)
 
-        self.append_non_negative_binary_integer(value, number_of_bits)
+        if (self.cache_bits & 0x7) == 0:
+            # Byte aligned, copy the whole bytes straight into the
+            # buffer.
+            if self.cache_bits > 0:
+                self.flush()
+
+            if len(data) == number_of_bytes:
+                self.buf += data
+            else:
+                self.buf += data[:number_of_bytes]
+
+            if number_of_rest_bits > 0:
+                self.cache = (data[number_of_bytes] >> (8 - number_of_rest_bits))
+                self.cache_bits = number_of_rest_bits
+        else:
+            number_of_bytes = ((number_of_bits + 7) // 8)
+            value = int.from_bytes(data[:number_of_bytes], 'big')
+            value >>= (8 * number_of_bytes - number_of_bits)
+            self.append_non_negative_binary_integer(value, number_of_bits)
 
     def append_non_negative_binary_integer(self, value, number_of_bits):
         """Append given integer value.
 
         """
 
-        if self.number_of_bits > 4096:
-            self.chunks.append([self.value, self.number_of_bits])
-            self.chunks_number_of_bits += self.number_of_bits
-            self.number_of_bits = 0
-            self.value = 0
+        self.cache <<= number_of_bits
+        self.cache |= value
+        self.cache_bits += number_of_bits
 
-        self.number_of_bits += number_of_bits
-        self.value <<= number_of_bits
-        self.value |= value
+        if self.cache_bits >= 64:
+            self.flush()
 
     def append_bytes(self, data):
         """Append given data.
@@ -249,31 +380,13 @@ class Encoder(object):
 
         """
 
-        value = 0
-        number_of_bits = 0
-
-        for chunk_value, chunk_number_of_bits in self.chunks:
-            value <<= chunk_number_of_bits
-            value |= chunk_value
-            number_of_bits += chunk_number_of_bits
-
-        value <<= self.number_of_bits
-        value |= self.value
-        number_of_bits += self.number_of_bits
-
-        if number_of_bits == 0:
-            return bytearray()
-
-        number_of_alignment_bits = (8 - (number_of_bits % 8))
-
-        if number_of_alignment_bits != 8:
-            value <<= number_of_alignment_bits
-            number_of_bits += number_of_alignment_bits
-
-        value |= (0x80 << number_of_bits)
-        value = hex(value)[4:].rstrip('L')
+        encoded = bytearray(self.buf)
+        number_of_alignment_bits = (-self.cache_bits & 0x7)
+        encoded += (self.cache << number_of_alignment_bits).to_bytes(
+            (self.cache_bits + number_of_alignment_bits) >> 3,
+            'big')
 
-        return bytearray(binascii.unhexlify(value))
+        return encoded
 
     def append_length_determinant(self, length):
         if length < 128:
@@ -377,18 +490,17 @@ class Encoder(object):
 
 
 class Decoder(object):
+    """Bit reader reading straight from the encoded bytes. The bit
+    offset is mapped to a byte index and the requested bits are
+    extracted with shifts and masks.
+
+    """
 
     def __init__(self, encoded):
+        self.buf = memoryview(encoded)
         self.number_of_bits = (8 * len(encoded))
         self.total_number_of_bits = self.number_of_bits
 
-        if len(encoded) > 0:
-            value = int(binascii.hexlify(encoded), 16)
-            value |= (0x80 << self.number_of_bits)
-            self.value = bin(value)[10:]
-        else:
-            self.value = ''
-
     def align(self):
         self.align_always()
 
@@ -413,10 +525,10 @@ class Decoder(object):
         if self.number_of_bits == 0:
             raise OutOfDataError(self.number_of_read_bits())
 
-        bit = int(self.value[self.number_of_read_bits()])
+        offset = (self.total_number_of_bits - self.number_of_bits)
         self.number_of_bits -= 1
 
-        return bit
+        return (self.buf[offset >> 3] >> (7 - (offset & 0x7))) & 1
 
     def read_bits(self, number_of_bits):
         """Read given number of bits.
@@ -426,16 +538,23 @@ class Decoder(object):
         if number_of_bits > self.number_of_bits:
             raise OutOfDataError(self.number_of_read_bits())
 
-        offset = self.number_of_read_bits()
-        value = self.value[offset:offset + number_of_bits]
+        offset = (self.total_number_of_bits - self.number_of_bits)
         self.number_of_bits -= number_of_bits
-        value = '10000000' + value
-        number_of_alignment_bits = (8 - (number_of_bits % 8))
+        number_of_bytes = ((number_of_bits + 7) // 8)
+        number_of_alignment_bits = (8 * number_of_bytes - number_of_bits)
+
+        if (offset & 0x7) == 0 and number_of_alignment_bits == 0:
+            offset >>= 3
+
+            return bytes(self.buf[offset:offset + number_of_bytes])
 
-        if number_of_alignment_bits != 8:
-            value += '0' * number_of_alignment_bits
+        end = (offset + number_of_bits)
+        value = int.from_bytes(self.buf[offset >> 3:(end + 7) >> 3], 'big')
+        value >>= (-end & 0x7)
+        value &= ((1 << number_of_bits) - 1)
 
-        return binascii.unhexlify(hex(int(value, 2))[4:].rstrip('L'))
+        return (value << number_of_alignment_bits).to_bytes(number_of_bytes,
+                                                            'big')
 
     def read_bytes(self, number_of_bytes):
         return self.read_bits(8 * number_of_bytes)
@@ -451,11 +570,63 @@ class Decoder(object):
         if number_of_bits == 0:
             return 0
 
-        offset = self.number_of_read_bits()
-        value = self.value[offset:offset + number_of_bits]
+        offset = (self.total_number_of_bits - self.number_of_bits)
         self.number_of_bits -= number_of_bits
+        end = (offset + number_of_bits)
+        first = (offset >> 3)
+        last = ((end - 1) >> 3)
+
+        # Short reads spanning at most two bytes are common, so avoid
+        # slicing for them.
+        if first == last:
+            value = self.buf[first]
+        elif first + 1 == last:
+            value = ((self.buf[first] << 8) | self.buf[last])
+        else:
+            value = int.from_bytes(self.buf[first:last + 1], 'big')
+
+        value >>= (-end & 0x7)
+
+        return value & ((1 << number_of_bits) - 1)
+
+    def read_non_negative_binary_integers(self, number_of_bits, number_of_values):
+        """Read given number of consecutive integer values of given number
+        of bits each.
+
+        """
+
+        total_number_of_bits = (number_of_bits * number_of_values)
+
+        if total_number_of_bits > self.number_of_bits:
+            # Fail at the first value that does not fit.
+            self.number_of_bits %= number_of_bits
 
-        return int(value, 2)
+            raise OutOfDataError(self.number_of_read_bits())
+
+        if total_number_of_bits == 0:
+            return number_of_values * [0]
+
+        offset = (self.total_number_of_bits - self.number_of_bits)
+        self.number_of_bits -= total_number_of_bits
+
+        if (offset & 0x7) == 0 and number_of_bits in STRUCT_FORMATS:
+            return list(struct.unpack_from(
+                '>{}{}'.format(number_of_values, STRUCT_FORMATS[number_of_bits]),
+                self.buf,
+                offset >> 3))
+
+        # Convert all values to a single string of binary digits,
+        # which is linear in the number of values, and then split it.
+        end = (offset + total_number_of_bits)
+        value = int.from_bytes(self.buf[offset >> 3:(end + 7) >> 3], 'big')
+        value >>= (-end & 0x7)
+        value &= ((1 << total_number_of_bits) - 1)
+        digits = format(value, '0{}b'.format(total_number_of_bits))
+
+        return [
+            int(digits[i:i + number_of_bits], 2)
+            for i in range(0, total_number_of_bits, number_of_bits)
+        ]
 
     def read_length_determinant(self):
         value = self.read_non_negative_binary_integer(8)
@@ -551,12 +722,39 @@ class Type(BaseType):
     def set_restricted_to_range(self, minimum, maximum, has_extension_marker):
         pass
 
+    def encode_checked(self, data, encoder, checker):
+        """Check the types of given data with given type checker and encode
+        it. Types with members check and encode each member in turn
+        instead.
+
+        """
+
+        checker.encode(data)
+        self.encode(data, encoder)
+
+    def skip(self, decoder):
+        self.decode(decoder)
+
+    def decode_many(self, decoder, number_of_values):
+        """Decode given number of consecutive values of this type.
+
+        """
+
+        return [self.decode(decoder) for _ in range(number_of_values)]
+
+    def extract(self, decoder, tree, prefix, extracted):
+        self.skip(decoder)
+
 
 class KnownMultiplierStringType(Type):
 
     ENCODING = 'ascii'
     PERMITTED_ALPHABET = PermittedAlphabet({}, {})
 
+    # Encoding of characters as their values, used if the permitted
+    # alphabet is not constrained.
+    VALUES_ENCODING = None
+
     def __init__(self,
                  name,
                  minimum=None,
@@ -610,22 +808,96 @@ class KnownMultiplierStringType(Type):
         elif self.maximum * self.bits_per_character > 16:
             encoder.align()
 
+        self.encode_characters(data, encoder)
+
+    def encode_unbound(self, data, encoder):
+        encoder.align()
+
+        for offset, length in encoder.append_length_determinant_chunks(len(data)):
+            self.encode_characters(data[offset:offset + length], encoder)
+
+    def encode_characters(self, data, encoder):
+        """Encode all characters in given string at once, using the
+        values encoding or the translation tables of the permitted
+        alphabet.
+
+        """
+
+        if (self.VALUES_ENCODING is not None
+            and self.permitted_alphabet is self.PERMITTED_ALPHABET):
+            try:
+                encoded = data.encode(self.VALUES_ENCODING)
+            except UnicodeEncodeError:
+                encoded = b''
+
+            if 8 * len(encoded) == self.bits_per_character * len(data):
+                encoder.append_bytes(encoded)
+
+                return
+        else:
+            tables = self.permitted_alphabet.get_tables(self.bits_per_character)
+
+            if tables is not None and tables[0].issuperset(data):
+                digits = data.translate(tables[1])
+
+                if digits:
+                    encoder.append_non_negative_binary_integer(int(digits, 2),
+                                                               len(digits))
+
+                return
+
+        # Encode one character at a time, which also raises the same
+        # errors as always.
         for value in data:
             encoder.append_non_negative_binary_integer(
                 self.permitted_alphabet.encode(
                     to_int(value.encode(self.ENCODING))),
                 self.bits_per_character)
 
-    def encode_unbound(self, data, encoder):
-        encoder.align()
+    def decode_characters(self, decoder, length):
+        """Decode given number of characters at once, using the values
+        encoding or the translation tables of the permitted alphabet.
 
-        for offset, length in encoder.append_length_determinant_chunks(len(data)):
-            for entry in data[offset:offset + length]:
-                encoder.append_non_negative_binary_integer(
-                    self.permitted_alphabet.encode(
-                        to_int(entry.encode(self.ENCODING))),
+        """
+
+        number_of_bits = (self.bits_per_character * length)
+
+        if number_of_bits <= decoder.number_of_bits:
+            if (self.VALUES_ENCODING is not None
+                and self.permitted_alphabet is self.PERMITTED_ALPHABET):
+                try:
+                    return decoder.read_bits(number_of_bits).decode(
+                        self.VALUES_ENCODING)
+                except UnicodeDecodeError:
+                    decoder.number_of_bits += number_of_bits
+            else:
+                tables = self.permitted_alphabet.get_tables(
                     self.bits_per_character)
 
+                if tables is not None:
+                    values = decoder.read_non_negative_binary_integers(
+                        self.bits_per_character,
+                        length)
+
+                    try:
+                        return ''.join(map(tables[2].__getitem__, values))
+                    except TypeError:
+                        decoder.number_of_bits += number_of_bits
+
+        # Decode one character at a time, which also raises the same
+        # errors as always.
+        decoded = ''.join([
+            chr(self.permitted_alphabet.decode(
+                decoder.read_non_negative_binary_integer(
+                    self.bits_per_character)))
+            for _ in range(length)
+        ])
+
+        # Surrogates are not characters.
+        decoded.encode(self.ENCODING, 'surrogatepass').decode(self.ENCODING)
+
+        return decoded
+
     def decode(self, decoder):
         if self.has_extension_marker:
             bit = decoder.read_bit()
@@ -650,29 +922,15 @@ class KnownMultiplierStringType(Type):
             else:
                 length = self.minimum
 
-        data = bytearray()
-
-        for _ in range(length):
-            value = decoder.read_non_negative_binary_integer(self.bits_per_character)
-            value = self.permitted_alphabet.decode(value)
-            data += to_byte_array(value, self.bits_per_character)
-
-        return data.decode(self.ENCODING)
+        return self.decode_characters(decoder, length)
 
     def decode_unbound(self, decoder):
         decoder.align()
-        decoded = bytearray()
-        orig_bits_per_character = integer_as_number_of_bits_power_of_two(
-            len(self.ALPHABET) - 1)
 
-        for length in decoder.read_length_determinant_chunks():
-            for _ in range(length):
-                value = decoder.read_non_negative_binary_integer(
-                    self.bits_per_character)
-                value = self.permitted_alphabet.decode(value)
-                decoded += to_byte_array(value, orig_bits_per_character)
-
-        return decoded.decode(self.ENCODING)
+        return ''.join([
+            self.decode_characters(decoder, length)
+            for length in decoder.read_length_determinant_chunks()
+        ])
 
 
 class StringType(Type):
@@ -730,7 +988,53 @@ class MembersType(Type):
         else:
             self.encode_root(data, encoder)
 
+    def encode_checked(self, data, encoder, checker):
+        checker.encode_type(data)
+
+        if self.additions is not None:
+            offset = encoder.offset()
+            encoder.append_bit(0)
+            self.encode_root_checked(data, encoder, checker)
+
+            if len(self.additions) > 0:
+                # Errors are ignored when encoding additions, so check
+                # them first.
+                self.check_additions(data, checker)
+
+                if self.encode_additions(data, encoder):
+                    encoder.set_bit(offset)
+        else:
+            self.encode_root_checked(data, encoder, checker)
+
     def encode_root(self, data, encoder):
+        self.encode_presence_bits(data, encoder)
+
+        for member in self.root_members:
+            self.encode_member(member, data, encoder)
+
+    def encode_root_checked(self, data, encoder, checker):
+        # Members with default values are checked before compared to
+        # their default values.
+        for optional in self.optionals:
+            if optional.default is not None:
+                self.check_member(optional, data, checker)
+
+        self.encode_presence_bits(data, encoder)
+
+        for member in self.root_members:
+            if member.default is None and member.name in data:
+                try:
+                    member.encode_checked(data[member.name],
+                                          encoder,
+                                          checker.name_to_member[member.name])
+                except ErrorWithLocation as e:
+                    # Add member location
+                    e.add_location(member)
+                    raise e
+            else:
+                self.encode_member(member, data, encoder)
+
+    def encode_presence_bits(self, data, encoder):
         for optional in self.optionals:
             if optional.optional:
                 encoder.append_bit(optional.name in data)
@@ -739,9 +1043,6 @@ class MembersType(Type):
             else:
                 encoder.append_bit(0)
 
-        for member in self.root_members:
-            self.encode_member(member, data, encoder)
-
     def encode_additions(self, data, encoder):
         # Encode extension additions.
         presence_bits = 0
@@ -819,6 +1120,25 @@ class MembersType(Type):
                     name,
                     data))
 
+    def check_additions(self, data, checker):
+        for addition in self.additions:
+            if isinstance(addition, AdditionGroup):
+                for member in addition.root_members:
+                    self.check_member(member, data, checker)
+            else:
+                self.check_member(addition, data, checker)
+
+    def check_member(self, member, data, checker):
+        name = member.name
+
+        if name in data:
+            try:
+                checker.name_to_member[name].encode(data[name])
+            except ErrorWithLocation as e:
+                # Add member location
+                e.add_location(member)
+                raise e
+
     def decode(self, decoder):
         if self.additions is not None:
             if decoder.read_bit():
@@ -887,6 +1207,93 @@ class MembersType(Type):
 
         return decoded
 
+    def skip(self, decoder):
+        if self.additions is not None:
+            extended = decoder.read_bit()
+        else:
+            extended = False
+
+        optionals = {
+            optional: decoder.read_bit()
+            for optional in self.optionals
+        }
+
+        for member in self.root_members:
+            if optionals.get(member, True):
+                member.skip(decoder)
+
+        if extended:
+            # Presence bit field.
+            length = decoder.read_normally_small_length()
+            presence_bits = decoder.read_non_negative_binary_integer(length)
+            decoder.align()
+
+            for i in range(length):
+                if presence_bits & (1 << (length - i - 1)):
+                    decoder.skip_bits(8 * decoder.read_length_determinant())
+
+    def extract(self, decoder, tree, prefix, extracted):
+        if self.additions is not None:
+            extended = decoder.read_bit()
+        else:
+            extended = False
+
+        optionals = {
+            optional: decoder.read_bit()
+            for optional in self.optionals
+        }
+
+        for member in self.root_members:
+            if optionals.get(member, True):
+                extract_member(member, decoder, tree, prefix, extracted)
+            elif member.has_default() and tree.get(member.name, {}) is None:
+                extracted[prefix + member.name] = member.default
+
+        if extended:
+            self.extract_additions(decoder, tree, prefix, extracted)
+
+    def extract_additions(self, decoder, tree, prefix, extracted):
+        # Presence bit field.
+        length = decoder.read_normally_small_length()
+        presence_bits = decoder.read_non_negative_binary_integer(length)
+        decoder.align()
+
+        for i in range(length):
+            if presence_bits & (1 << (length - i - 1)):
+                # Open type decoding.
+                open_type_length = decoder.read_length_determinant()
+
+                if i < len(self.additions):
+                    addition = self.additions[i]
+
+                    if isinstance(addition, AdditionGroup):
+                        members = addition.root_members
+                    else:
+                        members = [addition]
+                else:
+                    members = []
+
+                if not any(member.name in tree for member in members):
+                    decoder.skip_bits(8 * open_type_length)
+                    continue
+
+                offset = decoder.number_of_bits
+
+                if isinstance(addition, AdditionGroup):
+                    try:
+                        addition.extract(decoder, tree, prefix, extracted)
+                    except ErrorWithLocation as e:
+                        # Add member location
+                        e.add_location(addition)
+                        raise e
+                else:
+                    extract_member(addition, decoder, tree, prefix, extracted)
+
+                alignment_bits = (offset - decoder.number_of_bits) % 8
+
+                if alignment_bits != 0:
+                    decoder.skip_bits(8 - alignment_bits)
+
     def __repr__(self):
         return '{}({}, [{}])'.format(
             self.__class__.__name__,
@@ -916,6 +1323,19 @@ class ArrayType(Type):
             self.number_of_bits = integer_as_number_of_bits(size)
 
     def encode(self, data, encoder):
+        self.encode_elements(data, encoder, self.element_type.encode)
+
+    def encode_checked(self, data, encoder, checker):
+        checker.encode_type(data)
+        element_type = self.element_type
+        element_checker = checker.element_type
+
+        def encode_element(entry, encoder):
+            element_type.encode_checked(entry, encoder, element_checker)
+
+        self.encode_elements(data, encoder, encode_element)
+
+    def encode_elements(self, data, encoder, encode_element):
         if self.has_extension_marker:
             if self.minimum <= len(data) <= self.maximum:
                 encoder.append_bit(0)
@@ -925,12 +1345,12 @@ class ArrayType(Type):
                 encoder.append_length_determinant(len(data))
 
                 for entry in data:
-                    self.element_type.encode(entry, encoder)
+                    encode_element(entry, encoder)
 
                 return
 
         if self.number_of_bits is None:
-            return self.encode_unbound(data, encoder)
+            return self.encode_unbound(data, encoder, encode_element)
         elif self.minimum != self.maximum:
             encoder.append_constrained_whole_number(len(data),
                                                     self.minimum,
@@ -938,16 +1358,28 @@ class ArrayType(Type):
                                                     self.number_of_bits)
 
         for entry in data:
-            self.element_type.encode(entry, encoder)
+            encode_element(entry, encoder)
 
-    def encode_unbound(self, data, encoder):
+    def encode_unbound(self, data, encoder, encode_element):
         encoder.align()
 
         for offset, length in encoder.append_length_determinant_chunks(len(data)):
             for entry in data[offset:offset + length]:
-                self.element_type.encode(entry, encoder)
+                encode_element(entry, encoder)
 
     def decode(self, decoder):
+        return self.decode_elements(decoder, self.element_type.decode_many)
+
+    def skip(self, decoder):
+        self.decode_elements(decoder, self.skip_elements)
+
+    def skip_elements(self, decoder, number_of_elements):
+        for _ in range(number_of_elements):
+            self.element_type.skip(decoder)
+
+        return []
+
+    def decode_elements(self, decoder, decode_elements):
         length = None
 
         if self.has_extension_marker:
@@ -960,7 +1392,7 @@ class ArrayType(Type):
         if length is not None:
             pass
         elif self.number_of_bits is None:
-            return self.decode_unbound(decoder)
+            return self.decode_unbound(decoder, decode_elements)
         elif self.minimum != self.maximum:
             length = decoder.read_constrained_whole_number(self.minimum,
                                                            self.maximum,
@@ -968,22 +1400,14 @@ class ArrayType(Type):
         else:
             length = self.minimum
 
-        decoded = []
+        return decode_elements(decoder, length)
 
-        for _ in range(length):
-            decoded_element = self.element_type.decode(decoder)
-            decoded.append(decoded_element)
-
-        return decoded
-
-    def decode_unbound(self, decoder):
+    def decode_unbound(self, decoder, decode_elements):
         decoder.align()
         decoded = []
 
         for length in decoder.read_length_determinant_chunks():
-            for _ in range(length):
-                decoded_element = self.element_type.decode(decoder)
-                decoded.append(decoded_element)
+            decoded += decode_elements(decoder, length)
 
         return decoded
 
@@ -1004,6 +1428,16 @@ class Boolean(Type):
     def decode(self, decoder):
         return bool(decoder.read_bit())
 
+    def decode_many(self, decoder, number_of_values):
+        return [
+            value == 1
+            for value in decoder.read_non_negative_binary_integers(1,
+                                                                   number_of_values)
+        ]
+
+    def skip(self, decoder):
+        decoder.skip_bits(1)
+
 
 class Integer(Type):
 
@@ -1090,6 +1524,28 @@ class Integer(Type):
                                                          self.maximum,
                                                          number_of_bits)
 
+    def decode_many(self, decoder, number_of_values):
+        if (self.has_extension_marker
+            or self.number_of_bits is None
+            or self.number_of_indefinite_bits is not None
+            or number_of_values == 0):
+            return super(Integer, self).decode_many(decoder, number_of_values)
+
+        # All values have the same width, and are all aligned if the
+        # first one is.
+        _range = (self.maximum - self.minimum + 1)
+
+        if _range <= 255:
+            number_of_bits = self.number_of_bits
+        else:
+            decoder.align_always()
+            number_of_bits = (8 if _range == 256 else 16)
+
+        return add_minimum(
+            decoder.read_non_negative_binary_integers(number_of_bits,
+                                                      number_of_values),
+            self.minimum)
+
 
 class Real(Type):
 
@@ -1120,6 +1576,9 @@ class Null(Type):
     def decode(self, _):
         return None
 
+    def skip(self, _):
+        pass
+
 
 class BitString(Type):
 
@@ -1430,6 +1889,15 @@ class Enumerated(Type):
                 else:
                     return None
 
+    def skip(self, decoder):
+        if self.additions_index_to_data is not None:
+            if decoder.read_bit():
+                decoder.read_normally_small_non_negative_whole_number()
+
+                return
+
+        decoder.skip_bits(self.root_number_of_bits)
+
     def decode_root(self, decoder):
         index = decoder.read_non_negative_binary_integer(self.root_number_of_bits)
 
@@ -1561,7 +2029,20 @@ class Choice(Type):
         else:
             self.encode_root(data, encoder)
 
-    def encode_root(self, data, encoder):
+    def encode_checked(self, data, encoder, checker):
+        member_checker = checker.encode_type(data)
+
+        if self.additions_index_to_member is not None:
+            if data[0] in self.root_name_to_index:
+                encoder.append_bit(0)
+                self.encode_root(data, encoder, member_checker)
+            else:
+                encoder.append_bit(1)
+                self.encode_additions(data, encoder, member_checker)
+        else:
+            self.encode_root(data, encoder, member_checker)
+
+    def encode_root(self, data, encoder, member_checker=None):
         try:
             index = self.root_name_to_index[data[0]]
         except KeyError:
@@ -1575,7 +2056,10 @@ class Choice(Type):
 
         member = self.root_index_to_member[index]
         try:
-            member.encode(data[1], encoder)
+            if member_checker is None:
+                member.encode(data[1], encoder)
+            else:
+                member.encode_checked(data[1], encoder, member_checker)
         except ErrorWithLocation as e:
             # Add member location
             e.add_location(member)
@@ -1599,7 +2083,7 @@ class Choice(Type):
                                                 self.maximum,
                                                 number_of_bits)
 
-    def encode_additions(self, data, encoder):
+    def encode_additions(self, data, encoder, member_checker=None):
         try:
             index = self.additions_name_to_index[data[0]]
         except KeyError:
@@ -1611,7 +2095,12 @@ class Choice(Type):
         addition_encoder = encoder.__class__()
         addition = self.additions_index_to_member[index]
         try:
-            addition.encode(data[1], addition_encoder)
+            if member_checker is None:
+                addition.encode(data[1], addition_encoder)
+            else:
+                addition.encode_checked(data[1],
+                                        addition_encoder,
+                                        member_checker)
         except ErrorWithLocation as e:
             # Add member location
             e.add_location(addition)
@@ -1635,23 +2124,27 @@ class Choice(Type):
             return self.decode_root(decoder)
 
     def decode_root(self, decoder):
+        member = self.decode_root_member(decoder)
+
+        try:
+            return (member.name, member.decode(decoder))
+        except ErrorWithLocation as e:
+            # Add member location
+            e.add_location(member)
+            raise e
+
+    def decode_root_member(self, decoder):
         if len(self.root_index_to_member) > 1:
             index = self.decode_root_index(decoder)
         else:
             index = 0
 
         try:
-            member = self.root_index_to_member[index]
+            return self.root_index_to_member[index]
         except KeyError:
             raise DecodeError(
                 'Expected choice index {}, but got {}.'.format(
                     self.format_root_indexes(), index))
-        try:
-            return (member.name, member.decode(decoder))
-        except ErrorWithLocation as e:
-            # Add member location
-            e.add_location(member)
-            raise e
 
     def decode_root_index(self, decoder):
         if self.number_of_indefinite_bits is None:
@@ -1699,6 +2192,45 @@ class Choice(Type):
 
         return (name, decoded)
 
+    def skip(self, decoder):
+        if self.additions_index_to_member is not None:
+            if decoder.read_bit():
+                decoder.read_normally_small_non_negative_whole_number()
+                decoder.align()
+                decoder.skip_bits(8 * decoder.read_length_determinant())
+
+                return
+
+        self.decode_root_member(decoder).skip(decoder)
+
+    def extract(self, decoder, tree, prefix, extracted):
+        if self.additions_index_to_member is not None:
+            if decoder.read_bit():
+                self.extract_additions(decoder, tree, prefix, extracted)
+
+                return
+
+        extract_member(self.decode_root_member(decoder),
+                       decoder,
+                       tree,
+                       prefix,
+                       extracted)
+
+    def extract_additions(self, decoder, tree, prefix, extracted):
+        index = decoder.read_normally_small_non_negative_whole_number()
+        addition = self.additions_index_to_member.get(index)
+
+        # Open type decoding.
+        decoder.align()
+        length = 8 * decoder.read_length_determinant()
+
+        if addition is not None and addition.name in tree:
+            offset = decoder.number_of_bits
+            extract_member(addition, decoder, tree, prefix, extracted)
+            length -= (offset - decoder.number_of_bits)
+
+        decoder.skip_bits(length)
+
     def __repr__(self):
         return 'Choice({}, [{}])'.format(
             self.name,
@@ -1761,6 +2293,7 @@ class BMPString(KnownMultiplierStringType):
     ENCODE_DECODE_MAP = {ord(v): ord(v) for v in ALPHABET}
     PERMITTED_ALPHABET = PermittedAlphabet(ENCODE_DECODE_MAP,
                                            ENCODE_DECODE_MAP)
+    VALUES_ENCODING = 'utf-16-be'
 
 
 class VisibleString(KnownMultiplierStringType):
@@ -1975,6 +2508,12 @@ class Recursive(compiler.Recursive, Type):
     def decode(self, decoder):
         return self._inner.decode(decoder)
 
+    def skip(self, decoder):
+        self._inner.skip(decoder)
+
+    def extract(self, decoder, tree, prefix, extracted):
+        self._inner.extract(decoder, tree, prefix, extracted)
+
 
 class AdditionGroup(Sequence):
     pass
@@ -1982,10 +2521,47 @@ class AdditionGroup(Sequence):
 
 class CompiledType(compiler.CompiledType):
 
-    def encode(self, data):
-        encoder = Encoder()
+    ENCODER = Encoder
+    DECODER = Decoder
+
+    def __init__(self, type_):
+        super(CompiledType, self).__init__(type_)
+        self._specializer = None
+        self._specialized = None
+        self._specialized_checked = None
+
+    def set_specializer(self, specializer):
+        """Encode and decode using functions generated by given
+        specializer.
+
+        """
+
+        self._specializer = specializer
+        self._specialized = None
+        self._specialized_checked = None
+
+    def specialized(self):
+        if self._specialized is None:
+            self._specialized = self._specializer.specialize(self._type)
+
+        return self._specialized
+
+    def specialized_checked(self):
+        if self._specialized_checked is None:
+            self._specialized_checked = self._specializer.specialize_checked(
+                self._type,
+                self.type_checker.type)
+
+        return self._specialized_checked
+
+    def check_types_and_encode(self, data):
+        encoder = self.ENCODER()
+
         try:
-            self._type.encode(data, encoder)
+            if self._specializer is not None:
+                self.specialized_checked()(data, encoder)
+            else:
+                self._type.encode_checked(data, encoder, self.type_checker.type)
         except ErrorWithLocation as e:
             # Add member location
             e.add_location(self._type)
@@ -1993,15 +2569,85 @@ class CompiledType(compiler.CompiledType):
 
         return encoder.as_bytearray()
 
+    def encode(self, data):
+        encoder = self.ENCODER()
+        self._encode(data, encoder)
+
+        return encoder.as_bytearray()
+
     def decode(self, data):
-        decoder = Decoder(bytearray(data))
+        decoder = self.DECODER(data)
+
         try:
+            if self._specializer is not None:
+                return self.specialized()[1](decoder)
+
             return self._type.decode(decoder)
         except ErrorWithLocation as e:
             # Add member location
             e.add_location(self._type)
             raise e
 
+    def extract(self, data, paths):
+        decoder = self.DECODER(data)
+        extracted = {}
+
+        try:
+            self._type.extract(decoder, paths_as_tree(paths), '', extracted)
+        except ErrorWithLocation as e:
+            # Add member location
+            e.add_location(self._type)
+            raise e
+
+        # Paths within extracted values.
+        for path in paths:
+            if path in extracted:
+                continue
+
+            names = path.split('.')
+
+            for i in range(1, len(names)):
+                prefix = '.'.join(names[:i])
+
+                if prefix in extracted:
+                    try:
+                        extracted[path] = compiler.get_path_value(extracted[prefix],
+                                                                  names[i:])
+                    except KeyError:
+                        pass
+
+                    break
+
+        return extracted
+
+    def encode_many(self, data):
+        # Reuse the encoder buffer for all items.
+        encoder = self.ENCODER()
+
+        for item in data:
+            encoder.reset()
+            self._encode(item, encoder)
+
+            yield encoder.as_bytearray()
+
+    def _encode(self, data, encoder):
+        try:
+            if self._specializer is not None:
+                self.specialized()[0](data, encoder)
+            else:
+                self._type.encode(data, encoder)
+        except ErrorWithLocation as e:
+            # Add member location
+            e.add_location(self._type)
+            raise e
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_specialized'] = None
+        state['_specialized_checked'] = None
+
+        return state
+
 
 class Compiler(compiler.Compiler):
 
@@ -0,0 +1,855 @@
+"""Schema specialized encoders and decoders for the PER and UPER
+codecs.
+
+Straight-line Python functions are generated from the compiled type
+tree, with bit widths, optional member bitmaps and member names
+inlined as constants. Types without a specialized implementation call
+the generic encode and decode methods of the type.
+
+"""
+
+from . import ErrorWithLocation
+from . import DecodeError
+from . import OutOfDataError
+from . import per
+from . import uper
+from . import type_checker
+
+
+UPER_INTEGERS = (uper.Integer, )
+PER_INTEGERS = (per.Integer, )
+ENUMERATEDS = (per.Enumerated, )
+MEMBERS_TYPES = (per.Sequence, per.Set)
+UPER_CHOICES = (uper.Choice, )
+PER_CHOICES = (per.Choice, )
+UPER_ARRAYS = (uper.SequenceOf, uper.SetOf)
+PER_ARRAYS = (per.SequenceOf, per.SetOf)
+UPER_OCTET_STRINGS = (uper.OctetString, )
+PER_OCTET_STRINGS = (per.OctetString, )
+
+# Element types reading all elements of an array at once in
+# decode_many().
+DECODE_MANY_TYPES = (per.Boolean, uper.Integer, per.Integer)
+
+# Conditions of inlined type checks, equivalent to the type checker
+# types.
+TYPE_CHECKS = {
+    type_checker.Boolean: 'isinstance(data, bool)',
+    type_checker.Integer: 'isinstance(data, (int, str))',
+    type_checker.Null: 'data is None',
+    type_checker.Bytes: 'isinstance(data, (bytes, bytearray))',
+    type_checker.String: 'isinstance(data, str)'
+}
+
+
+def indent(lines):
+    return ['    ' + line for line in lines]
+
+
+def subtract(expression, value):
+    if value == 0:
+        return expression
+    elif value > 0:
+        return '{} - {}'.format(expression, value)
+    else:
+        return '{} + {}'.format(expression, -value)
+
+
+def add(expression, value):
+    return subtract(expression, -value)
+
+
+class Specializer(object):
+    """Generates and executes specialized encode and decode functions
+    for compiled PER and UPER types. Functions are generated once per
+    type object and shared between all types using it.
+
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self._namespace = {
+            'ErrorWithLocation': ErrorWithLocation,
+            'DecodeError': DecodeError,
+            'OutOfDataError': OutOfDataError
+        }
+        self._lines = []
+        self._functions = {}
+        self._checked_functions = {}
+        self._types = []
+        self._function_tables = []
+
+    def specialize(self, type_):
+        """Returns a tuple of the specialized encode and decode functions
+        of given type.
+
+        """
+
+        encode_name, decode_name = self.generate(type_)
+        self.execute()
+
+        return self._namespace[encode_name], self._namespace[decode_name]
+
+    def specialize_checked(self, type_, checker):
+        """Returns a specialized encode function of given type that also
+        checks the type of the data, as given type checker type
+        does. It raises the same encode error as the type checker if
+        the data has the wrong type.
+
+        """
+
+        encode_name = self.generate_checked(type_, checker)
+        self.execute()
+
+        return self._namespace[encode_name]
+
+    def execute(self):
+        self._lines.append('')
+        exec('\n'.join(self._lines), self._namespace)
+        self._lines = []
+
+        for name, function_names in self._function_tables:
+            self._namespace[name] = tuple(
+                (member_name, self._namespace[function_name])
+                if member_name is not None
+                else self._namespace[function_name]
+                for member_name, function_name in function_names)
+
+        self._function_tables = []
+
+    def constant(self, value):
+        name = 'c{}'.format(len(self._namespace))
+        self._namespace[name] = value
+
+        return name
+
+    def function_table(self, function_names):
+        """Returns the name of a tuple of given functions, created once
+        all functions have been executed.
+
+        """
+
+        name = self.constant(None)
+        self._function_tables.append((name, function_names))
+
+        return name
+
+    def with_location(self, lines, location):
+        """Returns given lines in a try statement adding given location
+        to raised errors, as the generic encode and decode methods do.
+
+        """
+
+        return ['try:'] + indent(lines) + [
+            'except ErrorWithLocation as e:',
+            '    e.add_location({})'.format(location),
+            '    raise'
+        ]
+
+    def generate(self, type_):
+        key = id(type_)
+
+        if key in self._functions:
+            return self._functions[key]
+
+        number = len(self._functions)
+        names = ('encode_{}'.format(number), 'decode_{}'.format(number))
+        self._functions[key] = names
+
+        # Keep a reference to the type so its id is not reused.
+        self._types.append(type_)
+
+        encode_lines, decode_lines = self.generate_type(type_)
+        self._lines.append('def {}(data, encoder):'.format(names[0]))
+        self._lines += indent(encode_lines)
+        self._lines.append('')
+        self._lines.append('def {}(decoder):'.format(names[1]))
+        self._lines += indent(decode_lines)
+        self._lines.append('')
+
+        return names
+
+    def generate_checked(self, type_, checker):
+        key = (id(type_), id(checker))
+
+        if key in self._checked_functions:
+            return self._checked_functions[key]
+
+        name = 'encode_checked_{}'.format(len(self._checked_functions))
+        self._checked_functions[key] = name
+
+        # Keep a reference to the checker so its id is not reused.
+        self._types.append(checker)
+
+        lines = self.generate_checked_type(type_, checker)
+        self._lines.append('def {}(data, encoder):'.format(name))
+        self._lines += indent(lines)
+        self._lines.append('')
+
+        return name
+
+    def generate_checked_type(self, type_, checker):
+        class_ = type(type_)
+        checker_class = type(checker)
+        lines = None
+
+        if checker_class is type_checker.Dict:
+            if class_ in MEMBERS_TYPES:
+                lines = self.generate_checked_members_type(type_, checker)
+        elif checker_class is type_checker.Choice:
+            if class_ in UPER_CHOICES:
+                lines = self.generate_checked_choice(
+                    type_,
+                    checker,
+                    self.generate_uper_choice_index)
+            elif class_ in PER_CHOICES:
+                lines = self.generate_checked_choice(
+                    type_,
+                    checker,
+                    self.generate_per_choice_index)
+        elif checker_class is type_checker.List:
+            if class_ in UPER_ARRAYS:
+                lines = self.generate_checked_array(type_,
+                                                    checker,
+                                                    self.generate_uper_length)
+            elif class_ in PER_ARRAYS:
+                lines = self.generate_checked_array(type_,
+                                                    checker,
+                                                    self.generate_per_length)
+
+        if lines is not None:
+            return lines
+
+        # Check the type, and all types within it, then encode it.
+        encode_name, _ = self.generate(type_)
+
+        checker_encode = self.constant(checker.encode)
+
+        if checker_class in TYPE_CHECKS:
+            lines = [
+                'if not {}:'.format(TYPE_CHECKS[checker_class]),
+                '    {}(data)'.format(checker_encode)
+            ]
+        else:
+            lines = ['{}(data)'.format(checker_encode)]
+
+        lines.append('{}(data, encoder)'.format(encode_name))
+
+        return lines
+
+    def generate_checked_members_type(self, type_, checker):
+        checker_members = {member.name: member for member in checker.members}
+        encode_names = {}
+
+        for member in type_.root_members:
+            if member.name not in checker_members:
+                return None
+
+            encode_names[id(member)] = self.generate_checked(
+                member,
+                checker_members.pop(member.name))
+
+        lines = [
+            'if not isinstance(data, dict):',
+            '    {}(data)'.format(self.constant(checker.encode))
+        ]
+
+        # Extension additions are checked by the type checker.
+        for name, member in checker_members.items():
+            lines.append('if {} in data:'.format(repr(name)))
+            lines += indent(self.with_location(
+                ['{}(data[{}])'.format(self.constant(member.encode), repr(name))],
+                self.constant(member)))
+
+        encode_lines, _ = self.generate_members_type(type_, encode_names)
+
+        return lines + encode_lines
+
+    def generate_checked_choice(self, type_, checker, generate_index):
+        if (type(type_) in PER_CHOICES
+            and type_.number_of_indefinite_bits is not None):
+            return None
+
+        encode_names = {}
+
+        for member in type_.root_index_to_member.values():
+            if member.name not in checker.name_to_member:
+                return None
+
+            encode_names[id(member)] = self.generate_checked(
+                member,
+                checker.name_to_member[member.name])
+
+        checker_encode = self.constant(checker.encode)
+
+        # Extension additions and unknown members are checked by the
+        # type checker.
+        lines = [
+            'if not (isinstance(data, tuple)',
+            '        and len(data) == 2',
+            '        and isinstance(data[0], str)',
+            '        and data[0] in {}):'.format(
+                self.constant(type_.root_name_to_index)),
+            '    {}(data)'.format(checker_encode)
+        ]
+
+        encode_lines, _ = self.generate_choice(type_,
+                                               generate_index,
+                                               encode_names)
+
+        return lines + encode_lines
+
+    def generate_checked_array(self, type_, checker, generate_length):
+        if type_.has_extension_marker or type_.number_of_bits is None:
+            return None
+
+        encode_name = self.generate_checked(type_.element_type,
+                                            checker.element_type)
+        encode_lines, _ = generate_length(type_, 'len(data)')
+
+        return [
+            'if not isinstance(data, list):',
+            '    {}(data)'.format(self.constant(checker.encode))
+        ] + encode_lines + [
+            'for entry in data:',
+            '    {}(entry, encoder)'.format(encode_name)
+        ]
+
+    def generate_type(self, type_):
+        class_ = type(type_)
+
+        if class_ is per.Boolean:
+            return self.generate_boolean()
+        elif class_ is per.Null:
+            return self.generate_null()
+        elif class_ in UPER_INTEGERS:
+            return self.generate_uper_integer(type_)
+        elif class_ in PER_INTEGERS:
+            return self.generate_per_integer(type_)
+        elif class_ in ENUMERATEDS:
+            return self.generate_enumerated(type_)
+        elif class_ in MEMBERS_TYPES:
+            return self.generate_members_type(type_)
+        elif class_ in UPER_CHOICES:
+            return self.generate_choice(type_, self.generate_uper_choice_index)
+        elif class_ in PER_CHOICES:
+            return self.generate_choice(type_, self.generate_per_choice_index)
+        elif class_ in UPER_ARRAYS:
+            return self.generate_array(type_, self.generate_uper_length)
+        elif class_ in PER_ARRAYS:
+            return self.generate_array(type_, self.generate_per_length)
+        elif class_ in UPER_OCTET_STRINGS:
+            return self.generate_uper_octet_string(type_)
+        elif class_ in PER_OCTET_STRINGS:
+            return self.generate_per_octet_string(type_)
+        else:
+            return self.generate_generic(type_)
+
+    def generate_generic(self, type_):
+        return (
+            ['{}(data, encoder)'.format(self.constant(type_.encode))],
+            ['return {}(decoder)'.format(self.constant(type_.decode))]
+        )
+
+    def generate_boolean(self):
+        return (
+            ['encoder.append_bit(1 if data else 0)'],
+            ['return decoder.read_bit() == 1']
+        )
+
+    def generate_null(self):
+        return (
+            ['pass'],
+            ['return None']
+        )
+
+    def generate_uper_integer(self, type_):
+        if type_.has_extension_marker or type_.number_of_bits is None:
+            return self.generate_generic(type_)
+
+        return (
+            [
+                'encoder.append_non_negative_binary_integer({}, {})'.format(
+                    subtract('data', type_.minimum),
+                    type_.number_of_bits)
+            ],
+            [
+                'return {}'.format(
+                    add('decoder.read_non_negative_binary_integer({})'.format(
+                        type_.number_of_bits),
+                        type_.minimum))
+            ]
+        )
+
+    def generate_per_integer(self, type_):
+        if (type_.has_extension_marker
+            or type_.number_of_bits is None
+            or type_.number_of_indefinite_bits is not None):
+            return self.generate_generic(type_)
+
+        return (
+            self.generate_per_constrained_whole_number_encode(
+                'data',
+                type_.minimum,
+                type_.maximum,
+                type_.number_of_bits),
+            self.generate_per_constrained_whole_number_decode(
+                'value',
+                type_.minimum,
+                type_.maximum,
+                type_.number_of_bits) + ['return value']
+        )
+
+    def generate_per_constrained_whole_number_encode(self,
+                                                     expression,
+                                                     minimum,
+                                                     maximum,
+                                                     number_of_bits):
+        """Inlined version of ``append_constrained_whole_number()``.
+
+        """
+
+        _range = (maximum - minimum + 1)
+        value = subtract(expression, minimum)
+
+        if _range <= 255:
+            lines = []
+        else:
+            lines = ['encoder.align_always()']
+
+            if _range == 256:
+                number_of_bits = 8
+            elif _range <= 65536:
+                number_of_bits = 16
+
+        lines.append('encoder.append_non_negative_binary_integer({}, {})'.format(
+            value,
+            number_of_bits))
+
+        return lines
+
+    def generate_per_constrained_whole_number_decode(self,
+                                                     target,
+                                                     minimum,
+                                                     maximum,
+                                                     number_of_bits):
+        """Inlined version of ``read_constrained_whole_number()``.
+
+        """
+
+        _range = (maximum - minimum + 1)
+
+        if _range <= 255:
+            lines = []
+        else:
+            lines = ['decoder.align_always()']
+
+            if _range == 256:
+                number_of_bits = 8
+            elif _range <= 65536:
+                number_of_bits = 16
+
+        value = 'decoder.read_non_negative_binary_integer({})'.format(
+            number_of_bits)
+        lines.append('{} = {}'.format(target, add(value, minimum)))
+
+        return lines
+
+    def generate_enumerated(self, type_):
+        root_data_to_index = self.constant(type_.root_data_to_index)
+        root_index_to_data = self.constant(
+            tuple(type_.root_index_to_data[index]
+                  for index in range(len(type_.root_index_to_data))))
+        root_encode = 'encoder.append_non_negative_binary_integer({}[data], {})'.format(
+            root_data_to_index,
+            type_.root_number_of_bits)
+        root_decode_lines = [
+            'index = decoder.read_non_negative_binary_integer({})'.format(
+                type_.root_number_of_bits)
+        ]
+
+        # Raise the same error as the generic decoder for indexes
+        # outside the root.
+        if len(type_.root_index_to_data) < 2 ** type_.root_number_of_bits:
+            root_decode_lines += [
+                'if index >= {}:'.format(len(type_.root_index_to_data)),
+                '    raise DecodeError({}.format(index))'.format(
+                    self.constant(
+                        'Expected enumeration index {}, but got {{}}.'.format(
+                            type_.format_root_indexes())))
+            ]
+
+        root_decode_lines.append('return {}[index]'.format(root_index_to_data))
+
+        if type_.additions_index_to_data is None:
+            return [root_encode], root_decode_lines
+
+        additions_data_to_index = self.constant(type_.additions_data_to_index)
+        additions_index_to_data = self.constant(type_.additions_index_to_data)
+        encode_lines = [
+            'if data in {}:'.format(root_data_to_index),
+            '    encoder.append_bit(0)',
+            '    ' + root_encode,
+            'else:',
+            '    encoder.append_bit(1)',
+            '    encoder.append_normally_small_non_negative_whole_number('
+            '{}[data])'.format(additions_data_to_index)
+        ]
+        decode_lines = ['if decoder.read_bit() == 0:']
+        decode_lines += indent(root_decode_lines)
+        decode_lines += [
+            '',
+            'return {}.get('
+            'decoder.read_normally_small_non_negative_whole_number())'.format(
+                additions_index_to_data)
+        ]
+
+        return encode_lines, decode_lines
+
+    def generate_members_type(self, type_, encode_names=None):
+        encode_lines = []
+        decode_lines = []
+        number_of_optionals = len(type_.optionals)
+
+        if type_.additions is not None:
+            if len(type_.additions) > 0:
+                encode_lines.append('offset = encoder.offset()')
+
+            encode_lines.append('encoder.append_bit(0)')
+            decode_lines.append('extension_bit = decoder.read_bit()')
+
+        # The presence bitmap of all optional members is written and
+        # read as a single integer.
+        if number_of_optionals > 0:
+            presence_bits = []
+
+            for i, optional in enumerate(type_.optionals):
+                name = repr(optional.name)
+
+                if optional.optional:
+                    bit = '({} in data)'.format(name)
+                else:
+                    bit = '({0} in data and not {1}(data[{0}]))'.format(
+                        name,
+                        self.constant(optional.is_default))
+
+                shift = (number_of_optionals - i - 1)
+
+                if shift > 0:
+                    bit = '({} << {})'.format(bit, shift)
+
+                presence_bits.append(bit)
+
+            encode_lines.append(
+                'encoder.append_non_negative_binary_integer({}, {})'.format(
+                    ' | '.join(presence_bits),
+                    number_of_optionals))
+            # The generic decoder reads the presence bits one by one,
+            # and thus runs out of data at the end of the input.
+            decode_lines += [
+                'if decoder.number_of_bits < {}:'.format(number_of_optionals),
+                '    raise OutOfDataError(decoder.total_number_of_bits)',
+                'presence_bits = decoder.read_non_negative_binary_integer('
+                '{})'.format(number_of_optionals)
+            ]
+
+        decode_lines.append('values = {}')
+        masks = {
+            id(optional): (1 << (number_of_optionals - i - 1))
+            for i, optional in enumerate(type_.optionals)
+        }
+
+        for member in type_.root_members:
+            encode_name, decode_name = self.generate(member)
+
+            if encode_names is not None:
+                encode_name = encode_names[id(member)]
+
+            name = repr(member.name)
+            member_constant = self.constant(member)
+            encode_member_lines = self.with_location(
+                ['{}(data[{}], encoder)'.format(encode_name, name)],
+                member_constant)
+            decode_member_lines = self.with_location(
+                ['values[{}] = {}(decoder)'.format(name, decode_name)],
+                member_constant)
+
+            if member.default is not None:
+                encode_lines.append(
+                    'if {0} in data and not {1}(data[{0}]):'.format(
+                        name,
+                        self.constant(member.is_default)))
+                encode_lines += indent(encode_member_lines)
+            elif member.optional:
+                encode_lines.append('if {} in data:'.format(name))
+                encode_lines += indent(encode_member_lines)
+            else:
+                # The generic method raises the missing member error.
+                encode_lines += [
+                    'if {} not in data:'.format(name),
+                    '    {}({}, data, encoder)'.format(
+                        self.constant(type_.encode_member),
+                        member_constant)
+                ]
+                encode_lines += encode_member_lines
+
+            if id(member) in masks:
+                decode_lines.append(
+                    'if presence_bits & {}:'.format(masks[id(member)]))
+                decode_lines += indent(decode_member_lines)
+
+                if member.has_default():
+                    decode_lines += [
+                        'else:',
+                        '    values[{}] = {}'.format(
+                            name,
+                            self.constant(member.default))
+                    ]
+            else:
+                decode_lines += decode_member_lines
+
+        if type_.additions is not None:
+            type_constant = self.constant(type_)
+
+            if len(type_.additions) > 0:
+                encode_lines += [
+                    'if {}.encode_additions(data, encoder):'.format(type_constant),
+                    '    encoder.set_bit(offset)'
+                ]
+
+            decode_lines += [
+                'if extension_bit:',
+                '    values.update({}.decode_additions(decoder))'.format(
+                    type_constant)
+            ]
+
+        if not encode_lines:
+            encode_lines.append('pass')
+
+        decode_lines.append('return values')
+
+        return encode_lines, decode_lines
+
+    def generate_uper_choice_index(self, type_):
+        return (
+            [
+                'encoder.append_non_negative_binary_integer(index, {})'.format(
+                    type_.root_number_of_bits)
+            ],
+            [
+                'index = decoder.read_non_negative_binary_integer({})'.format(
+                    type_.root_number_of_bits)
+            ]
+        )
+
+    def generate_per_choice_index(self, type_):
+        return (
+            self.generate_per_constrained_whole_number_encode(
+                'index',
+                0,
+                type_.maximum,
+                type_.root_number_of_bits),
+            self.generate_per_constrained_whole_number_decode(
+                'index',
+                0,
+                type_.maximum,
+                type_.root_number_of_bits)
+        )
+
+    def generate_choice(self, type_, generate_index, encode_names=None):
+        if (type(type_) in PER_CHOICES
+            and type_.number_of_indefinite_bits is not None):
+            return self.generate_generic(type_)
+
+        members = [
+            type_.root_index_to_member[index]
+            for index in range(len(type_.root_index_to_member))
+        ]
+        function_names = [self.generate(member) for member in members]
+
+        if encode_names is not None:
+            encoders = [encode_names[id(member)] for member in members]
+        else:
+            encoders = [encode_name for encode_name, _ in function_names]
+
+        encoders = self.function_table([
+            (None, encode_name)
+            for encode_name in encoders
+        ])
+        decoders = self.function_table([
+            (member.name, decode_name)
+            for member, (_, decode_name) in zip(members, function_names)
+        ])
+        members_constant = self.constant(tuple(members))
+        root_name_to_index = self.constant(type_.root_name_to_index)
+        encode_root_lines = []
+        decode_root_lines = []
+
+        # The generic method raises the unknown member error. Extension
+        # additions are checked by the type before the root is encoded.
+        if type_.additions_index_to_member is None:
+            encode_root_lines += [
+                'if data[0] not in {}:'.format(root_name_to_index),
+                '    {}(data, encoder)'.format(self.constant(type_.encode_root))
+            ]
+
+        encode_root_lines.append('index = {}[data[0]]'.format(root_name_to_index))
+
+        if len(members) > 1:
+            encode_index_lines, decode_index_lines = generate_index(type_)
+            encode_root_lines += encode_index_lines
+            decode_root_lines += decode_index_lines
+            decode_root_lines += [
+                'if index >= {}:'.format(len(members)),
+                '    raise DecodeError({}.format(index))'.format(
+                    self.constant('Expected choice index {}, but got {{}}.'.format(
+                        type_.format_root_indexes())))
+            ]
+        else:
+            decode_root_lines.append('index = 0')
+
+        encode_root_lines += self.with_location(
+            ['{}[index](data[1], encoder)'.format(encoders)],
+            '{}[index]'.format(members_constant))
+        decode_root_lines.append('name, decode = {}[index]'.format(decoders))
+        decode_root_lines.append('')
+        decode_root_lines += self.with_location(
+            ['return (name, decode(decoder))'],
+            '{}[index]'.format(members_constant))
+
+        if type_.additions_index_to_member is None:
+            return encode_root_lines, decode_root_lines
+
+        type_constant = self.constant(type_)
+        encode_lines = ['if data[0] in {}:'.format(root_name_to_index)]
+        encode_lines.append('    encoder.append_bit(0)')
+        encode_lines += indent(encode_root_lines)
+        encode_lines += [
+            'else:',
+            '    encoder.append_bit(1)',
+            '    {}.encode_additions(data, encoder)'.format(type_constant)
+        ]
+        decode_lines = [
+            'if decoder.read_bit():',
+            '    return {}.decode_additions(decoder)'.format(type_constant),
+            ''
+        ]
+        decode_lines += decode_root_lines
+
+        return encode_lines, decode_lines
+
+    def generate_uper_length(self, type_, expression):
+        encode_lines = []
+        decode_lines = ['length = {}'.format(type_.minimum)]
+
+        if type_.minimum != type_.maximum:
+            encode_lines.append(
+                'encoder.append_non_negative_binary_integer({}, {})'.format(
+                    subtract(expression, type_.minimum),
+                    type_.number_of_bits))
+            decode_lines = [
+                'length = {}'.format(
+                    add('decoder.read_non_negative_binary_integer({})'.format(
+                        type_.number_of_bits),
+                        type_.minimum))
+            ]
+
+        return encode_lines, decode_lines
+
+    def generate_per_length(self, type_, expression):
+        encode_lines = []
+        decode_lines = ['length = {}'.format(type_.minimum)]
+
+        if type_.minimum != type_.maximum:
+            encode_lines = self.generate_per_constrained_whole_number_encode(
+                expression,
+                type_.minimum,
+                type_.maximum,
+                type_.number_of_bits)
+            decode_lines = self.generate_per_constrained_whole_number_decode(
+                'length',
+                type_.minimum,
+                type_.maximum,
+                type_.number_of_bits)
+
+        return encode_lines, decode_lines
+
+    def generate_array(self, type_, generate_length):
+        if type_.has_extension_marker or type_.number_of_bits is None:
+            return self.generate_generic(type_)
+
+        encode_name, decode_name = self.generate(type_.element_type)
+        encode_lines, decode_lines = generate_length(type_, 'len(data)')
+        encode_lines += [
+            'for entry in data:',
+            '    {}(entry, encoder)'.format(encode_name)
+        ]
+
+        if type(type_.element_type) in DECODE_MANY_TYPES:
+            decode_lines.append('return {}(decoder, length)'.format(
+                self.constant(type_.element_type.decode_many)))
+        else:
+            decode_lines.append(
+                'return [{}(decoder) for _ in range(length)]'.format(decode_name))
+
+        return encode_lines, decode_lines
+
+    def generate_uper_octet_string(self, type_):
+        if type_.has_extension_marker or type_.number_of_bits is None:
+            return self.generate_generic(type_)
+
+        encode_lines, decode_lines = self.generate_uper_length(type_, 'len(data)')
+        encode_lines.append('encoder.append_bytes(data)')
+        decode_lines.append('return decoder.read_bytes(length)')
+
+        return encode_lines, decode_lines
+
+    def generate_per_octet_string(self, type_):
+        if type_.has_extension_marker or type_.number_of_bits is None:
+            return self.generate_generic(type_)
+
+        encode_lines, decode_lines = self.generate_per_length(type_, 'len(data)')
+
+        if type_.minimum != type_.maximum or type_.maximum > 2:
+            encode_lines.append('encoder.align()')
+            decode_lines.append('decoder.align()')
+
+        encode_lines.append('encoder.append_bytes(data)')
+        decode_lines.append('return decoder.read_bytes(length)')
+
+        return encode_lines, decode_lines
+
+    def __getstate__(self):
+        # Generated functions cannot be pickled. They are generated
+        # again when needed.
+        return {}
+
+    def __setstate__(self, _state):
+        self.reset()
+
+
+def specialize(modules):
+    """Make all types in given compiled modules use specialized encode
+    and decode functions.
+
+    """
+
+    specializer = Specializer()
+
+    for types in modules.values():
+        for compiled_type in types.values():
+            specialize_type(compiled_type, specializer)
+
+
+def specialize_type(compiled_type, specializer):
+    """Make given compiled type use encode and decode functions
+    generated by given specializer.
+
+    """
+
+    if isinstance(compiled_type, per.compiler.CompiledOpenTypes):
+        compiled_type = compiled_type._type
+
+    compiled_type.set_specializer(specializer)
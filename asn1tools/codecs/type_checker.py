@@ -136,11 +136,19 @@ class Dict(Type):
     def __init__(self, name, members):
         super(Dict, self).__init__(name)
         self.members = members
+        self.name_to_member = {member.name: member for member in members}
 
     def encode(self, data):
-        super(Dict, self).encode(data)
+        self.encode_type(data)
         self.encode_members(data)
 
+    def encode_type(self, data):
+        """Check given data, but not its members.
+
+        """
+
+        super(Dict, self).encode(data)
+
     def encode_members(self, data):
         for member in self.members:
             name = member.name
@@ -163,9 +171,16 @@ class List(Type):
         self.element_type = element_type
 
     def encode(self, data):
-        super(List, self).encode(data)
+        self.encode_type(data)
         self.encode_members(data)
 
+    def encode_type(self, data):
+        """Check given data, but not its elements.
+
+        """
+
+        super(List, self).encode(data)
+
     def encode_members(self, data):
         for entry in data:
             self.element_type.encode(entry)
@@ -217,6 +232,21 @@ class Choice(Type):
         return format_or(sorted([member.name for member in self.members]))
 
     def encode(self, data):
+        member = self.encode_type(data)
+
+        try:
+            member.encode(data[1])
+        except ErrorWithLocation as e:
+            # Add member location
+            e.add_location(member)
+            raise e
+
+    def encode_type(self, data):
+        """Check given data, but not the chosen member's value, and return
+        the chosen member.
+
+        """
+
         if sys.version_info[0] > 2:
             if (not isinstance(data, tuple)
                 or len(data) != 2
@@ -233,18 +263,12 @@ class Choice(Type):
                         data))
 
         try:
-            member = self.name_to_member[data[0]]
+            return self.name_to_member[data[0]]
         except KeyError:
             raise EncodeError(
                 "Expected choice {}, but got '{}'.".format(
                     self.format_names(),
                     data[0]))
-        try:
-            member.encode(data[1])
-        except ErrorWithLocation as e:
-            # Add member location
-            e.add_location(member)
-            raise e
 
 
 class Date(Type):
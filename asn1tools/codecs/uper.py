@@ -2,15 +2,14 @@
 
 """
 
-from . import DecodeError, ErrorWithLocation
+from . import DecodeError
 from . import per
 from . import restricted_utc_time_to_datetime
 from . import restricted_utc_time_from_datetime
 from . import restricted_generalized_time_to_datetime
 from . import restricted_generalized_time_from_datetime
-from .per import to_int
-from .per import to_byte_array
 from .per import integer_as_number_of_bits
+from .per import add_minimum
 from .per import PermittedAlphabet
 from .per import Type
 from .per import Boolean
@@ -79,11 +78,7 @@ class KnownMultiplierStringType(per.KnownMultiplierStringType):
             encoder.append_non_negative_binary_integer(len(data) - self.minimum,
                                                        self.number_of_bits)
 
-        for value in data:
-            encoder.append_non_negative_binary_integer(
-                self.permitted_alphabet.encode(
-                    to_int(value.encode(self.ENCODING))),
-                self.bits_per_character)
+        self.encode_characters(data, encoder)
 
     def decode(self, decoder):
         if self.has_extension_marker:
@@ -101,19 +96,12 @@ class KnownMultiplierStringType(per.KnownMultiplierStringType):
             if self.minimum != self.maximum:
                 length += decoder.read_non_negative_binary_integer(self.number_of_bits)
 
-        data = bytearray()
-
-        for _ in range(length):
-            value = decoder.read_non_negative_binary_integer(self.bits_per_character)
-            value = self.permitted_alphabet.decode(value)
-            data += to_byte_array(value, self.bits_per_character)
-
-        return data.decode(self.ENCODING)
+        return self.decode_characters(decoder, length)
 
 
 class ArrayType(per.ArrayType):
 
-    def encode(self, data, encoder):
+    def encode_elements(self, data, encoder, encode_element):
         if self.has_extension_marker:
             if self.minimum <= len(data) <= self.maximum:
                 encoder.append_bit(0)
@@ -122,20 +110,20 @@ class ArrayType(per.ArrayType):
                 encoder.append_length_determinant(len(data))
 
                 for entry in data:
-                    self.element_type.encode(entry, encoder)
+                    encode_element(entry, encoder)
 
                 return
 
         if self.number_of_bits is None:
-            return self.encode_unbound(data, encoder)
+            return self.encode_unbound(data, encoder, encode_element)
         elif self.minimum != self.maximum:
             encoder.append_non_negative_binary_integer(len(data) - self.minimum,
                                                        self.number_of_bits)
 
         for entry in data:
-            self.element_type.encode(entry, encoder)
+            encode_element(entry, encoder)
 
-    def decode(self, decoder):
+    def decode_elements(self, decoder, decode_elements):
         length = None
 
         if self.has_extension_marker:
@@ -147,7 +135,7 @@ class ArrayType(per.ArrayType):
         if length is not None:
             pass
         elif self.number_of_bits is None:
-            return self.decode_unbound(decoder)
+            return self.decode_unbound(decoder, decode_elements)
         else:
             length = self.minimum
 
@@ -155,13 +143,7 @@ class ArrayType(per.ArrayType):
                 length += decoder.read_non_negative_binary_integer(
                     self.number_of_bits)
 
-        decoded = []
-
-        for _ in range(length):
-            decoded_element = self.element_type.decode(decoder)
-            decoded.append(decoded_element)
-
-        return decoded
+        return decode_elements(decoder, length)
 
 
 class Integer(Type):
@@ -211,6 +193,21 @@ class Integer(Type):
 
             return value + self.minimum
 
+    def decode_many(self, decoder, number_of_values):
+        if self.has_extension_marker or self.number_of_bits is None:
+            return super(Integer, self).decode_many(decoder, number_of_values)
+
+        return add_minimum(
+            decoder.read_non_negative_binary_integers(self.number_of_bits,
+                                                      number_of_values),
+            self.minimum)
+
+    def skip(self, decoder):
+        if self.has_extension_marker or self.number_of_bits is None:
+            self.decode(decoder)
+        else:
+            decoder.skip_bits(self.number_of_bits)
+
     def __repr__(self):
         return 'Integer({})'.format(self.name)
 
@@ -376,6 +373,7 @@ class BMPString(KnownMultiplierStringType):
     ENCODE_DECODE_MAP = {ord(v): ord(v) for v in ALPHABET}
     PERMITTED_ALPHABET = PermittedAlphabet(ENCODE_DECODE_MAP,
                                            ENCODE_DECODE_MAP)
+    VALUES_ENCODING = 'utf-16-be'
 
 
 class VisibleString(KnownMultiplierStringType):
@@ -479,25 +477,8 @@ class OpenType(Type):
 
 class CompiledType(per.CompiledType):
 
-    def encode(self, data):
-        encoder = Encoder()
-        try:
-            self._type.encode(data, encoder)
-        except ErrorWithLocation as e:
-            # Add member location
-            e.add_location(self._type)
-            raise e
-
-        return encoder.as_bytearray()
-
-    def decode(self, data):
-        decoder = Decoder(bytearray(data))
-        try:
-            return self._type.decode(decoder)
-        except ErrorWithLocation as e:
-            # Add member location
-            e.add_location(self._type)
-            raise e
+    ENCODER = Encoder
+    DECODER = Decoder
 
 
 class Compiler(per.Compiler):
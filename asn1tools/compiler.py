@@ -3,11 +3,8 @@ encode and decode types.
 
 """
 
-try:
-    import diskcache
-    has_diskcache = True
-except ImportError:
-    has_diskcache = False
+from copy import deepcopy
+from collections.abc import Mapping
 
 from .parser import parse_files
 from .parser import parse_string
@@ -20,13 +17,79 @@ from .codecs import oer
 from .codecs import per
 from .codecs import uper
 from .codecs import xer
+from .codecs import per_specializer
 from .codecs import type_checker
 from .codecs import constraints_checker
+from .cache import Cache
+from . import serialization
 from .errors import CompileError
 from .errors import EncodeError
 from .errors import DecodeError
 
 
+class LazyTypes(Mapping):
+    """A read-only dictionary of types, where each type is compiled the
+    first time it is accessed by calling `compile_type` with its
+    module and type names.
+
+    """
+
+    def __init__(self, type_modules, compile_type):
+        self._type_modules = type_modules
+        self._compile_type = compile_type
+        self._types = {}
+
+    def __getitem__(self, type_name):
+        try:
+            return self._types[type_name]
+        except KeyError:
+            type_ = self._compile_type(self._type_modules[type_name], type_name)
+            self._types[type_name] = type_
+
+            return type_
+
+    def __iter__(self):
+        return iter(self._type_modules)
+
+    def __len__(self):
+        return len(self._type_modules)
+
+
+class LazyCompiler(object):
+    """Compiles types on demand using given pre-processed codec, type
+    checker and constraints checker compilers.
+
+    """
+
+    def __init__(self,
+                 codec,
+                 type_checker,
+                 constraints_checker,
+                 specialize):
+        self._codec = codec
+        self._type_checker = type_checker
+        self._constraints_checker = constraints_checker
+
+        if specialize:
+            self._specializer = per_specializer.Specializer()
+        else:
+            self._specializer = None
+
+    def compile_type(self, module_name, type_name):
+        type_ = self._codec.process_lazy(type_name, module_name)
+        type_.type_checker = self._type_checker.process_lazy(
+            type_name,
+            module_name)
+        type_.constraints_checker = self._constraints_checker.process_lazy(
+            type_name,
+            module_name)
+
+        if self._specializer is not None:
+            per_specializer.specialize_type(type_, self._specializer)
+
+        return type_
+
+
 class Specification(object):
     """This class is used to encode and decode ASN.1 types found in an
     ASN.1 specification.
@@ -42,29 +105,49 @@ class Specification(object):
                  modules,
                  decode_length,
                  type_checkers,
-                 constraints_checkers):
+                 constraints_checkers,
+                 options=None,
+                 any_defined_by_choices=None,
+                 source=None):
         self._modules = modules
         self._decode_length = decode_length
-        self._types = {}
-
+        self._options = options
+        self._any_defined_by_choices = any_defined_by_choices
+        self._source = source
+        type_modules = {}
         duplicated = set()
 
         for module_name in modules:
             types = modules[module_name]
 
-            for type_name, type_ in types.items():
-                type_.type_checker = type_checkers[module_name][type_name]
-                type_.constraints_checker = constraints_checkers[module_name][type_name]
+            # Checkers of lazily compiled types are set when compiled.
+            if type_checkers is not None:
+                for type_name, type_ in types.items():
+                    type_.type_checker = type_checkers[module_name][type_name]
+                    type_.constraints_checker = (
+                        constraints_checkers[module_name][type_name])
 
+            for type_name in types:
                 if type_name in duplicated:
                     continue
 
-                if type_name in self._types:
-                    del self._types[type_name]
+                if type_name in type_modules:
+                    del type_modules[type_name]
                     duplicated.add(type_name)
                     continue
 
-                self._types[type_name] = type_
+                type_modules[type_name] = module_name
+
+        if type_checkers is None:
+            self._types = LazyTypes(type_modules, self._get_type)
+        else:
+            self._types = {
+                type_name: modules[module_name][type_name]
+                for type_name, module_name in type_modules.items()
+            }
+
+    def _get_type(self, module_name, type_name):
+        return self._modules[module_name][type_name]
 
     @property
     def types(self):
@@ -133,15 +216,17 @@ class Specification(object):
             raise EncodeError(
                 "Type '{}' not found in types dictionary.".format(name))
 
-        if check_types:
-            type_.check_types(data)
-
         if check_constraints:
+            if check_types:
+                type_.check_types(data)
+
             type_.check_constraints(data)
+        elif check_types:
+            return bytes(type_.check_types_and_encode(data, **kwargs))
 
         return bytes(type_.encode(data, **kwargs))
 
-    def decode(self, name, data, check_constraints=False):
+    def decode(self, name, data, check_constraints=False, lazy=False):
         """Decode given bytes object `data` as given type `name` and return
         the decoded data as a dictionary.
 
@@ -153,6 +238,12 @@ class Specification(object):
         instead allow decoding of values not fulfilling the
         constraints.
 
+        If `lazy` is ``True`` SEQUENCE and SET values are returned as
+        read-only mappings, only decoding a member value the first
+        time it is accessed. Use to read a few members of large
+        messages. Errors in member values are raised when accessed.
+        Only supported by the BER and DER codecs.
+
         >>> foo.decode('Question', b'0\\x0e\\x02\\x01\\x01\\x16\\x09Is 1+1=3?')
         {'id': 1, 'question': 'Is 1+1=3?'}
 
@@ -164,13 +255,43 @@ class Specification(object):
             raise DecodeError(
                 "Type '{}' not found in types dictionary.".format(name))
 
-        decoded = type_.decode(data)
+        if lazy:
+            decoded = type_.decode_lazy(data)
+        else:
+            decoded = type_.decode(data)
 
         if check_constraints:
             type_.check_constraints(decoded)
 
         return decoded
 
+    def extract(self, name, data, paths):
+        """Decode given values `paths` in given bytes object `data` of
+        given type `name`, skipping all other values, and return them
+        as a dictionary of paths and decoded values.
+
+        A path is the names of SEQUENCE and SET members and CHOICE
+        alternatives separated by dots. Paths not found in `data`, for
+        example absent optional members and CHOICE alternatives not
+        chosen, are not part of the returned dictionary.
+
+        This method only works for BER, DER, PER and UPER codecs.
+
+        >>> foo.extract('Question',
+                        b'0\\x0e\\x02\\x01\\x01\\x16\\x09Is 1+1=3?',
+                        ['question'])
+        {'question': 'Is 1+1=3?'}
+
+        """
+
+        try:
+            type_ = self._types[name]
+        except KeyError:
+            raise DecodeError(
+                "Type '{}' not found in types dictionary.".format(name))
+
+        return type_.extract(data, paths)
+
     def decode_with_length(self, name, data, check_constraints=False):
         """Same as :func:`~asn1tools.compiler.Specification.decode`, but also
         returns the byte length of the decoded data.
@@ -196,6 +317,120 @@ class Specification(object):
 
         return decoded, length
 
+    def encode_many(self,
+                    name,
+                    data,
+                    check_types=True,
+                    check_constraints=False,
+                    number_of_checks=None,
+                    **kwargs):
+        """Encode each item in given iterable `data` as given type `name`
+        and return a generator of encoded data as bytes objects.
+
+        The type is looked up once for all items, and codecs may reuse
+        internal buffers between items, which makes this method faster
+        than calling :meth:`.encode` for each item.
+
+        See :meth:`.encode` for a description of `check_types` and
+        `check_constraints`. Give `number_of_checks` as an integer to
+        only check the first `number_of_checks` items. By default all
+        items are checked.
+
+        >>> list(foo.encode_many('Question',
+                                 [{'id': 1, 'question': 'Is 1+1=3?'}]))
+        [b'0\\x0e\\x02\\x01\\x01\\x16\\x09Is 1+1=3?']
+
+        """
+
+        try:
+            type_ = self._types[name]
+        except KeyError:
+            raise EncodeError(
+                "Type '{}' not found in types dictionary.".format(name))
+
+        if check_types or check_constraints:
+            data = self._check_many(type_,
+                                    data,
+                                    check_types,
+                                    check_constraints,
+                                    number_of_checks)
+
+        return (bytes(encoded) for encoded in type_.encode_many(data, **kwargs))
+
+    def decode_many(self, name, data, check_constraints=False):
+        """Decode each bytes object in given iterable `data` as given type
+        `name` and return a generator of decoded data.
+
+        See :meth:`.decode` for a description of `check_constraints`.
+
+        >>> list(foo.decode_many('Question',
+                                 [b'0\\x0e\\x02\\x01\\x01\\x16\\x09Is 1+1=3?']))
+        [{'id': 1, 'question': 'Is 1+1=3?'}]
+
+        """
+
+        try:
+            type_ = self._types[name]
+        except KeyError:
+            raise DecodeError(
+                "Type '{}' not found in types dictionary.".format(name))
+
+        decoded = type_.decode_many(data)
+
+        if check_constraints:
+            decoded = self._check_many(type_, decoded, False, True, None)
+
+        return decoded
+
+    def iter_decode(self, name, data, check_constraints=False):
+        """Decode concatenated encodings of given type `name` read from given
+        file object or iterable of bytes objects `data`. Returns a
+        generator yielding each decoded value as soon as all of its
+        data has been read. Memory usage is bounded by the size of the
+        largest encoding and chunk.
+
+        This method only works for BER and DER codecs.
+
+        See :meth:`.decode` for a description of `check_constraints`.
+
+        >>> with open('questions.ber', 'rb') as fin:
+        ...     for decoded in foo.iter_decode('Question', fin):
+        ...         print(decoded)
+        ...
+        {'id': 1, 'question': 'Is 1+1=3?'}
+        {'id': 2, 'question': 'Is 1+1=2?'}
+
+        """
+
+        try:
+            type_ = self._types[name]
+        except KeyError:
+            raise DecodeError(
+                "Type '{}' not found in types dictionary.".format(name))
+
+        decoded = type_.iter_decode(data)
+
+        if check_constraints:
+            decoded = self._check_many(type_, decoded, False, True, None)
+
+        return decoded
+
+    @staticmethod
+    def _check_many(type_,
+                    data,
+                    check_types,
+                    check_constraints,
+                    number_of_checks):
+        for index, item in enumerate(data):
+            if number_of_checks is None or index < number_of_checks:
+                if check_types:
+                    type_.check_types(item)
+
+                if check_constraints:
+                    type_.check_constraints(item)
+
+            yield item
+
     def decode_length(self, data):
         """Decode the length of given data `data`. Returns None if not enough
         data was given to decode the length.
@@ -211,6 +446,68 @@ class Specification(object):
 
         return self._decode_length(data)
 
+    def save(self, path):
+        """Save the specification to a file at given path `path`. Load it
+        with :func:`~asn1tools.load()`.
+
+        The file contains the pre-processed specification dictionary
+        and the compile options, not the compiled types, so
+        :func:`~asn1tools.load()` only saves the time it takes to parse
+        the ASN.1 files. The file format is independent of the Python
+        version and does not contain any executable code.
+
+        The parsed specification is not kept in memory after
+        compilation. Instead, the files or the string the specification
+        was compiled from are parsed again. Specifications compiled with
+        :func:`~asn1tools.compile_dict()` keep a reference to given
+        dictionary. A :class:`~asn1tools.CompileError` is raised if the
+        types found do not match the compiled types, for example if the
+        files have been modified since compiled.
+
+        >>> foo = asn1tools.compile_files('foo.asn')
+        >>> foo.save('foo.json')
+
+        """
+
+        if self._source is None:
+            raise CompileError('The specification cannot be saved.')
+
+        specification = self._parse_source()
+        type_names = {
+            (module_name, type_name)
+            for module_name, module in specification.items()
+            for type_name in module['types']
+        }
+        compiled_type_names = {
+            (module_name, type_name)
+            for module_name, types in self._modules.items()
+            for type_name in types
+        }
+
+        if type_names != compiled_type_names:
+            raise CompileError(
+                'The specification has been modified since compiled.')
+
+        _pre_process_dict(specification,
+                          self._any_defined_by_choices,
+                          self._options['numeric_enums'])
+
+        with open(path, 'w') as fout:
+            fout.write(serialization.dumps(specification, **self._options))
+
+    def _parse_source(self):
+        kind = self._source[0]
+
+        if kind == 'files':
+            return parse_files(self._source[1], self._source[2])
+        elif kind == 'string':
+            return parse_string(self._source[1])
+        elif kind == 'saved':
+            with open(self._source[1], 'r') as fin:
+                return serialization.loads(fin.read())[1]
+        else:
+            return deepcopy(self._source[1])
+
 
 def _compile_any_defined_by_type(type_, choices):
     type_['choices'] = {}
@@ -242,40 +539,117 @@ def _compile_any_defined_by_choices(specification,
                 break
 
 
+def _pre_process_dict(specification, any_defined_by_choices, numeric_enums):
+    if any_defined_by_choices:
+        _compile_any_defined_by_choices(specification,
+                                        any_defined_by_choices)
+
+    compiler.Compiler(specification, numeric_enums).pre_process()
+
+
 def _compile_files_cache(filenames,
                          codec,
                          any_defined_by_choices,
                          encoding,
                          cache_dir,
-                         numeric_enums):
-    key = [codec.encode('ascii')]
-
+                         numeric_enums,
+                         specialize,
+                         lazy,
+                         codecs):
     if isinstance(filenames, str):
         filenames = [filenames]
 
-    for filename in filenames:
-        with open(filename, 'rb') as fin:
-            key.append(fin.read())
-
-    key = b''.join(key)
-    cache = diskcache.Cache(cache_dir)
-
-    try:
-        return cache[key]
-    except KeyError:
-        compiled = compile_dict(parse_files(filenames, encoding),
-                                codec,
-                                any_defined_by_choices,
-                                numeric_enums)
-        cache[key] = compiled
+    if any_defined_by_choices:
+        choices_option = sorted(
+            (location, sorted(choices.items()))
+            for location, choices in any_defined_by_choices.items())
+    else:
+        choices_option = None
+
+    options = [
+        codec,
+        choices_option,
+        encoding,
+        numeric_enums,
+        specialize,
+        lazy,
+        codecs
+    ]
+
+    def compile_():
+        return _compile_dict(parse_files(filenames,
+                                         encoding,
+                                         cache_dir=cache_dir),
+                             codec,
+                             any_defined_by_choices,
+                             numeric_enums,
+                             specialize,
+                             lazy,
+                             codecs,
+                             ('files', filenames, encoding))
+
+    return Cache(cache_dir).get(filenames, options, compile_)
+
+
+def _compile_codec(specification,
+                   codec,
+                   any_defined_by_choices,
+                   numeric_enums,
+                   specialize,
+                   lazy,
+                   type_checkers,
+                   constraints_checkers,
+                   source):
+    codec_name = codec.__name__.split('.')[-1]
+    options = {
+        'codec': codec_name,
+        'numeric_enums': numeric_enums,
+        'specialize': specialize
+    }
 
-        return compiled
+    if lazy:
+        lazy_compiler = LazyCompiler(codec.Compiler(specification, numeric_enums),
+                                     type_checkers,
+                                     constraints_checkers,
+                                     specialize)
+        modules = {
+            module_name: LazyTypes(
+                {type_name: module_name for type_name in module['types']},
+                lazy_compiler.compile_type)
+            for module_name, module in specification.items()
+            if module['types']
+        }
+
+        return Specification(modules,
+                             codec.decode_full_length,
+                             None,
+                             None,
+                             options,
+                             any_defined_by_choices,
+                             source)
+
+    compiled = Specification(
+        codec.Compiler(specification, numeric_enums).process(pre_process=False),
+        codec.decode_full_length,
+        type_checkers,
+        constraints_checkers,
+        options,
+        any_defined_by_choices,
+        source)
+
+    if specialize:
+        per_specializer.specialize(compiled.modules)
+
+    return compiled
 
 
 def compile_dict(specification,
                  codec='ber',
                  any_defined_by_choices=None,
-                 numeric_enums=False):
+                 numeric_enums=False,
+                 specialize=False,
+                 lazy=False,
+                 codecs=None):
     """Compile given ASN.1 specification dictionary and return a
     :class:`~asn1tools.compiler.Specification` object that can be used
     to encode and decode data structures with given codec
@@ -285,11 +659,50 @@ def compile_dict(specification,
     Give `numeric_enums` as ``True`` for numeric enumeration values
     instead of strings.
 
+    Give `specialize` as ``True`` to encode and decode using Python
+    functions generated for each type in the specification. Only
+    supported by the ``'per'`` and ``'uper'`` codecs.
+
+    Give `lazy` as ``True`` to compile each type the first time it is
+    accessed instead of compiling all types up front. This reduces the
+    compile time and memory usage of large specifications of which
+    only a few types are used. Errors in a type are raised when it is
+    first accessed.
+
+    Give `codecs` as a list of codecs instead of `codec` to compile
+    the specification for all of them at once. A dictionary of codec
+    names and :class:`~asn1tools.compiler.Specification` objects is
+    returned. The specification is pre-processed, and its type and
+    constraints checkers compiled, only once, which is faster than
+    compiling it once per codec.
+
     >>> foo = asn1tools.compile_dict(asn1tools.parse_files('foo.asn'))
+    >>> foo = asn1tools.compile_dict(asn1tools.parse_files('foo.asn'),
+    ...                              codecs=['ber', 'jer'])
+    >>> foo['jer'].encode('Question', {'id': 1, 'question': 'Is 1+1=3?'})
+    b'{"id":1,"question":"Is 1+1=3?"}'
 
     """
 
-    codecs = {
+    return _compile_dict(specification,
+                         codec,
+                         any_defined_by_choices,
+                         numeric_enums,
+                         specialize,
+                         lazy,
+                         codecs,
+                         ('dict', specification))
+
+
+def _compile_dict(specification,
+                  codec,
+                  any_defined_by_choices,
+                  numeric_enums,
+                  specialize,
+                  lazy,
+                  codecs,
+                  source):
+    codec_modules = {
         'ber': ber,
         'der': der,
         'gser': gser,
@@ -300,28 +713,55 @@ def compile_dict(specification,
         'xer': xer
     }
 
-    try:
-        codec = codecs[codec]
-    except KeyError:
-        raise CompileError("Unsupported codec '{}'.".format(codec))
-
-    if any_defined_by_choices:
-        _compile_any_defined_by_choices(specification,
-                                        any_defined_by_choices)
+    if codecs is None:
+        codec_names = [codec]
+    else:
+        codec_names = codecs
+
+    for codec_name in codec_names:
+        if codec_name not in codec_modules:
+            raise CompileError("Unsupported codec '{}'.".format(codec_name))
+
+        if specialize and codec_name not in ['per', 'uper']:
+            raise CompileError(
+                "Specialization is not supported by codec '{}'.".format(
+                    codec_name))
+
+    _pre_process_dict(specification, any_defined_by_choices, numeric_enums)
+    type_checkers = type_checker.Compiler(specification, numeric_enums)
+    constraints_checkers = constraints_checker.Compiler(specification,
+                                                        numeric_enums)
+
+    if not lazy:
+        type_checkers = type_checkers.process(pre_process=False)
+        constraints_checkers = constraints_checkers.process(pre_process=False)
+
+    compiled = {
+        codec_name: _compile_codec(specification,
+                                   codec_modules[codec_name],
+                                   any_defined_by_choices,
+                                   numeric_enums,
+                                   specialize,
+                                   lazy,
+                                   type_checkers,
+                                   constraints_checkers,
+                                   source)
+        for codec_name in codec_names
+    }
 
-    return Specification(codec.compile_dict(specification,
-                                            numeric_enums),
-                         codec.decode_full_length,
-                         type_checker.compile_dict(specification,
-                                                   numeric_enums),
-                         constraints_checker.compile_dict(specification,
-                                                          numeric_enums))
+    if codecs is None:
+        return compiled[codec]
+    else:
+        return compiled
 
 
 def compile_string(string,
                    codec='ber',
                    any_defined_by_choices=None,
-                   numeric_enums=False):
+                   numeric_enums=False,
+                   specialize=False,
+                   lazy=False,
+                   codecs=None):
     """Compile given ASN.1 specification string and return a
     :class:`~asn1tools.compiler.Specification` object that can be used
     to encode and decode data structures with given codec
@@ -331,15 +771,22 @@ def compile_string(string,
     Give `numeric_enums` as ``True`` for numeric enumeration values
     instead of strings.
 
+    See :func:`~asn1tools.compile_dict()` for descriptions of
+    `specialize`, `lazy` and `codecs`.
+
     >>> with open('foo.asn') as fin:
     ...     foo = asn1tools.compile_string(fin.read())
 
     """
 
-    return compile_dict(parse_string(string),
-                        codec,
-                        any_defined_by_choices,
-                        numeric_enums)
+    return _compile_dict(parse_string(string),
+                         codec,
+                         any_defined_by_choices,
+                         numeric_enums,
+                         specialize,
+                         lazy,
+                         codecs,
+                         ('string', string))
 
 
 def compile_files(filenames,
@@ -347,7 +794,10 @@ def compile_files(filenames,
                   any_defined_by_choices=None,
                   encoding='utf-8',
                   cache_dir=None,
-                  numeric_enums=False):
+                  numeric_enums=False,
+                  specialize=False,
+                  lazy=False,
+                  codecs=None):
     """Compile given ASN.1 specification file(s) and return a
     :class:`~asn1tools.compiler.Specification` object that can be used
     to encode and decode data structures with given codec
@@ -359,15 +809,22 @@ def compile_files(filenames,
 
     `cache_dir` specifies the compiled files cache location in the
     file system. Give as ``None`` to disable the cache. By default the
-    cache is disabled. The cache key is the concatenated contents of
-    given files and the codec name. Using a cache will significantly
-    reduce the compile time when recompiling the same files. The cache
-    directory is automatically created if it does not exist. Remove
-    the cache directory `cache_dir` to clear the cache.
+    cache is disabled. The cache key is a hash of the contents of
+    given files, all compile options and the asn1tools version. Using
+    a cache will significantly reduce the compile time when
+    recompiling the same files. The cache directory is automatically
+    created if it does not exist, and least recently used entries are
+    removed when it grows beyond 1 GiB. Remove the cache directory
+    `cache_dir` to clear the cache. Parsed files are cached as well,
+    so only modified files are parsed when recompiling. Without a
+    cache all files are parsed every time.
 
     Give `numeric_enums` as ``True`` for numeric enumeration values
     instead of strings.
 
+    See :func:`~asn1tools.compile_dict()` for descriptions of
+    `specialize`, `lazy` and `codecs`.
+
     >>> foo = asn1tools.compile_files('foo.asn')
 
     Give `cache_dir` as a string to use a cache.
@@ -377,21 +834,49 @@ def compile_files(filenames,
     """
 
     if cache_dir is None:
-        return compile_dict(parse_files(filenames, encoding),
-                            codec,
-                            any_defined_by_choices,
-                            numeric_enums)
+        return _compile_dict(parse_files(filenames, encoding),
+                             codec,
+                             any_defined_by_choices,
+                             numeric_enums,
+                             specialize,
+                             lazy,
+                             codecs,
+                             ('files', filenames, encoding))
     else:
-        if not has_diskcache:
-            raise RuntimeError(
-                'Cache access requested, but diskcache module is missing')
-
         return _compile_files_cache(filenames,
                                     codec,
                                     any_defined_by_choices,
                                     encoding,
                                     cache_dir,
-                                    numeric_enums)
+                                    numeric_enums,
+                                    specialize,
+                                    lazy,
+                                    codecs)
+
+
+def load(path, lazy=False):
+    """Load a specification saved with
+    :meth:`~asn1tools.compiler.Specification.save()` from a file at given
+    path `path` and return a :class:`~asn1tools.compiler.Specification`
+    object.
+
+    See :func:`~asn1tools.compile_dict()` for a description of `lazy`.
+
+    >>> foo = asn1tools.load('foo.json')
+
+    """
+
+    with open(path, 'r') as fin:
+        options, specification = serialization.loads(fin.read())
+
+    return _compile_dict(specification,
+                         options['codec'],
+                         None,
+                         options['numeric_enums'],
+                         options['specialize'],
+                         lazy,
+                         None,
+                         ('saved', path))
 
 
 def pre_process_dict(specification):
@@ -0,0 +1,1995 @@
+"""A hand written ASN.1 parser, used by :func:`asn1tools.parse_string()`
+and :func:`asn1tools.parse_files()` when `backend` is ``'fast'``.
+
+The specification is split into tokens by a regular expression based
+lexer, and the tokens are parsed by a recursive descent parser that
+mirrors the Pyparsing grammar in :mod:`asn1tools.parser`. The parser
+builds the same token trees as the Pyparsing grammar and converts them
+with the same functions, so both backends return identical
+dictionaries.
+
+"""
+
+import re
+
+from pyparsing import ParseException
+from pyparsing import ParseSyntaxException
+from pyparsing import QuotedString
+from pyparsing import printables
+
+from .parser import Tokens
+from .parser import merge_dicts
+from .parser import convert_integer
+from .parser import convert_real_number
+from .parser import convert_bstring
+from .parser import convert_hstring
+from .parser import convert_value_range
+from .parser import convert_inner_type_constraints
+from .parser import convert_size_constraint
+from .parser import convert_permitted_alphabet
+from .parser import convert_module_definition
+from .parser import convert_assignment_list
+from .parser import convert_imports
+from .parser import convert_parameterized_object_set_assignment
+from .parser import convert_parameterized_object_assignment
+from .parser import convert_parameterized_object_class_assignment
+from .parser import convert_parameterized_type_assignment
+from .parser import convert_parameterized_value_assignment
+from .parser import convert_sequence_type
+from .parser import convert_sequence_of_type
+from .parser import convert_set_type
+from .parser import convert_set_of_type
+from .parser import convert_integer_type
+from .parser import convert_real_type
+from .parser import convert_boolean_type
+from .parser import convert_bit_string_type
+from .parser import convert_octet_string_type
+from .parser import convert_null_type
+from .parser import convert_object_identifier_type
+from .parser import convert_enumerated_type
+from .parser import convert_choice_type
+from .parser import convert_defined_type
+from .parser import convert_keyword_type
+from .parser import convert_any_defined_by_type
+from .parser import convert_actual_parameter_list
+from .parser import convert_parameter_list
+
+
+# Token kinds.
+LOWER = 'l'
+UPPER = 'u'
+FIELD = 'f'
+NUMBER = 'n'
+CSTRING = 'c'
+BSTRING = 'b'
+HSTRING = 'h'
+OTHER = 'o'
+EOF = 'e'
+
+TOKEN_RE = re.compile(
+    r"[ \t\r\n]*(?:"
+    r"(?P<comment>--|/\*)"
+    r"|(?P<b>'[01\s]*'B)"
+    r"|(?P<h>'[0-9A-F\s]*'H)"
+    r'|(?P<c>"(?:[^"\r\n/-]|-(?!-)|/(?!\*))*")'
+    r"|(?P<u>[A-Z](?:[a-zA-Z0-9]|-(?!-))*(?![\w$]))"
+    r"|(?P<l>[a-z](?:[a-zA-Z0-9]|-(?!-))*(?![\w$]))"
+    r"|(?P<f>&[A-Za-z](?:[a-zA-Z0-9]|-(?!-))*(?![\w$]))"
+    r"|(?P<n>-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?)"
+    r"|(?P<o>[A-Za-z_$&](?:[\w$]|-(?!-))*"
+    r"|::=|\.\.\.|\.\.|.)"
+    r"|(?P<e>\Z))",
+    re.DOTALL)
+COMMENT_RE = re.compile(r'/\*|\*/|--|\n')
+
+# A Pyparsing word is printable characters except the excluded ones.
+# It never contains a comment.
+WORD_RE = re.compile(r'(?:[{}]|-(?!-)|/(?!\*))+'.format(
+    re.escape(''.join([char
+                       for char in printables
+                       if char not in ',(){}[].:=;"|-/']))))
+INTEGER_RE = re.compile(r'(?:\d|-(?!-))+')
+SIGNED_NUMBER_RE = re.compile(r'-?\d+')
+REAL_NUMBER_RE = re.compile(r'[+-]?\d+\.?\d*([eE][+-]?\d+)?')
+NUMBER_RE = re.compile(r'\d+')
+OBJECT_CLASS_REFERENCE_RE = re.compile(r'[A-Z][A-Z0-9-]*$')
+RESERVED_WORDS = frozenset(['END', 'SEQUENCE', 'ENUMERATED', 'WITH'])
+
+CSTRING_PARSER = QuotedString('"')
+
+TAG_CLASSES = frozenset(['UNIVERSAL', 'APPLICATION', 'PRIVATE'])
+
+CHARACTER_STRING_TYPES = frozenset([
+    'BMPString',
+    'GeneralString',
+    'GraphicString',
+    'IA5String',
+    'ISO646String',
+    'NumericString',
+    'PrintableString',
+    'TeletexString',
+    'UTCTime',
+    'GeneralizedTime',
+    'T61String',
+    'UniversalString',
+    'UTF8String',
+    'VideotexString',
+    'VisibleString'
+])
+
+
+class Backtrack(Exception):
+    """Raised when the tokens at the current position does not match the
+    production being parsed.
+
+    """
+
+
+class Results(list):
+    """The subset of Pyparsing's ``ParseResults`` used by the conversion
+    functions. Like ``ParseResults``, results are only equal to
+    themselves and contains no named results.
+
+    """
+
+    __hash__ = object.__hash__
+
+    def __eq__(self, other):
+        return self is other
+
+    def __ne__(self, other):
+        return self is not other
+
+    def __contains__(self, item):
+        return False
+
+    def asList(self):
+        return [
+            item.asList() if isinstance(item, Results) else item
+            for item in self
+        ]
+
+
+def tokenize(string):
+    """Split given string into tokens, their kinds and their start and
+    end offsets.
+
+    """
+
+    tokens = []
+    kinds = []
+    starts = []
+    ends = []
+    match = TOKEN_RE.match
+    offset = 0
+
+    while True:
+        mo = match(string, offset)
+        kind = mo.lastgroup
+        offset = mo.end()
+
+        if kind == 'comment':
+            offset = skip_comment(string, mo.start(kind))
+            continue
+
+        tokens.append(mo.group(kind))
+        kinds.append(kind)
+        starts.append(mo.start(kind))
+        ends.append(offset)
+
+        if kind == EOF:
+            break
+
+    return tokens, kinds, starts, ends
+
+
+def skip_comment(string, offset):
+    """Returns the offset of the first character after the comment at
+    given offset.
+
+    """
+
+    if string.startswith('--', offset):
+        for mo in COMMENT_RE.finditer(string, offset + 2):
+            kind = mo.group()
+
+            if kind == '--':
+                return mo.end()
+            elif kind == '\n':
+                return mo.start()
+
+        raise ParseSyntaxException(
+            string,
+            offset,
+            'Missing newline or -- for single line comment')
+
+    depth = 1
+
+    for mo in COMMENT_RE.finditer(string, offset + 2):
+        kind = mo.group()
+
+        if kind == '/*':
+            depth += 1
+        elif kind == '*/':
+            depth -= 1
+
+            if depth == 0:
+                return mo.end()
+
+    raise ParseSyntaxException(string,
+                               offset,
+                               'Missing */ for multi line comment')
+
+
+class Parser(object):
+    """A recursive descent parser of ASN.1 specifications. The methods
+    are named after, and parse the same tokens as, the Pyparsing
+    grammar elements in :func:`asn1tools.parser.create_grammar()`.
+
+    """
+
+    def __init__(self, string):
+        self.string = string
+        self.tokens, self.kinds, self.starts, self.ends = tokenize(string)
+        self.pos = 0
+        self.furthest = 0
+
+    def parse(self):
+        try:
+            return self.specification()
+        except Backtrack:
+            offset = self.starts[self.furthest]
+
+            if self.kinds[self.furthest] == EOF:
+                message = 'Unexpected end of text'
+            else:
+                message = "Unexpected '{}'".format(self.tokens[self.furthest])
+
+            raise ParseSyntaxException(self.string, offset, message)
+
+    # Helpers.
+
+    def fail(self):
+        if self.pos > self.furthest:
+            self.furthest = self.pos
+
+        raise Backtrack()
+
+    def accept(self, value):
+        """Consume the current token if it is `value`.
+
+        """
+
+        if self.tokens[self.pos] == value:
+            self.pos += 1
+
+            return True
+
+        return False
+
+    def expect(self, value):
+        if self.tokens[self.pos] != value:
+            self.fail()
+
+        self.pos += 1
+
+        return value
+
+    def is_keyword(self, words):
+        """Returns True if the tokens at the current position is given
+        keyword, possibly of several words separated by exactly one
+        space.
+
+        """
+
+        pos = self.pos
+
+        for i, word in enumerate(words):
+            if self.tokens[pos + i] != word:
+                return False
+
+            if i > 0 and self.starts[pos + i] != self.ends[pos + i - 1] + 1:
+                return False
+
+            if i > 0 and self.string[self.ends[pos + i - 1]] != ' ':
+                return False
+
+        return True
+
+    def keyword(self, value):
+        words = value.split(' ')
+
+        if not self.is_keyword(words):
+            self.fail()
+
+        self.pos += len(words)
+
+        return value
+
+    def accept_keyword(self, value):
+        words = value.split(' ')
+
+        if self.is_keyword(words):
+            self.pos += len(words)
+
+            return value
+
+        return None
+
+    def regex(self, regex):
+        """Match given regular expression at the start of the current
+        token. The match must end at the end of a token.
+
+        """
+
+        pos = self.pos
+        mo = regex.match(self.string, self.starts[pos])
+
+        if not mo:
+            self.fail()
+
+        end = mo.end()
+
+        while self.ends[pos] < end:
+            if self.starts[pos + 1] != self.ends[pos]:
+                self.fail()
+
+            pos += 1
+
+        if self.ends[pos] != end:
+            self.fail()
+
+        self.pos = pos + 1
+
+        return mo.group()
+
+    def action(self, function, start, tokens):
+        """Call given conversion function with given tokens, the same way
+        Pyparsing calls parse actions.
+
+        """
+
+        tokens = Results(tokens)
+
+        try:
+            converted = function(self.string, self.starts[start], tokens)
+        except (ParseException, IndexError):
+            self.pos = start
+            self.fail()
+
+        if converted is None:
+            return list(tokens)
+        elif converted is tokens:
+            return list(tokens)
+        else:
+            return [converted]
+
+    def optional(self, method, *args):
+        """Returns the tokens of given production, or an empty list if it
+        does not match.
+
+        """
+
+        pos = self.pos
+
+        try:
+            return method(*args)
+        except Backtrack:
+            self.pos = pos
+
+            return []
+
+    def first(self, *methods):
+        """Returns the tokens of the first matching production.
+
+        """
+
+        pos = self.pos
+
+        for method in methods:
+            try:
+                return method()
+            except Backtrack:
+                self.pos = pos
+
+        self.fail()
+
+    def delimited_list(self, method, delimiters=(',', )):
+        tokens = method()
+
+        while self.tokens[self.pos] in delimiters:
+            pos = self.pos
+            self.pos += 1
+
+            try:
+                tokens += method()
+            except Backtrack:
+                self.pos = pos
+                break
+
+        return tokens
+
+    def one_or_more(self, method):
+        tokens = method()
+        tokens += self.zero_or_more(method)
+
+        return tokens
+
+    def zero_or_more(self, method):
+        tokens = []
+
+        while True:
+            pos = self.pos
+
+            try:
+                tokens += method()
+            except Backtrack:
+                self.pos = pos
+                break
+
+        return tokens
+
+    def group(self, method):
+        return [Results(method())]
+
+    def is_reserved(self, pos):
+        if self.tokens[pos] not in RESERVED_WORDS:
+            return False
+
+        end = self.ends[pos]
+
+        if end == len(self.string):
+            return True
+
+        char = self.string[end]
+
+        return (char.isspace()
+                or self.string.startswith('--', end)
+                or self.string.startswith('/*', end))
+
+    # Lexical items.
+
+    def identifier(self):
+        if self.kinds[self.pos] != LOWER:
+            self.fail()
+
+        self.pos += 1
+
+        return [self.tokens[self.pos - 1]]
+
+    value_reference = identifier
+
+    def type_reference(self):
+        if self.kinds[self.pos] != UPPER or self.is_reserved(self.pos):
+            self.fail()
+
+        self.pos += 1
+
+        return [self.tokens[self.pos - 1]]
+
+    module_reference = type_reference
+    object_set_reference = type_reference
+    defined_object_set = type_reference
+
+    def object_class_reference(self):
+        token = self.tokens[self.pos]
+
+        if (self.kinds[self.pos] != UPPER
+            or not OBJECT_CLASS_REFERENCE_RE.match(token)
+            or self.is_reserved(self.pos)):
+            self.fail()
+
+        self.pos += 1
+
+        return [token]
+
+    defined_object_class = object_class_reference
+
+    def word(self):
+        return [self.regex(WORD_RE)]
+
+    def number(self):
+        token = self.regex(NUMBER_RE)
+
+        if self.tokens[self.pos].startswith('.'):
+            self.pos -= 1
+            self.fail()
+
+        return [token]
+
+    def signed_number(self):
+        start = self.pos
+        number = self.regex(SIGNED_NUMBER_RE)
+
+        if self.tokens[self.pos].startswith('.'):
+            self.pos = start
+            self.fail()
+
+        return self.action(convert_integer, start, [number])
+
+    def integer(self):
+        start = self.pos
+
+        return self.action(convert_integer,
+                           start,
+                           [self.regex(INTEGER_RE)])
+
+    def real_number(self):
+        start = self.pos
+
+        return self.action(convert_real_number,
+                           start,
+                           [self.regex(REAL_NUMBER_RE)])
+
+    def bstring(self):
+        if self.kinds[self.pos] != BSTRING:
+            self.fail()
+
+        self.pos += 1
+
+        return self.action(convert_bstring,
+                           self.pos - 1,
+                           [self.tokens[self.pos - 1]])
+
+    def hstring(self):
+        if self.kinds[self.pos] != HSTRING:
+            self.fail()
+
+        self.pos += 1
+
+        return self.action(convert_hstring,
+                           self.pos - 1,
+                           [self.tokens[self.pos - 1]])
+
+    def cstring(self):
+        if self.kinds[self.pos] != CSTRING:
+            self.fail()
+
+        token = self.tokens[self.pos]
+        self.pos += 1
+
+        if '\\' in token:
+            return [CSTRING_PARSER.parseString(token)[0]]
+        else:
+            return [token[1:-1]]
+
+    def field_reference(self, kind):
+        token = self.tokens[self.pos]
+
+        if self.kinds[self.pos] != FIELD or token[1:2].isupper() != (kind == UPPER):
+            self.fail()
+
+        if kind == UPPER and token[1:] in RESERVED_WORDS:
+            if self.is_reserved(self.pos):
+                self.fail()
+
+        self.pos += 1
+
+        return [token]
+
+    def type_field_reference(self):
+        return self.field_reference(UPPER)
+
+    def value_field_reference(self):
+        return self.field_reference(LOWER)
+
+    def primitive_field_name(self):
+        return self.first(self.type_field_reference,
+                          self.value_field_reference)
+
+    field_name = primitive_field_name
+
+    def adjacent(self):
+        """Returns True if the current token immediately follows the
+        previous token.
+
+        """
+
+        return self.starts[self.pos] == self.ends[self.pos - 1]
+
+    # Tags.
+
+    def tag(self):
+        if self.tokens[self.pos] != '[':
+            return [Results()]
+
+        self.pos += 1
+        tokens = []
+
+        if self.tokens[self.pos] in TAG_CLASSES:
+            tokens.append(self.tokens[self.pos])
+            self.pos += 1
+
+        tokens += self.class_number()
+        self.expect(']')
+
+        if self.tokens[self.pos] in ['IMPLICIT', 'EXPLICIT']:
+            kind = [self.tokens[self.pos]]
+            self.pos += 1
+        else:
+            kind = []
+
+        return [Results([Results(tokens), Results(kind)])]
+
+    def class_number(self):
+        return self.first(self.number, self.defined_value)
+
+    # Parameterization.
+
+    def parameter_list(self):
+        start = self.pos
+        tokens = []
+
+        if self.tokens[self.pos] == '{':
+            try:
+                self.pos += 1
+                tokens = self.delimited_list(self.parameter)
+                self.expect('}')
+            except Backtrack:
+                self.pos = start
+                tokens = []
+
+        return self.action(convert_parameter_list, start, [Results(tokens)])
+
+    def parameter(self):
+        pos = self.pos
+
+        try:
+            self.first(self.type_, self.defined_object_class, self.reference)
+            self.expect(':')
+        except Backtrack:
+            self.pos = pos
+
+        return self.reference()
+
+    def actual_parameter_list(self):
+        start = self.pos
+        self.expect('{')
+        tokens = self.delimited_list(self.actual_parameter)
+        self.expect('}')
+
+        return self.action(convert_actual_parameter_list,
+                           start,
+                           [Results(tokens)])
+
+    def actual_parameter(self):
+        return self.group(lambda: self.first(self.type_,
+                                             self.value,
+                                             self.defined_object_class,
+                                             self.object_,
+                                             self.object_set))
+
+    # Constraints.
+
+    def constraint(self):
+        self.expect('(')
+        tokens = self.constraint_spec()
+        self.expect(')')
+
+        return tokens
+
+    def constraint_spec(self):
+        return self.first(self.general_constraint, self.element_set_specs)
+
+    def general_constraint(self):
+        token = self.tokens[self.pos]
+
+        if token == 'CONSTRAINED':
+            return self.user_defined_constraint()
+        elif token == '{':
+            return self.first(self.component_relation_constraint,
+                              self.object_set)
+        elif token == 'CONTAINING':
+            self.pos += 1
+
+            return ['CONTAINING'] + self.type_()
+        elif token == 'ENCODED_BY':
+            self.pos += 1
+
+            return ['ENCODED_BY'] + self.value()
+
+        self.fail()
+
+    def user_defined_constraint(self):
+        tokens = [self.keyword('CONSTRAINED BY'), self.expect('{')]
+        tokens += self.optional(self.delimited_list,
+                                self.user_defined_constraint_parameter)
+        tokens.append(self.expect('}'))
+
+        return tokens
+
+    def user_defined_constraint_parameter(self):
+        pos = self.pos
+
+        try:
+            tokens = self.first(self.type_, self.defined_object_class)
+            tokens.append(self.expect(':'))
+            tokens += self.first(self.value, self.object_, self.object_set)
+
+            return tokens
+        except Backtrack:
+            self.pos = pos
+
+        return self.first(self.type_, self.defined_object_class)
+
+    def component_relation_constraint(self):
+        self.expect('{')
+        defined_object_set = self.defined_object_set()
+        self.expect('}')
+        self.expect('{')
+        at_notations = self.delimited_list(self.at_notation)
+        self.expect('}')
+
+        return [
+            '{',
+            Results([Results(defined_object_set)]),
+            '}',
+            '{',
+            Results(at_notations),
+            '}'
+        ]
+
+    def at_notation(self):
+        self.expect('@')
+
+        if self.kinds[self.pos] == LOWER:
+            return self.identifier()
+
+        level = []
+
+        while self.tokens[self.pos] in ['.', '..', '...']:
+            if level and not self.adjacent():
+                self.fail()
+
+            level.append(self.tokens[self.pos])
+            self.pos += 1
+
+        if not level or not self.adjacent():
+            self.fail()
+
+        return [''.join(level) + self.identifier()[0]]
+
+    def element_set_specs(self):
+        tokens = self.element_set_spec()
+
+        if self.tokens[self.pos] == ',' and self.tokens[self.pos + 1] == '...':
+            self.pos += 2
+            tokens.append('...')
+
+            if self.tokens[self.pos] == ',':
+                pos = self.pos
+                self.pos += 1
+
+                try:
+                    tokens += self.element_set_spec()
+                except Backtrack:
+                    self.pos = pos
+
+        return tokens
+
+    def element_set_spec(self):
+        if self.tokens[self.pos] == 'ALL':
+            pos = self.pos
+
+            try:
+                self.pos += 1
+                self.expect('EXCEPT')
+                self.elements()
+
+                return []
+            except Backtrack:
+                self.pos = pos
+
+        return self.delimited_list(self.elements,
+                                   ('|', 'UNION', '^', 'INTERSECTION'))
+
+    def elements(self):
+        return self.group(lambda: self.first(self.subtype_elements,
+                                             self.object_set_elements,
+                                             self.parenthesized_elements))
+
+    def parenthesized_elements(self):
+        tokens = [self.expect('(')]
+        tokens += self.element_set_spec()
+        tokens.append(self.expect(')'))
+
+        return tokens
+
+    def subtype_elements(self):
+        token = self.tokens[self.pos]
+
+        if token == 'SIZE':
+            return self.size_constraint()
+        elif token == 'FROM':
+            start = self.pos
+            self.pos += 1
+
+            return self.action(convert_permitted_alphabet,
+                               start,
+                               ['FROM'] + self.constraint())
+
+        return self.first(self.value_range,
+                          self.inner_type_constraints,
+                          self.value,
+                          self.pattern_constraint,
+                          self.contained_subtype)
+
+    def size_constraint(self):
+        start = self.pos
+        self.keyword('SIZE')
+
+        return self.action(convert_size_constraint,
+                           start,
+                           ['SIZE', Results(self.constraint())])
+
+    def value_range(self):
+        start = self.pos
+        tokens = None
+
+        # Combine(integer + dot) + Suppress(range_separator)
+        if self.tokens[self.pos + 1] == '...':
+            try:
+                tokens = self.integer()
+
+                if not self.adjacent():
+                    self.fail()
+
+                self.pos += 1
+                tokens = [str(tokens[0]) + '.']
+            except Backtrack:
+                self.pos = start
+                tokens = None
+
+        if tokens is None:
+            try:
+                tokens = self.integer()
+                self.expect('..')
+            except Backtrack:
+                self.pos = start
+                tokens = self.first(self.value, self.min_)
+
+                if self.tokens[self.pos] == '<':
+                    tokens.append('<')
+                    self.pos += 1
+
+                self.expect('..')
+
+        if self.tokens[self.pos] == '<':
+            tokens.append('<')
+            self.pos += 1
+
+        tokens += self.first(self.value, self.max_)
+
+        return self.action(convert_value_range, start, tokens)
+
+    def min_(self):
+        return [self.expect('MIN')]
+
+    def max_(self):
+        return [self.expect('MAX')]
+
+    def inner_type_constraints(self):
+        start = self.pos
+
+        if self.accept_keyword('WITH COMPONENT'):
+            tokens = ['WITH COMPONENT'] + self.constraint()
+        else:
+            tokens = [self.keyword('WITH COMPONENTS')]
+            tokens += self.first(self.full_specification,
+                                 self.partial_specification)
+
+        return self.action(convert_inner_type_constraints, start, tokens)
+
+    def full_specification(self):
+        self.expect('{')
+        tokens = self.type_constraints()
+        self.expect('}')
+
+        return ['{', Results(tokens), '}']
+
+    def partial_specification(self):
+        self.expect('{')
+        self.expect('...')
+        self.expect(',')
+        tokens = ['...'] + self.type_constraints()
+        self.expect('}')
+
+        return ['{', Results(tokens), '}']
+
+    def type_constraints(self):
+        return self.delimited_list(self.named_constraint)
+
+    def named_constraint(self):
+        tokens = self.identifier()
+
+        if self.tokens[self.pos] == '(':
+            tokens += self.optional(self.constraint)
+
+        if self.tokens[self.pos] in ['PRESENT', 'ABSENT', 'OPTIONAL']:
+            tokens.append(self.tokens[self.pos])
+            self.pos += 1
+
+        return [Results(tokens)]
+
+    def pattern_constraint(self):
+        return [self.expect('PATTERN')] + self.value()
+
+    def contained_subtype(self):
+        tokens = []
+
+        if self.accept('INCLUDES'):
+            tokens.append('INCLUDES')
+
+        return tokens + self.type_()
+
+    # Types.
+
+    def type_(self):
+        pos = self.pos
+
+        try:
+            tokens = self.builtin_type()
+        except Backtrack:
+            self.pos = pos
+
+            if self.is_keyword(['ANY', 'DEFINED', 'BY']):
+                try:
+                    tokens = self.any_defined_by_type()
+                except Backtrack:
+                    self.pos = pos
+                    tokens = self.defined_type()
+            else:
+                tokens = self.defined_type()
+
+        constraints = []
+
+        while self.tokens[self.pos] == '(':
+            pos = self.pos
+
+            try:
+                constraints += self.constraint()
+            except Backtrack:
+                self.pos = pos
+                break
+
+        return [Results([tokens[0], Results(constraints)])]
+
+    def builtin_type(self):
+        token = self.tokens[self.pos]
+        start = self.pos
+
+        if token == 'CHOICE':
+            return self.choice_type()
+        elif token == 'INTEGER':
+            return self.integer_type()
+        elif token == 'NULL':
+            self.pos += 1
+
+            return self.action(convert_null_type, start, ['NULL'])
+        elif token == 'REAL':
+            self.pos += 1
+
+            return self.action(convert_real_type, start, ['REAL'])
+        elif token == 'BIT':
+            return self.bit_string_type()
+        elif token == 'OCTET':
+            self.keyword('OCTET STRING')
+
+            return self.action(convert_octet_string_type,
+                               start,
+                               ['OCTET STRING'])
+        elif token == 'ENUMERATED':
+            return self.enumerated_type()
+        elif token == 'SEQUENCE':
+            try:
+                return self.sequence_of_type()
+            except Backtrack:
+                self.pos = start
+
+                return self.sequence_type()
+        elif token == 'SET':
+            try:
+                return self.set_of_type()
+            except Backtrack:
+                self.pos = start
+
+                return self.set_type()
+        elif token == 'OBJECT':
+            return self.object_identifier_type()
+        elif token == 'BOOLEAN':
+            self.pos += 1
+
+            return self.action(convert_boolean_type, start, ['BOOLEAN'])
+        elif token in CHARACTER_STRING_TYPES:
+            self.pos += 1
+
+            return self.action(convert_keyword_type, start, [token])
+        elif token == 'CHARACTER':
+            self.keyword('CHARACTER STRING')
+
+            return self.action(convert_keyword_type,
+                               start,
+                               ['CHARACTER STRING'])
+
+        return self.object_class_field_type()
+
+    def object_class_field_type(self):
+        start = self.pos
+        tokens = self.defined_object_class()
+
+        if self.tokens[self.pos] != '.' or not self.adjacent():
+            self.fail()
+
+        self.pos += 1
+
+        if not self.adjacent():
+            self.fail()
+
+        tokens += ['.'] + self.field_name()
+
+        return self.action(convert_keyword_type, start, [''.join(tokens)])
+
+    def any_defined_by_type(self):
+        start = self.pos
+        tokens = [self.keyword('ANY DEFINED BY')] + self.word()
+
+        return self.action(convert_any_defined_by_type, start, tokens)
+
+    def defined_type(self):
+        start = self.pos
+
+        if self.tokens[self.pos + 1] == '.' and self.kinds[self.pos] == UPPER:
+            try:
+                tokens = self.module_reference()
+                tokens.append(self.expect('.'))
+                tokens += self.type_reference()
+
+                return self.action(convert_defined_type, start, tokens)
+            except Backtrack:
+                self.pos = start
+
+        tokens = self.type_reference()
+
+        if self.tokens[self.pos] == '{':
+            tokens += self.optional(self.actual_parameter_list)
+
+        return self.action(convert_defined_type, start, tokens)
+
+    def integer_type(self):
+        start = self.pos
+        self.expect('INTEGER')
+        named_numbers = []
+
+        if self.tokens[self.pos] == '{':
+            pos = self.pos
+
+            try:
+                self.pos += 1
+                named_numbers = self.delimited_list(self.named_number)
+                self.expect('}')
+            except Backtrack:
+                self.pos = pos
+                named_numbers = []
+
+        return self.action(convert_integer_type,
+                           start,
+                           ['INTEGER', Results(named_numbers)])
+
+    def named_number(self):
+        tokens = self.identifier()
+        tokens.append(self.expect('('))
+        tokens += self.first(self.signed_number, self.defined_value)
+        tokens.append(self.expect(')'))
+
+        return [Results(tokens)]
+
+    def bit_string_type(self):
+        start = self.pos
+        self.keyword('BIT STRING')
+        named_bits = []
+
+        if self.tokens[self.pos] == '{':
+            pos = self.pos
+
+            try:
+                self.pos += 1
+                named_bits = self.delimited_list(self.named_bit)
+                self.expect('}')
+            except Backtrack:
+                self.pos = pos
+                named_bits = []
+
+        return self.action(convert_bit_string_type,
+                           start,
+                           ['BIT STRING', Results(named_bits)])
+
+    def named_bit(self):
+        tokens = self.word()
+        self.expect('(')
+        tokens += self.word()
+        self.expect(')')
+
+        return [Results(tokens)]
+
+    def object_identifier_type(self):
+        start = self.pos
+        tokens = [self.keyword('OBJECT IDENTIFIER')]
+
+        if self.tokens[self.pos] == '(':
+            pos = self.pos
+
+            try:
+                self.pos += 1
+                words = self.delimited_list(self.word, ('|', ))
+                tokens += ['('] + words + [self.expect(')')]
+            except Backtrack:
+                self.pos = pos
+                del tokens[1:]
+
+        return self.action(convert_object_identifier_type, start, tokens)
+
+    def enumerated_type(self):
+        start = self.pos
+        self.expect('ENUMERATED')
+        self.expect('{')
+        root = self.delimited_list(self.enumeration_item)
+        extension = []
+
+        if self.tokens[self.pos] == ',' and self.tokens[self.pos + 1] == '...':
+            self.pos += 2
+            extension = [Results()]
+
+            if self.tokens[self.pos] == ',':
+                self.pos += 1
+                extension += self.delimited_list(self.enumeration_item)
+
+        self.expect('}')
+
+        return self.action(convert_enumerated_type,
+                           start,
+                           ['ENUMERATED',
+                            '{',
+                            Results([Results(root), Results(extension)]),
+                            '}'])
+
+    def enumeration_item(self):
+        pos = self.pos
+
+        try:
+            return self.named_number()
+        except Backtrack:
+            self.pos = pos
+
+        return self.identifier()
+
+    def choice_type(self):
+        start = self.pos
+        self.expect('CHOICE')
+        self.expect('{')
+        alternatives = self.alternative_type_lists()
+        self.expect('}')
+
+        return self.action(convert_choice_type,
+                           start,
+                           ['CHOICE', '{', Results(alternatives), '}'])
+
+    def alternative_type_lists(self):
+        tokens = self.delimited_list(self.named_type)
+
+        if self.tokens[self.pos] == ',' and self.tokens[self.pos + 1] == '...':
+            pos = self.pos
+
+            try:
+                self.pos += 1
+                tokens += self.extension_and_exception()
+
+                if self.tokens[self.pos] == ',':
+                    tokens += self.optional(self.extension_addition_alternatives)
+
+                tokens += self.optional_extension_marker()
+            except Backtrack:
+                self.pos = pos
+
+        return tokens
+
+    def extension_addition_alternatives(self):
+        self.expect(',')
+
+        return self.delimited_list(self.extension_addition_alternative)
+
+    def extension_addition_alternative(self):
+        if self.is_version_brackets('['):
+            pos = self.pos
+
+            try:
+                self.pos += 2
+                self.version_number()
+                tokens = self.delimited_list(self.named_type)
+                self.expect_version_brackets(']')
+
+                return [Results(['[[', Results(tokens), ']]'])]
+            except Backtrack:
+                self.pos = pos
+
+        return self.named_type()
+
+    def is_version_brackets(self, bracket):
+        return (self.tokens[self.pos] == bracket
+                and self.tokens[self.pos + 1] == bracket
+                and self.starts[self.pos + 1] == self.ends[self.pos])
+
+    def expect_version_brackets(self, bracket):
+        if not self.is_version_brackets(bracket):
+            self.fail()
+
+        self.pos += 2
+
+    def version_number(self):
+        pos = self.pos
+
+        try:
+            self.number()
+            self.expect(':')
+        except Backtrack:
+            self.pos = pos
+
+    def named_type(self):
+        tokens = self.identifier()
+        tokens += self.tag()
+        tokens += self.type_()
+
+        return [Results(tokens)]
+
+    def sequence_of_type(self):
+        return self.x_of_type('SEQUENCE', convert_sequence_of_type)
+
+    def set_of_type(self):
+        return self.x_of_type('SET', convert_set_of_type)
+
+    def x_of_type(self, keyword, convert):
+        start = self.pos
+        self.expect(keyword)
+        constraint = []
+
+        if self.tokens[self.pos] == '(':
+            pos = self.pos
+
+            try:
+                constraint = self.group(self.size_constraint)
+            except Backtrack:
+                self.pos = pos
+                constraint = self.optional(self.constraint)
+        elif self.tokens[self.pos] == 'SIZE':
+            pos = self.pos
+
+            try:
+                constraint = self.group(self.size_constraint)
+            except Backtrack:
+                self.pos = pos
+
+        tokens = [keyword, Results(constraint), self.expect('OF')]
+
+        if self.kinds[self.pos] == LOWER:
+            tokens += self.identifier()
+
+        tokens += self.tag()
+        tokens += self.type_()
+
+        return self.action(convert, start, tokens)
+
+    def sequence_type(self):
+        return self.x_type('SEQUENCE', convert_sequence_type)
+
+    def set_type(self):
+        return self.x_type('SET', convert_set_type)
+
+    def x_type(self, keyword, convert):
+        start = self.pos
+        self.expect(keyword)
+        self.expect('{')
+        pos = self.pos
+
+        try:
+            members = self.component_type_lists()
+        except Backtrack:
+            self.pos = pos
+
+            try:
+                members = self.extension_and_exception()
+                members += self.optional_extension_marker()
+            except Backtrack:
+                self.pos = pos
+                members = []
+
+        self.expect('}')
+
+        return self.action(convert,
+                           start,
+                           [keyword, '{', Results(members), '}'])
+
+    def component_type_lists(self):
+        pos = self.pos
+
+        try:
+            tokens = self.delimited_list(self.component_type)
+        except Backtrack:
+            self.pos = pos
+            tokens = self.extension_and_exception()
+            tokens += self.component_type_lists_extension()
+
+            return tokens
+
+        if self.tokens[self.pos] == ',':
+            pos = self.pos
+
+            try:
+                self.pos += 1
+                extension = self.extension_and_exception()
+                extension += self.component_type_lists_extension()
+                tokens += extension
+            except Backtrack:
+                self.pos = pos
+
+        return tokens
+
+    def component_type_lists_extension(self):
+        tokens = []
+
+        if self.tokens[self.pos] == ',':
+            tokens += self.optional(self.extension_additions)
+
+        pos = self.pos
+
+        try:
+            self.expect(',')
+            self.expect('...')
+            self.expect(',')
+            tokens += ['...'] + self.delimited_list(self.component_type)
+        except Backtrack:
+            self.pos = pos
+            tokens += self.optional_extension_marker()
+
+        return tokens
+
+    def extension_additions(self):
+        self.expect(',')
+
+        return self.delimited_list(self.extension_addition)
+
+    def extension_addition(self):
+        pos = self.pos
+
+        try:
+            return self.component_type()
+        except Backtrack:
+            self.pos = pos
+
+        self.expect_version_brackets('[')
+        self.version_number()
+        tokens = self.delimited_list(self.component_type)
+        self.expect_version_brackets(']')
+
+        return [Results(['[[', Results(tokens), ']]'])]
+
+    def extension_and_exception(self):
+        self.expect('...')
+
+        return ['...']
+
+    def optional_extension_marker(self):
+        if self.tokens[self.pos] == ',' and self.tokens[self.pos + 1] == '...':
+            self.pos += 2
+
+            return ['...']
+
+        return []
+
+    def component_type(self):
+        pos = self.pos
+
+        try:
+            tokens = self.named_type()
+            qualifiers = []
+
+            if self.tokens[self.pos] == 'OPTIONAL':
+                self.pos += 1
+                qualifiers = ['OPTIONAL']
+            elif self.tokens[self.pos] == 'DEFAULT':
+                qualifiers_pos = self.pos
+
+                try:
+                    self.pos += 1
+                    qualifiers = ['DEFAULT'] + self.value()
+                except Backtrack:
+                    self.pos = qualifiers_pos
+
+            return [Results(tokens + [Results(qualifiers)])]
+        except Backtrack:
+            self.pos = pos
+
+        tokens = [self.keyword('COMPONENTS OF')]
+        tokens += self.type_()
+
+        return [Results(tokens)]
+
+    # Values.
+
+    def value(self):
+        pos = self.pos
+
+        if self.kinds[pos] == UPPER:
+            try:
+                tokens = self.type_()
+                tokens.append(self.expect(':'))
+                tokens += self.value()
+
+                return [Results(tokens)]
+            except Backtrack:
+                self.pos = pos
+
+        return [Results(self.builtin_value())]
+
+    def builtin_value(self):
+        kind = self.kinds[self.pos]
+        token = self.tokens[self.pos]
+
+        if kind == BSTRING or kind == HSTRING:
+            return self.bit_string_value()
+        elif kind == CSTRING:
+            return self.cstring()
+        elif kind == LOWER:
+            pos = self.pos
+
+            try:
+                tokens = self.identifier()
+                tokens.append(self.expect(':'))
+                tokens += self.value()
+
+                return tokens
+            except Backtrack:
+                self.pos = pos
+
+            return self.identifier()
+        elif kind == NUMBER or token in ['-', '+']:
+            return self.real_number()
+        elif token == '{':
+            return self.first(self.bit_string_value,
+                              self.character_string_list,
+                              self.quadruple,
+                              self.tuple_,
+                              self.relative_oid_value,
+                              self.sequence_value,
+                              self.object_identifier_value)
+        elif token == 'CONTAINING':
+            return self.bit_string_value()
+        elif token in ['TRUE', 'FALSE', 'NULL', 'PLUS-INFINITY', 'MINUS-INFINITY']:
+            self.pos += 1
+
+            return [token]
+
+        self.fail()
+
+    def bit_string_value(self):
+        kind = self.kinds[self.pos]
+
+        if kind == BSTRING:
+            tokens = self.bstring()
+        elif kind == HSTRING:
+            tokens = self.hstring()
+        elif self.accept('CONTAINING'):
+            tokens = ['CONTAINING'] + self.value()
+        else:
+            self.expect('{')
+            identifiers = []
+
+            if self.kinds[self.pos] == LOWER:
+                identifiers = self.delimited_list(self.identifier)
+
+            self.expect('}')
+            tokens = [Tokens('IdentifierList', identifiers)]
+
+        return [Tokens('BitStringValue', tokens)]
+
+    def character_string_list(self):
+        tokens = [self.expect('{')]
+        tokens += self.delimited_list(self.chars_defn)
+        tokens.append(self.expect('}'))
+
+        return tokens
+
+    def chars_defn(self):
+        return self.first(self.cstring,
+                          self.quadruple,
+                          self.tuple_,
+                          self.defined_value)
+
+    def quadruple(self):
+        tokens = [self.expect('{')]
+        tokens += self.number()
+
+        for _ in range(3):
+            tokens.append(self.expect(','))
+            tokens += self.number()
+
+        tokens.append(self.expect('}'))
+
+        return tokens
+
+    def tuple_(self):
+        tokens = [self.expect('{')]
+        tokens += self.number()
+        tokens.append(self.expect(','))
+        tokens += self.number()
+        tokens.append(self.expect('}'))
+
+        return tokens
+
+    def relative_oid_value(self):
+        self.expect('{')
+        tokens = self.one_or_more(self.relative_oid_component)
+        self.expect('}')
+
+        return tokens
+
+    def relative_oid_component(self):
+        return self.group(lambda: self.first(self.number_form,
+                                             self.name_and_number_form))
+
+    def sequence_value(self):
+        tokens = [self.expect('{')]
+
+        if self.kinds[self.pos] == LOWER:
+            tokens += self.optional(self.delimited_list, self.named_value)
+
+        tokens.append(self.expect('}'))
+
+        return tokens
+
+    def named_value(self):
+        return self.identifier() + self.value()
+
+    def object_identifier_value(self):
+        pos = self.pos
+        self.expect('{')
+
+        try:
+            tokens = self.one_or_more(self.obj_id_components)
+            self.expect('}')
+
+            return tokens
+        except Backtrack:
+            self.pos = pos
+
+        self.expect('{')
+        tokens = self.defined_value()
+        tokens += self.one_or_more(self.obj_id_components)
+        self.expect('}')
+
+        return tokens
+
+    def obj_id_components(self):
+        return self.group(lambda: self.first(self.name_and_number_form,
+                                             self.defined_value,
+                                             self.number_form))
+
+    def name_and_number_form(self):
+        tokens = self.identifier()
+        self.expect('(')
+        tokens += self.number_form()
+        self.expect(')')
+
+        return tokens
+
+    def number_form(self):
+        return self.first(self.number, self.defined_value)
+
+    def defined_value(self):
+        start = self.pos
+
+        if self.tokens[self.pos + 1] == '.' and self.kinds[self.pos] == UPPER:
+            try:
+                tokens = self.module_reference()
+                tokens.append(self.expect('.'))
+                tokens += self.value_reference()
+
+                return tokens
+            except Backtrack:
+                self.pos = start
+
+        tokens = self.value_reference()
+
+        if self.tokens[self.pos] == '{':
+            tokens += self.optional(self.actual_parameter_list)
+
+        return tokens
+
+    # Information objects.
+
+    def object_class_defn(self):
+        self.expect('CLASS')
+        self.expect('{')
+        fields = self.delimited_list(self.field_spec)
+        self.expect('}')
+        tokens = ['CLASS', Results(fields)]
+
+        if self.is_keyword(['WITH', 'SYNTAX']):
+            self.pos += 2
+            tokens.append('WITH SYNTAX')
+            tokens += self.syntax_list()
+
+        return tokens
+
+    def field_spec(self):
+        return self.group(lambda: self.first(self.type_field_spec,
+                                             self.fixed_type_value_field_spec))
+
+    def type_field_spec(self):
+        tokens = self.type_field_reference()
+
+        if self.accept('OPTIONAL'):
+            tokens.append('OPTIONAL')
+        elif self.accept('DEFAULT'):
+            tokens.append('DEFAULT')
+            tokens += self.type_()
+
+        return tokens
+
+    def fixed_type_value_field_spec(self):
+        tokens = self.value_field_reference()
+        tokens += self.type_()
+
+        if self.accept('UNIQUE'):
+            tokens.append('UNIQUE')
+
+        if self.accept('OPTIONAL'):
+            tokens.append('OPTIONAL')
+        elif self.accept('DEFAULT'):
+            tokens.append('DEFAULT')
+            tokens += self.value()
+
+        return tokens
+
+    def syntax_list(self):
+        tokens = [self.expect('{')]
+        tokens += self.one_or_more(self.token_or_group_spec)
+        tokens.append(self.expect('}'))
+
+        return tokens
+
+    def token_or_group_spec(self):
+        return self.first(self.literal,
+                          self.primitive_field_name,
+                          self.optional_group)
+
+    def optional_group(self):
+        tokens = [self.expect('[')]
+        tokens += self.one_or_more(self.token_or_group_spec)
+        tokens.append(self.expect(']'))
+
+        return tokens
+
+    def literal(self):
+        if self.tokens[self.pos] == ',':
+            self.pos += 1
+
+            return [',']
+
+        return self.word()
+
+    def setting(self):
+        return self.first(self.type_,
+                          self.value,
+                          self.object_,
+                          self.object_set,
+                          self.cstring)
+
+    def object_(self):
+        return self.group(lambda: self.first(self.default_syntax,
+                                             self.defined_syntax))
+
+    def default_syntax(self):
+        self.expect('{')
+        tokens = self.delimited_list(self.field_setting)
+        self.expect('}')
+
+        return tokens
+
+    def field_setting(self):
+        return self.group(lambda: self.primitive_field_name() + self.setting())
+
+    def defined_syntax(self):
+        tokens = [self.expect('{')]
+        tokens += self.zero_or_more(self.defined_syntax_token)
+        tokens.append(self.expect('}'))
+
+        return tokens
+
+    def defined_syntax_token(self):
+        return self.first(self.literal, self.setting)
+
+    def object_set(self):
+        self.expect('{')
+        tokens = self.object_set_spec()
+        self.expect('}')
+
+        return ['{', Results(tokens), '}']
+
+    def object_set_spec(self):
+        pos = self.pos
+
+        try:
+            tokens = self.element_set_spec()
+            tokens += self.optional(self.object_set_extension)
+
+            return tokens
+        except Backtrack:
+            self.pos = pos
+
+        tokens = [self.expect('...')]
+        tokens += self.optional(self.additional_object_set_spec)
+
+        return tokens
+
+    def object_set_extension(self):
+        tokens = [self.expect(','), self.expect('...')]
+        tokens += self.optional(self.additional_object_set_spec)
+
+        return tokens
+
+    def additional_object_set_spec(self):
+        return [self.expect(',')] + self.element_set_spec()
+
+    def object_set_elements(self):
+        return self.first(self.object_, self.defined_object_set)
+
+    def reference(self):
+        if self.kinds[self.pos] == UPPER:
+            return self.type_reference()
+
+        return self.value_reference()
+
+    # Modules.
+
+    def specification(self):
+        modules = [self.module_definition()]
+
+        while self.kinds[self.pos] != EOF:
+            modules.append(self.module_definition())
+
+        return merge_dicts(modules)
+
+    def module_definition(self):
+        start = self.pos
+        module_identifier = self.module_reference()
+        module_identifier.append(self.definitive_identifier())
+        self.keyword('DEFINITIONS')
+        module_identifier.append(Results(self.tag_default()))
+
+        if self.accept_keyword('EXTENSIBILITY IMPLIED'):
+            module_identifier.append(Results(['EXTENSIBILITY IMPLIED']))
+        else:
+            module_identifier.append(Results())
+
+        self.expect('::=')
+        self.expect('BEGIN')
+        module_body = self.module_body()
+        self.expect('END')
+
+        return convert_module_definition(
+            self.string,
+            self.starts[start],
+            Results([Results(module_identifier), Results([module_body])]))
+
+    def definitive_identifier(self):
+        components = []
+
+        if self.accept('{'):
+            components = self.one_or_more(self.definitive_obj_id_component)
+            self.expect('}')
+
+        return Results(components)
+
+    def definitive_obj_id_component(self):
+        pos = self.pos
+
+        if self.kinds[self.pos] == LOWER:
+            try:
+                tokens = self.identifier()
+                self.expect('(')
+                tokens += self.number()
+                self.expect(')')
+
+                return [Results(tokens)]
+            except Backtrack:
+                self.pos = pos
+
+            return [Results(self.identifier())]
+
+        return [Results(self.number())]
+
+    def tag_default(self):
+        if (self.tokens[self.pos] in ['AUTOMATIC', 'EXPLICIT', 'IMPLICIT']
+            and self.tokens[self.pos + 1] == 'TAGS'):
+            self.pos += 2
+
+            return [self.tokens[self.pos - 2], 'TAGS']
+
+        return []
+
+    def module_body(self):
+        self.exports()
+        imports = self.imports()
+        assignments = self.assignment_list()
+
+        return merge_dicts([imports, assignments])
+
+    def exports(self):
+        if self.tokens[self.pos] != 'EXPORTS':
+            return
+
+        pos = self.pos
+        self.pos += 1
+
+        if not self.accept('ALL'):
+            self.one_or_more(self.symbol_list)
+
+        if not self.accept(';'):
+            self.pos = pos
+
+    def imports(self):
+        start = self.pos
+        symbols = []
+
+        if self.accept('IMPORTS'):
+            symbols = self.zero_or_more(
+                lambda: self.group(self.symbols_from_module))
+            self.expect(';')
+
+        return convert_imports(self.string,
+                               self.starts[start],
+                               Results(symbols))
+
+    def symbols_from_module(self):
+        tokens = self.symbol_list()
+        tokens.append(self.expect('FROM'))
+        tokens += self.module_reference()
+        self.assigned_identifier()
+
+        if self.is_keyword(['WITH', 'SUCCESSORS']):
+            self.pos += 2
+        elif self.is_keyword(['WITH', 'DESCENDANTS']):
+            self.pos += 2
+
+        return tokens
+
+    def assigned_identifier(self):
+        if self.tokens[self.pos] == '{':
+            pos = self.pos
+
+            try:
+                self.object_identifier_value()
+
+                return
+            except Backtrack:
+                self.pos = pos
+
+        pos = self.pos
+
+        try:
+            self.defined_value()
+        except Backtrack:
+            self.pos = pos
+
+            return
+
+        if self.tokens[self.pos] in [',', 'FROM']:
+            self.pos = pos
+
+    def symbol_list(self):
+        return self.group(lambda: self.delimited_list(self.symbol))
+
+    def symbol(self):
+        if self.kinds[self.pos] not in [UPPER, LOWER]:
+            self.fail()
+
+        tokens = self.reference()
+
+        if self.tokens[self.pos] == '{' and self.tokens[self.pos + 1] == '}':
+            self.pos += 2
+            tokens += ['{', '}']
+
+        return tokens
+
+    def assignment_list(self):
+        start = self.pos
+        assignments = []
+
+        while True:
+            pos = self.pos
+
+            try:
+                assignments += self.assignment()
+            except Backtrack:
+                self.pos = pos
+                break
+
+        return convert_assignment_list(self.string,
+                                       self.starts[start],
+                                       Results(assignments))
+
+    def assignment(self):
+        if self.kinds[self.pos] == UPPER:
+            return self.first(self.object_set_assignment,
+                              self.object_class_assignment,
+                              self.type_assignment)
+        else:
+            return self.first(self.object_assignment,
+                              self.value_assignment)
+
+    def object_set_assignment(self):
+        start = self.pos
+        tokens = self.type_reference()
+        self.parameter_list()
+        tokens += self.defined_object_class()
+        tokens.append(self.expect('::='))
+        tokens += self.object_set()
+
+        return self.action(convert_parameterized_object_set_assignment,
+                           start,
+                           tokens)
+
+    def object_assignment(self):
+        start = self.pos
+        tokens = self.value_reference()
+        self.parameter_list()
+        tokens += self.defined_object_class()
+        self.expect('::=')
+        tokens += self.object_()
+
+        return self.action(convert_parameterized_object_assignment,
+                           start,
+                           tokens)
+
+    def object_class_assignment(self):
+        start = self.pos
+        tokens = self.object_class_reference()
+        self.parameter_list()
+        tokens.append(self.expect('::='))
+        tokens += self.object_class_defn()
+
+        return self.action(convert_parameterized_object_class_assignment,
+                           start,
+                           tokens)
+
+    def type_assignment(self):
+        start = self.pos
+        tokens = self.type_reference()
+        tokens += self.parameter_list()
+        tokens.append(self.expect('::='))
+        tokens += self.tag()
+        tokens += self.type_()
+
+        return self.action(convert_parameterized_type_assignment,
+                           start,
+                           tokens)
+
+    def value_assignment(self):
+        start = self.pos
+        tokens = self.value_reference()
+        self.parameter_list()
+        tokens.append(Results(self.type_()))
+        self.expect('::=')
+        tokens += self.value()
+
+        return self.action(convert_parameterized_value_assignment,
+                           start,
+                           tokens)
+
+
+def parse_string(string):
+    """Parse given ASN.1 specification string and return a dictionary of
+    its contents.
+
+    """
+
+    return Parser(string).parse()
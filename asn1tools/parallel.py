@@ -0,0 +1,140 @@
+"""Decode many independent messages in parallel using a pool of
+worker processes.
+
+"""
+
+import multiprocessing
+from collections import deque
+from itertools import islice
+
+from .compiler import compile_files
+from .errors import DecodeError
+
+
+_WORKER = {}
+
+
+def _initialize_worker(specification, type_name, check_constraints):
+    _WORKER['type'] = specification.types[type_name]
+    _WORKER['check_constraints'] = check_constraints
+
+
+def _decode_chunk(chunk):
+    type_ = _WORKER['type']
+    decoded = list(type_.decode_many(chunk))
+
+    if _WORKER['check_constraints']:
+        for item in decoded:
+            type_.check_constraints(item)
+
+    return decoded
+
+
+def _chunks(iterable, chunksize):
+    chunk = []
+
+    for item in iterable:
+        chunk.append(item)
+
+        if len(chunk) == chunksize:
+            yield chunk
+            chunk = []
+
+    if chunk:
+        yield chunk
+
+
+def decode_parallel(filenames,
+                    codec,
+                    type_name,
+                    iterable,
+                    workers=None,
+                    chunksize=256,
+                    check_constraints=False,
+                    cache_dir=None,
+                    numeric_enums=False):
+    """Decode each bytes object in given iterable `iterable` as given type
+    `type_name` in a pool of `workers` processes and return a
+    generator of decoded data, in the same order as in `iterable`.
+
+    The specification is compiled once from given file(s)
+    `filenames` with given codec `codec`, and is sent to each worker
+    when it starts. `cache_dir` and `numeric_enums` are passed to
+    :func:`~asn1tools.compile_files()`.
+
+    `workers` is the number of worker processes, or ``None`` to use
+    one per CPU. `chunksize` is the number of messages sent to a
+    worker at a time. Larger chunks reduce the inter-process overhead
+    for small messages.
+
+    `iterable` is consumed as the returned generator is, with at most
+    two chunks per worker being decoded ahead of it.
+
+    See :meth:`~asn1tools.compiler.Specification.decode` for a
+    description of `check_constraints`.
+
+    >>> encoded = [b'0\\x0e\\x02\\x01\\x01\\x16\\x09Is 1+1=3?']
+    >>> list(asn1tools.parallel.decode_parallel('foo.asn',
+                                                 'ber',
+                                                 'Question',
+                                                 encoded))
+    [{'id': 1, 'question': 'Is 1+1=3?'}]
+
+    """
+
+    specification = compile_files(filenames,
+                                  codec,
+                                  cache_dir=cache_dir,
+                                  numeric_enums=numeric_enums)
+
+    if type_name not in specification.types:
+        raise DecodeError(
+            "Type '{}' not found in types dictionary.".format(type_name))
+
+    if chunksize < 1:
+        raise ValueError(
+            'Chunk size must be at least 1, but got {}.'.format(chunksize))
+
+    return _decode_parallel(specification,
+                            type_name,
+                            iterable,
+                            workers,
+                            chunksize,
+                            check_constraints)
+
+
+def _decode_parallel(specification,
+                     type_name,
+                     iterable,
+                     workers,
+                     chunksize,
+                     check_constraints):
+    if workers is None:
+        workers = multiprocessing.cpu_count()
+
+    pool = multiprocessing.Pool(workers,
+                                _initialize_worker,
+                                (specification, type_name, check_constraints))
+
+    try:
+        chunks = _chunks(iterable, chunksize)
+        pending = deque()
+
+        # Pool.imap() would read all of iterable at once, so only keep a
+        # few chunks per worker in flight.
+        for chunk in islice(chunks, 2 * workers):
+            pending.append(pool.apply_async(_decode_chunk, (chunk, )))
+
+        while pending:
+            decoded_chunk = pending.popleft().get()
+
+            for chunk in islice(chunks, 1):
+                pending.append(pool.apply_async(_decode_chunk, (chunk, )))
+
+            for decoded in decoded_chunk:
+                yield decoded
+
+        pool.close()
+    finally:
+        pool.terminate()
+        pool.join()
@@ -22,7 +22,7 @@ from pyparsing import nums
 from pyparsing import Suppress
 from pyparsing import ParseException
 from pyparsing import ParseSyntaxException
-from pyparsing import NotAny
+from pyparsing import FollowedBy
 from pyparsing import NoMatch
 from pyparsing import QuotedString
 from pyparsing import Combine
@@ -30,12 +30,15 @@ from pyparsing import ParseResults
 from pyparsing import lineno
 
 from .errors import Error
+from .cache import Cache
 
 
 LOGGER = logging.getLogger(__name__)
 
 EXTENSION_MARKER = None
 
+GRAMMAR = None
+
 
 class ParseError(Error):
     pass
@@ -705,7 +708,12 @@ def convert_parameterized_object_assignment(_s, _l, tokens):
             converted_type)
 
 
-def convert_parameterized_object_class_assignment(_s, _l, tokens):
+def convert_parameterized_object_class_assignment(string, location, tokens):
+    # Only object class definitions are supported. Let the parser try
+    # other kinds of assignments, for example a parameterized type.
+    if tokens[2] != 'CLASS':
+        raise ParseException(string, location)
+
     members = []
 
     for member in tokens[3]:
@@ -958,7 +966,8 @@ def create_grammar():
     ampersand = Literal('&')
     less_than = Literal('<')
 
-    reserved_words = Regex(r'(END|SEQUENCE|ENUMERATED|WITH)(\s|$)')
+    # Negative lookahead rejecting reserved words used as references.
+    not_reserved_word = r'(?!(END|SEQUENCE|ENUMERATED|WITH)(\s|$))'
 
     # Forward declarations.
     value = Forward()
@@ -1113,8 +1122,7 @@ def create_grammar():
         '"objectFieldReference" not implemented')
     object_set_field_reference = NoMatch().setName(
         '"objectSetFieldReference" not implemented')
-    object_class_reference = (NotAny(reserved_words)
-                              + Regex(r'[A-Z][A-Z0-9-]*'))
+    object_class_reference = Regex(not_reserved_word + r'[A-Z][A-Z0-9-]*')
     object_reference = value_reference
 
     # X.681: 8. Referencing definitions
@@ -1222,7 +1230,11 @@ def create_grammar():
 
     # X.681: 14. Notation for the object class field type
     fixed_type_field_val = (builtin_value | referenced_value)
-    open_type_field_val = (type_ + colon + value)
+    # All types start with an upper case letter.
+    open_type_field_val = (FollowedBy(Regex(r'[A-Z]'))
+                           + type_
+                           + colon
+                           + value)
     object_class_field_value = (open_type_field_val
                                 | fixed_type_field_val)
     object_class_field_type = Combine(defined_object_class
@@ -1609,29 +1621,38 @@ def create_grammar():
                          - type_)
     referenced_type = defined_type
     referenced_type.setName('ReferencedType')
-    builtin_type = (choice_type
-                    | integer_type
-                    | null_type
-                    | real_type
-                    | bit_string_type
-                    | octet_string_type
-                    | enumerated_type
-                    | sequence_of_type
-                    | sequence_type
-                    | object_class_field_type
-                    | set_of_type
-                    | set_type
-                    | object_identifier_type
-                    | boolean_type
-                    | character_string_type)
+    # Look ahead for the first word of a builtin type to avoid trying
+    # all builtin types for type references.
+    builtin_type_start = FollowedBy(Regex(
+        r'(BIT|BMPString|BOOLEAN|CHARACTER|CHOICE|ENUMERATED|GeneralString'
+        r'|GeneralizedTime|GraphicString|IA5String|INTEGER|ISO646String|NULL'
+        r'|NumericString|OBJECT|OCTET|PrintableString|REAL|SEQUENCE|SET'
+        r'|T61String|TeletexString|UTCTime|UTF8String|UniversalString'
+        r'|VideotexString|VisibleString)\b'
+        r'|[A-Z][A-Z0-9-]*\.&'))
+    builtin_type = (builtin_type_start
+                    + (choice_type
+                       | integer_type
+                       | null_type
+                       | real_type
+                       | bit_string_type
+                       | octet_string_type
+                       | enumerated_type
+                       | sequence_of_type
+                       | sequence_type
+                       | object_class_field_type
+                       | set_of_type
+                       | set_type
+                       | object_identifier_type
+                       | boolean_type
+                       | character_string_type))
     type_ <<= Group((builtin_type
                      | any_defined_by_type
                      | referenced_type).setName('Type')
                     + Group(ZeroOrMore(constraint)))
 
     # X.680: 15. Assigning types and values
-    type_reference <<= (NotAny(reserved_words)
-                        + Regex(r'[A-Z][a-zA-Z0-9-]*'))
+    type_reference <<= Regex(not_reserved_word + r'[A-Z][a-zA-Z0-9-]*')
     value_reference <<= Regex(r'[a-z][a-zA-Z0-9-]*')
     value_set <<= NoMatch().setName('"valueSet" not implemented')
     parameterized_type_assignment = (type_reference
@@ -1648,23 +1669,27 @@ def create_grammar():
     # X.680: 14. Notation to support references to ASN.1 components
 
     # X.680: 13. Referencing type and value definitions
-    external_value_reference <<= (module_reference
+    # Look ahead for the dot to avoid parsing the module reference of
+    # all type and value references twice.
+    external_reference_start = FollowedBy(Regex(r'[A-Z][a-zA-Z0-9-]*\s*\.'))
+    external_value_reference <<= (external_reference_start
+                                  + module_reference
                                   + dot
                                   + value_reference)
-    external_type_reference <<= (module_reference
+    external_type_reference <<= (external_reference_start
+                                 + module_reference
                                  + dot
                                  + type_reference)
+    # Parameterized types and values are matched as references with
+    # optional actual parameters to parse each reference only once.
     defined_type <<= (external_type_reference
-                      | parameterized_type
-                      | parameterized_value_set_type
-                      | type_reference)
+                      | (type_reference + Optional(actual_parameter_list)))
     defined_value <<= (external_value_reference
-                       | parameterized_value
-                       | value_reference)
+                       | (value_reference + Optional(actual_parameter_list)))
 
     # X.680: 12. Module definition
-    module_reference <<= (NotAny(reserved_words)
-                          + Regex(r'[A-Z][a-zA-Z0-9-]*').setName('modulereference'))
+    module_reference <<= Regex(
+        not_reserved_word + r'[A-Z][a-zA-Z0-9-]*').setName('modulereference')
     assigned_identifier = Suppress(Optional(object_identifier_value
                                             | (defined_value + ~(comma | FROM))))
     global_module_reference = (module_reference + assigned_identifier)
@@ -1773,6 +1798,22 @@ def create_grammar():
     return specification
 
 
+def get_grammar():
+    """Return the ASN.1 grammar, created on first call and reused by all
+    later calls.
+
+    """
+
+    global GRAMMAR
+
+    if GRAMMAR is None:
+        grammar = create_grammar()
+        grammar.streamline()
+        GRAMMAR = grammar
+
+    return GRAMMAR
+
+
 def ignore_comments(string):
     """Ignore comments in given string by replacing them with spaces. This
     reduces the parsing time by roughly a factor of two.
@@ -1838,23 +1879,38 @@ def ignore_comments(string):
     return ''.join(chunks)
 
 
-def parse_string(string):
+def parse_string(string, backend='fast'):
     """Parse given ASN.1 specification string and return a dictionary of
     its contents.
 
     The dictionary can later be compiled with
     :func:`~asn1tools.compile_dict()`.
 
+    `backend` is the parser to use, either ``'fast'`` or
+    ``'pyparsing'``. The fast backend is a hand written parser returning
+    the same dictionary as the Pyparsing backend, but in a fraction of
+    the time. If it fails, the specification is parsed again by the
+    Pyparsing backend, which gives more detailed error messages.
+
     >>> with open('foo.asn') as fin:
     ...     foo = asn1tools.parse_string(fin.read())
 
     """
 
-    grammar = create_grammar()
+    if backend not in ['pyparsing', 'fast']:
+        raise ParseError("Unsupported parser backend '{}'.".format(backend))
+
+    if backend == 'fast':
+        from . import fast_parser
+
+        try:
+            return fast_parser.parse_string(string)
+        except (ParseException, ParseSyntaxException):
+            pass
 
     try:
         string = ignore_comments(string)
-        tokens = grammar.parseString(string).asList()
+        tokens = get_grammar().parseString(string).asList()
     except (ParseException, ParseSyntaxException) as e:
         raise ParseError("Invalid ASN.1 syntax at line {}, column {}: '{}': {}.".format(
             e.lineno,
@@ -1865,7 +1921,10 @@ def parse_string(string):
     return tokens[0]
 
 
-def parse_files(filenames, encoding='utf-8'):
+def parse_files(filenames,
+                encoding='utf-8',
+                backend='fast',
+                cache_dir=None):
     """Parse given ASN.1 specification file(s) and return a dictionary of
     its/their contents.
 
@@ -1875,6 +1934,17 @@ def parse_files(filenames, encoding='utf-8'):
     `encoding` is the text encoding. This argument is passed to the
     built-in function `open()`.
 
+    See :func:`~asn1tools.parse_string()` for a description of
+    `backend`.
+
+    Parsed files are cached in the file system directory `cache_dir`
+    if not ``None``. Each file is then parsed separately and the
+    results are merged, so only modified files are parsed again when
+    parsing the same files once more. A file that can not be parsed on
+    its own, for example if a module is split over several files, is
+    parsed together with all files after it. Without a cache directory
+    all files are parsed as one specification on every call.
+
     >>> foo = asn1tools.parse_files('foo.asn')
 
     """
@@ -1882,16 +1952,53 @@ def parse_files(filenames, encoding='utf-8'):
     if isinstance(filenames, str):
         filenames = [filenames]
 
-    string = ''
+    if backend not in ['pyparsing', 'fast']:
+        raise ParseError("Unsupported parser backend '{}'.".format(backend))
 
-    for filename in filenames:
-        if sys.version_info[0] < 3:
-            with open(filename, 'r') as fin:
-                string += fin.read()
-                string += '\n'
-        else:
-            with open(filename, 'r', encoding=encoding, errors='replace') as fin:
-                string += fin.read()
-                string += '\n'
+    if cache_dir is None:
+        string = ''.join([read_file(filename, encoding)
+                          for filename in filenames])
+
+        return parse_string(string, backend)
+
+    cache = Cache(cache_dir)
+    parsed = []
+
+    for i, filename in enumerate(filenames):
+        try:
+            parsed.append(cache.get(
+                [filename],
+                ['parse_files', encoding, backend],
+                lambda: parse_string(read_file(filename, encoding), backend)))
+        except ParseError:
+            parsed.append(parse_remaining_files(filenames, i, encoding, backend))
+
+            break
+
+    return merge_dicts(parsed)
+
+
+def parse_remaining_files(filenames, index, encoding, backend):
+    """Parse files from given index as one specification. Already parsed
+    files are replaced by empty lines, so line numbers in error
+    messages are the same as when parsing all files as one
+    specification.
+
+    """
+
+    strings = [read_file(filename, encoding) for filename in filenames]
+    number_of_lines = sum([string.count('\n') for string in strings[:index]])
+
+    return parse_string('\n' * number_of_lines + ''.join(strings[index:]),
+                        backend)
+
+
+def read_file(filename, encoding):
+    if sys.version_info[0] < 3:
+        with open(filename, 'r') as fin:
+            string = fin.read()
+    else:
+        with open(filename, 'r', encoding=encoding, errors='replace') as fin:
+            string = fin.read()
 
-    return parse_string(string)
+    return string + '\n'
@@ -0,0 +1,136 @@
+"""Serialization of specification dictionaries to and from a compact,
+pickle free, JSON based format.
+
+All values are stored in a flat table. Containers refer to their
+items by table index, so each string, number and shared container is
+stored only once. Containers are added after their items, which makes
+it possible to load the table in a single pass.
+
+"""
+
+import json
+import binascii
+
+from .errors import CompileError
+
+
+FORMAT = 'asn1tools-specification'
+VERSION = 1
+
+
+class _Table(object):
+
+    def __init__(self):
+        self.entries = []
+        self._scalars = {}
+        self._containers = {}
+
+    def add(self, value):
+        if isinstance(value, (dict, list, tuple)):
+            try:
+                return self._containers[id(value)][0]
+            except KeyError:
+                pass
+
+            if isinstance(value, dict):
+                entry = ['d']
+
+                for key, item in value.items():
+                    entry.append(self.add(key))
+                    entry.append(self.add(item))
+            else:
+                entry = ['l' if isinstance(value, list) else 't']
+                entry.extend([self.add(item) for item in value])
+
+            index = self._append(entry)
+            # Keep a reference to the value to make sure its id is not
+            # reused by another object.
+            self._containers[id(value)] = (index, value)
+        else:
+            key = (type(value), value)
+
+            try:
+                return self._scalars[key]
+            except KeyError:
+                pass
+
+            if isinstance(value, bytes):
+                entry = ['b', binascii.hexlify(value).decode('ascii')]
+            elif value is None or isinstance(value, (bool, int, float, str)):
+                entry = value
+            else:
+                raise CompileError(
+                    "Cannot serialize value of type '{}'.".format(
+                        type(value).__name__))
+
+            index = self._append(entry)
+            self._scalars[key] = index
+
+        return index
+
+    def _append(self, entry):
+        self.entries.append(entry)
+
+        return len(self.entries) - 1
+
+
+def dumps(value, **header):
+    """Returns given value `value` serialized as a string, with given
+    `header` items stored next to it.
+
+    """
+
+    table = _Table()
+    root = table.add(value)
+    data = {
+        'format': FORMAT,
+        'version': VERSION
+    }
+    data.update(header)
+    data['root'] = root
+    data['table'] = table.entries
+
+    return json.dumps(data, separators=(',', ':'))
+
+
+def loads(string):
+    """Returns the header and the value of given serialized string
+    `string`.
+
+    """
+
+    try:
+        data = json.loads(string)
+        format_ = data.pop('format')
+        version = data.pop('version')
+    except Exception:
+        raise CompileError('Invalid serialized specification.')
+
+    if format_ != FORMAT:
+        raise CompileError('Invalid serialized specification.')
+
+    if version != VERSION:
+        raise CompileError(
+            "Unsupported serialized specification version {}.".format(version))
+
+    values = []
+
+    for entry in data.pop('table'):
+        if isinstance(entry, list):
+            kind = entry[0]
+
+            if kind == 'd':
+                items = [values[index] for index in entry[1:]]
+                value = dict(zip(items[0::2], items[1::2]))
+            elif kind == 'l':
+                value = [values[index] for index in entry[1:]]
+            elif kind == 't':
+                value = tuple([values[index] for index in entry[1:]])
+            else:
+                value = binascii.unhexlify(entry[1])
+        else:
+            value = entry
+
+        values.append(value)
+
+    return data, values[data.pop('root')]
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+
+"""A performance example comparing the time it takes to check
+constraints of a message to the time it takes to encode it using the
+UPER codec.
+
+Example execution:
+
+$ ./constraints.py
+MESSAGE       ITERATIONS     ENCODE      CHECK  OVERHEAD
+record             10000   0.790177   0.058129       7 %
+records              100   0.790443   0.056591       7 %
+$
+
+"""
+
+from __future__ import print_function
+
+import timeit
+import asn1tools
+
+
+SPECIFICATION = '''
+Foo DEFINITIONS AUTOMATIC TAGS ::= BEGIN
+
+    Record ::= SEQUENCE {
+        id       INTEGER (0..65535),
+        name     PrintableString (SIZE (1..64)),
+        digits   NumericString (SIZE (1..16)),
+        code     IA5String (FROM ("A".."F" | "0".."9")),
+        flags    BIT STRING (SIZE (8)),
+        data     OCTET STRING (SIZE (0..255)),
+        kind     ENUMERATED { a, b, c },
+        valid    BOOLEAN,
+        counters SEQUENCE (SIZE (0..8)) OF INTEGER (0..4294967295)
+    }
+
+    Records ::= SEQUENCE (SIZE (1..1000)) OF Record
+
+END
+'''
+
+RECORD = {
+    'id': 1234,
+    'name': 'A printable name of some length',
+    'digits': '0123456789',
+    'code': 'DEADBEEF0123',
+    'flags': (b'\xa5', 8),
+    'data': 64 * b'\x5a',
+    'kind': 'b',
+    'valid': True,
+    'counters': [1, 2, 3, 4]
+}
+
+MESSAGES = [
+    ('record', 'Record', RECORD, 10000),
+    ('records', 'Records', 100 * [RECORD], 100)
+]
+
+
+def main():
+    foo = asn1tools.compile_string(SPECIFICATION, 'uper')
+
+    print('MESSAGE       ITERATIONS     ENCODE      CHECK  OVERHEAD')
+
+    for message_name, type_name, decoded, iterations in MESSAGES:
+        type_ = foo.types[type_name]
+
+        def encode():
+            type_.encode(decoded)
+
+        def check():
+            type_.check_constraints(decoded)
+
+        encode_time = timeit.timeit(encode, number=iterations)
+        check_time = timeit.timeit(check, number=iterations)
+
+        print('{:13} {:>10} {:>10.6f} {:>10.6f} {:>7.0f} %'.format(
+            message_name,
+            iterations,
+            encode_time,
+            check_time,
+            100 * check_time / encode_time))
+
+
+if __name__ == '__main__':
+    main()
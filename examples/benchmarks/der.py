@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+
+"""A performance example measuring DER encoding of a certificate, a
+certificate chain and a large SEQUENCE OF.
+
+Example execution:
+
+$ ./der.py
+MESSAGE          SIZE  ITERATIONS    SECONDS
+certificate       534        1000   0.155433
+chain            5344         100   0.154316
+records        578767           5   0.565011
+$
+
+"""
+
+from __future__ import print_function
+
+import os
+import base64
+import timeit
+import asn1tools
+
+SCRIPT_DIR = os.path.dirname(os.path.realpath(__file__))
+RFC5280_ASN_PATH = os.path.realpath(os.path.join(SCRIPT_DIR,
+                                                 '..',
+                                                 '..',
+                                                 'tests',
+                                                 'files',
+                                                 'ietf',
+                                                 'rfc5280.asn'))
+
+SPECIFICATION = '''
+Foo DEFINITIONS AUTOMATIC TAGS ::= BEGIN
+
+IMPORTS Certificate FROM PKIX1Explicit88;
+
+CertificateChain ::= SEQUENCE OF Certificate
+
+Records ::= SEQUENCE OF SEQUENCE {
+    id      INTEGER,
+    payload OCTET STRING,
+    info    SEQUENCE {
+        name  IA5String,
+        valid BOOLEAN
+    }
+}
+
+END
+'''
+
+CERTIFICATE = base64.b64decode(
+    'MIICEjCCAXsCAg36MA0GCSqGSIb3DQEBBQUAMIGbMQswCQYDVQQGEwJKUDEOMAwG'
+    'A1UECBMFVG9reW8xEDAOBgNVBAcTB0NodW8ta3UxETAPBgNVBAoTCEZyYW5rNERE'
+    'MRgwFgYDVQQLEw9XZWJDZXJ0IFN1cHBvcnQxGDAWBgNVBAMTD0ZyYW5rNEREIFdl'
+    'YiBDQTEjMCEGCSqGSIb3DQEJARYUc3VwcG9ydEBmcmFuazRkZC5jb20wHhcNMTIw'
+    'ODIyMDUyNjU0WhcNMTcwODIxMDUyNjU0WjBKMQswCQYDVQQGEwJKUDEOMAwGA1UE'
+    'CAwFVG9reW8xETAPBgNVBAoMCEZyYW5rNEREMRgwFgYDVQQDDA93d3cuZXhhbXBs'
+    'ZS5jb20wXDANBgkqhkiG9w0BAQEFAANLADBIAkEAm/xmkHmEQrurE/0re/jeFRLl'
+    '8ZPjBop7uLHhnia7lQG/5zDtZIUC3RVpqDSwBuw/NTweGyuP+o8AG98HxqxTBwID'
+    'AQABMA0GCSqGSIb3DQEBBQUAA4GBABS2TLuBeTPmcaTaUW/LCB2NYOy8GMdzR1mx'
+    '8iBIu2H6/E2tiY3RIevV2OW61qY2/XRQg7YPxx3ffeUugX9F4J/iPnnu1zAxxyBy'
+    '2VguKv4SWjRFoRkIfIlHX0qVviMhSlNy2ioFLy7JcPZb+v3ftDGywUqcBiVDoea0'
+    'Hn+GmxZA')
+
+
+def main():
+    with open(RFC5280_ASN_PATH) as fin:
+        foo = asn1tools.compile_string(fin.read() + SPECIFICATION, 'der')
+
+    certificate = foo.decode('Certificate', CERTIFICATE)
+    records = [
+        {
+            'id': i,
+            'payload': 32 * b'\xa5',
+            'info': {
+                'name': 'record {}'.format(i),
+                'valid': True
+            }
+        }
+        for i in range(10000)
+    ]
+    messages = [
+        ('certificate', 'Certificate', certificate, 1000),
+        ('chain', 'CertificateChain', 10 * [certificate], 100),
+        ('records', 'Records', records, 5)
+    ]
+
+    print('MESSAGE          SIZE  ITERATIONS    SECONDS')
+
+    for message_name, type_name, decoded, iterations in messages:
+        encoded = foo.encode(type_name, decoded)
+
+        def encode():
+            foo.encode(type_name, decoded)
+
+        print('{:13} {:>7} {:>11} {:>10.6f}'.format(
+            message_name,
+            len(encoded),
+            iterations,
+            timeit.timeit(encode, number=iterations)))
+
+
+if __name__ == '__main__':
+    main()
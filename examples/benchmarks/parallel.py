@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+
+"""A performance example comparing sequential decoding of many UPER
+encoded RRC messages with parallel decoding using a pool of worker
+processes. The parallel time includes compiling the specification
+and starting the workers. The example execution below is from a
+single CPU machine, where parallel decoding only adds overhead, so
+use a machine with several CPUs to measure the scaling.
+
+Example execution:
+
+$ ./parallel.py
+Encoding 20000 messages... done.
+
+CPUs: 1
+
+METHOD         WORKERS    SECONDS
+sequential           -   0.620224
+parallel             1   0.772039
+$
+
+"""
+
+from __future__ import print_function
+
+import os
+import timeit
+import multiprocessing
+import asn1tools
+from asn1tools.parallel import decode_parallel
+
+
+SCRIPT_DIR = os.path.dirname(os.path.realpath(__file__))
+RRC_8_6_0_ASN_PATH = os.path.realpath(os.path.join(SCRIPT_DIR,
+                                                   '..',
+                                                   '..',
+                                                   'tests',
+                                                   'files',
+                                                   '3gpp',
+                                                   'rrc_8_6_0.asn'))
+NUMBER_OF_MESSAGES = 20000
+TYPE_NAME = 'BCCH-DL-SCH-Message'
+
+
+def system_information(q_rx_lev_min):
+    return {
+        'message': (
+            'c1',
+            (
+                'systemInformation',
+                {
+                    'criticalExtensions': (
+                        'systemInformation-r8',
+                        {
+                            'sib-TypeAndInfo': [
+                                (
+                                    'sib3',
+                                    {
+                                        'cellReselectionInfoCommon': {
+                                            'q-Hyst': 'dB0'
+                                        },
+                                        'cellReselectionServingFreqInfo': {
+                                            'threshServingLow': 7,
+                                            'cellReselectionPriority': 3
+                                        },
+                                        'intraFreqCellReselectionInfo': {
+                                            'q-RxLevMin': q_rx_lev_min,
+                                            's-IntraSearch': 0,
+                                            'presenceAntennaPort1': False,
+                                            'neighCellConfig': (b'\x80', 2),
+                                            't-ReselectionEUTRA': 4
+                                        }
+                                    }
+                                )
+                            ]
+                        }
+                    )
+                }
+            )
+        )
+    }
+
+
+def main():
+    print('Encoding {} messages... '.format(NUMBER_OF_MESSAGES),
+          end='',
+          flush=True)
+    rrc = asn1tools.compile_files(RRC_8_6_0_ASN_PATH, 'uper')
+    decoded = [
+        system_information(-70 + i % 48)
+        for i in range(NUMBER_OF_MESSAGES)
+    ]
+    encoded = list(rrc.encode_many(TYPE_NAME, decoded))
+    print('done.')
+
+    def sequential():
+        assert list(rrc.decode_many(TYPE_NAME, encoded)) == decoded
+
+    def parallel(workers):
+        def decode():
+            decoded_messages = decode_parallel(RRC_8_6_0_ASN_PATH,
+                                               'uper',
+                                               TYPE_NAME,
+                                               encoded,
+                                               workers=workers)
+            assert list(decoded_messages) == decoded
+
+        return decode
+
+    number_of_cpus = multiprocessing.cpu_count()
+    measurements = [
+        ('sequential', '-', timeit.timeit(sequential, number=1))
+    ]
+    workers = 1
+
+    while True:
+        measurements.append(('parallel',
+                             workers,
+                             timeit.timeit(parallel(workers), number=1)))
+
+        if workers >= number_of_cpus:
+            break
+
+        workers = min(2 * workers, number_of_cpus)
+
+    print()
+    print('CPUs: {}'.format(number_of_cpus))
+    print()
+    print('METHOD         WORKERS    SECONDS')
+
+    for method, workers, seconds in measurements:
+        print('{:12} {:>9} {:>10.6f}'.format(method, workers, seconds))
+
+
+if __name__ == '__main__':
+    main()
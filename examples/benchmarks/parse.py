@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+
+"""A performance example measuring the time it takes to parse the 3GPP,
+IETF and ETSI ASN.1 specifications in the test suite, using the
+Pyparsing and the fast parser backends.
+
+Example execution:
+
+$ ./parse.py
+Parsing 21 specifications... done.
+
+SPECIFICATION                                SIZE  PYPARSING       FAST
+3gpp/lpp_14_3_0.asn                     109.72 KB   0.677979   0.064836
+3gpp/rrc_14_4_0.asn                     680.45 KB   3.089766   0.158431
+3gpp/rrc_8_6_0.asn                      122.59 KB   0.376007   0.030358
+3gpp/s1ap_14_4_0.asn                    246.74 KB   1.398789   0.150946
+...
+ietf/rfc5280.asn                         34.06 KB   0.242595   0.018904
+ietf/rfc5280_modified.asn                34.05 KB   0.241508   0.018706
+TOTAL                                  1347.64 KB   6.538273   0.488675
+$
+
+"""
+
+from __future__ import print_function
+
+import os
+import glob
+import timeit
+import asn1tools
+
+
+SCRIPT_DIR = os.path.dirname(os.path.realpath(__file__))
+FILES_DIR = os.path.realpath(os.path.join(SCRIPT_DIR,
+                                          '..',
+                                          '..',
+                                          'tests',
+                                          'files'))
+ITERATIONS = 1
+
+
+def specifications():
+    filenames = []
+
+    for directory in ['3gpp', 'etsi', 'ietf']:
+        filenames += glob.glob(os.path.join(FILES_DIR, directory, '*.asn'))
+
+    return sorted(filenames)
+
+
+def main():
+    filenames = specifications()
+
+    print('Parsing {} specifications... '.format(len(filenames)),
+          end='',
+          flush=True)
+
+    measurements = []
+
+    for filename in filenames:
+        def parse(backend):
+            def parse_files():
+                asn1tools.parse_files(filename, backend=backend)
+
+            return timeit.timeit(parse_files, number=ITERATIONS)
+
+        measurements.append((os.path.relpath(filename, FILES_DIR),
+                             os.stat(filename).st_size,
+                             parse('pyparsing'),
+                             parse('fast')))
+
+    print('done.')
+    print()
+    print('{:36} {:>12} {:>10} {:>10}'.format('SPECIFICATION',
+                                              'SIZE',
+                                              'PYPARSING',
+                                              'FAST'))
+
+    for filename, size, pyparsing_seconds, fast_seconds in measurements:
+        print('{:36} {:>9.2f} KB {:>10.6f} {:>10.6f}'.format(
+            filename,
+            size / 1000,
+            pyparsing_seconds,
+            fast_seconds))
+
+    print('{:36} {:>9.2f} KB {:>10.6f} {:>10.6f}'.format(
+        'TOTAL',
+        sum([measurement[1] for measurement in measurements]) / 1000,
+        sum([measurement[2] for measurement in measurements]),
+        sum([measurement[3] for measurement in measurements])))
+
+
+if __name__ == '__main__':
+    main()
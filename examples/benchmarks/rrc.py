@@ -0,0 +1,220 @@
+#!/usr/bin/env python
+
+"""A performance example measuring PER and UPER encoding and decoding
+of RRC messages of different sizes.
+
+Example execution:
+
+$ ./rrc.py
+Compiling '/home/erik/asn1tools/tests/files/3gpp/rrc_8_6_0.asn'... done.
+
+Encoding messages:
+
+CODEC  MESSAGE                 SIZE  ITERATIONS    SECONDS
+per    counterCheck              12        3000   0.051913
+per    systemInformation        120        3000   1.966242
+per    dlInformationTransfer  10004         300   0.009593
+per    dlInformationTransfer 100006          30   0.001043
+uper   counterCheck               9        3000   0.066994
+uper   systemInformation        120        3000   1.938304
+uper   dlInformationTransfer  10004         300   0.016822
+uper   dlInformationTransfer 100006          30   0.011162
+
+Decoding messages:
+
+CODEC  MESSAGE                 SIZE  ITERATIONS    SECONDS
+per    counterCheck              12        3000   0.047678
+per    systemInformation        120        3000   1.639263
+per    dlInformationTransfer  10004         300   0.005076
+per    dlInformationTransfer 100006          30   0.000811
+uper   counterCheck               9        3000   0.056270
+uper   systemInformation        120        3000   1.528452
+uper   dlInformationTransfer  10004         300   0.017754
+uper   dlInformationTransfer 100006          30   0.011765
+$
+
+"""
+
+from __future__ import print_function
+
+import os
+import timeit
+import asn1tools
+
+SCRIPT_DIR = os.path.dirname(os.path.realpath(__file__))
+RRC_8_6_0_ASN_PATH = os.path.realpath(os.path.join(SCRIPT_DIR,
+                                                   '..',
+                                                   '..',
+                                                   'tests',
+                                                   'files',
+                                                   '3gpp',
+                                                   'rrc_8_6_0.asn'))
+
+COUNTER_CHECK = {
+    'message': (
+        'c1',
+        (
+            'counterCheck',
+            {
+                'rrc-TransactionIdentifier': 0,
+                'criticalExtensions': (
+                    'c1',
+                    (
+                        'counterCheck-r8',
+                        {
+                            'drb-CountMSB-InfoList': [
+                                {
+                                    'drb-Identity': 32,
+                                    'countMSB-Uplink': 33554431,
+                                    'countMSB-Downlink': 33554431
+                                }
+                            ],
+                            'nonCriticalExtension': {
+                            }
+                        }
+                    )
+                )
+            }
+        )
+    )
+}
+
+SYSTEM_INFORMATION = {
+    'message': (
+        'c1',
+        (
+            'systemInformation',
+            {
+                'criticalExtensions': (
+                    'systemInformation-r8',
+                    {
+                        'sib-TypeAndInfo': 16 * [
+                            (
+                                'sib3',
+                                {
+                                    'cellReselectionInfoCommon': {
+                                        'q-Hyst': 'dB0',
+                                        'speedStateReselectionPars': {
+                                            'mobilityStateParameters': {
+                                                't-Evaluation': 's180',
+                                                't-HystNormal': 's180',
+                                                'n-CellChangeMedium': 1,
+                                                'n-CellChangeHigh': 16
+                                            },
+                                            'q-HystSF': {
+                                                'sf-Medium': 'dB-6',
+                                                'sf-High': 'dB-4'
+                                            }
+                                        }
+                                    },
+                                    'cellReselectionServingFreqInfo': {
+                                        'threshServingLow': 7,
+                                        'cellReselectionPriority': 3
+                                    },
+                                    'intraFreqCellReselectionInfo': {
+                                        'q-RxLevMin': -33,
+                                        's-IntraSearch': 0,
+                                        'presenceAntennaPort1': False,
+                                        'neighCellConfig': (b'\x80', 2),
+                                        't-ReselectionEUTRA': 4
+                                    }
+                                }
+                            )
+                        ]
+                    }
+                )
+            }
+        )
+    )
+}
+
+
+def dl_information_transfer(size):
+    return {
+        'message': (
+            'c1',
+            (
+                'dlInformationTransfer',
+                {
+                    'rrc-TransactionIdentifier': 1,
+                    'criticalExtensions': (
+                        'c1',
+                        (
+                            'dlInformationTransfer-r8',
+                            {
+                                'dedicatedInfoType': (
+                                    'dedicatedInfoNAS',
+                                    size * b'\x5a'
+                                )
+                            }
+                        )
+                    )
+                }
+            )
+        )
+    }
+
+
+MESSAGES = [
+    ('DL-DCCH-Message', 'counterCheck', COUNTER_CHECK, 3000),
+    ('BCCH-DL-SCH-Message', 'systemInformation', SYSTEM_INFORMATION, 3000),
+    ('DL-DCCH-Message',
+     'dlInformationTransfer',
+     dl_information_transfer(10000),
+     300),
+    ('DL-DCCH-Message',
+     'dlInformationTransfer',
+     dl_information_transfer(100000),
+     30)
+]
+
+
+def encode_decode(spec, type_name, decoded, iterations):
+    encoded = spec.encode(type_name, decoded)
+
+    def encode():
+        spec.encode(type_name, decoded)
+
+    def decode():
+        spec.decode(type_name, encoded)
+
+    encode_time = timeit.timeit(encode, number=iterations)
+    decode_time = timeit.timeit(decode, number=iterations)
+
+    return len(encoded), encode_time, decode_time
+
+
+print("Compiling '{}'... ".format(RRC_8_6_0_ASN_PATH), end='', flush=True)
+
+specs = [
+    (codec, asn1tools.compile_files(RRC_8_6_0_ASN_PATH, codec))
+    for codec in ['per', 'uper']
+]
+
+print('done.')
+
+measurements = []
+
+for codec, spec in specs:
+    for type_name, message_name, decoded, iterations in MESSAGES:
+        measurements.append((codec,
+                             message_name,
+                             iterations,
+                             *encode_decode(spec,
+                                            type_name,
+                                            decoded,
+                                            iterations)))
+
+for title, index in [('Encoding', 4), ('Decoding', 5)]:
+    print()
+    print('{} messages:'.format(title))
+    print()
+    print('CODEC  MESSAGE                 SIZE  ITERATIONS    SECONDS')
+
+    for measurement in measurements:
+        codec, message_name, iterations, size = measurement[:4]
+        print('{:6} {:21} {:>6} {:>11} {:>10.6f}'.format(codec,
+                                                         message_name,
+                                                         size,
+                                                         iterations,
+                                                         measurement[index]))
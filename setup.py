@@ -31,8 +31,7 @@ setup(name='asn1tools',
           'bitstruct'
       ],
       extras_require={
-          'shell': ['prompt_toolkit'],
-          'cache': ['diskcache']
+          'shell': ['prompt_toolkit']
       },
       test_suite="tests",
       entry_points={
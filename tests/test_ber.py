@@ -6,6 +6,8 @@ import unittest
 import timeit
 import sys
 from copy import deepcopy
+from io import BytesIO
+from unittest.mock import patch
 from datetime import datetime
 from .utils import Asn1ToolsBaseTest
 
@@ -744,6 +746,53 @@ class Asn1ToolsBerTest(Asn1ToolsBaseTest):
         self.assertEqual(foo.decode('A', b'\x31\x06\x81\x01\x04\x80\x01\x03'), {'a': 3, 'b': 4})
         self.assertEqual(foo.decode('A', b'\x31\x80\x81\x01\x00\x80\x01\x03\x00\x00'), {'a': 3, 'b': 0})
 
+    def test_sequence_members_out_of_order(self):
+        foo = asn1tools.compile_string(
+            "Foo DEFINITIONS IMPLICIT TAGS ::= "
+            "BEGIN "
+            "A ::= SEQUENCE { "
+            "  x INTEGER, "
+            "  y BOOLEAN, "
+            "  z INTEGER "
+            "} "
+            "B ::= SET { "
+            "  a [0] INTEGER, "
+            "  b [1] INTEGER OPTIONAL, "
+            "  c [2] INTEGER DEFAULT 5, "
+            "  d [3] INTEGER, "
+            "  ..., "
+            "  e [4] INTEGER, "
+            "  f [5] INTEGER "
+            "} "
+            "END",
+            'ber')
+
+        # A member with the same tag as an earlier missing member is
+        # decoded before it.
+        encoded = b'\x30\x09\x01\x01\x01\x02\x01\x01\x02\x01\x02'
+        decoded = {'x': 2, 'y': True, 'z': 1}
+        self.assertEqual(foo.decode('A', encoded), decoded)
+        self.assertEqual(dict(foo.decode('A', encoded, lazy=True)), decoded)
+
+        # Members and additions in reverse order.
+        encoded = b'\x31\x0c\x83\x01\x03\x80\x01\x00\x85\x01\x02\x84\x01\x01'
+        decoded = {'a': 0, 'c': 5, 'd': 3, 'e': 1, 'f': 2}
+        self.assertEqual(foo.decode('B', encoded), decoded)
+        self.assertEqual(dict(foo.decode('B', encoded, lazy=True)), decoded)
+
+        # Unknown member.
+        encoded = b'\x31\x0c\x83\x01\x03\x80\x01\x00\x81\x01\x01\x86\x01\xff'
+        self.assertEqual(foo.decode('B', encoded),
+                         {'a': 0, 'b': 1, 'c': 5, 'd': 3})
+
+        # Duplicated member.
+        with self.assertRaises(asn1tools.DecodeError) as cm:
+            foo.decode('B', b'\x31\x06\x83\x01\x03\x83\x01\x04')
+
+        self.assertEqual(
+            str(cm.exception),
+            "B.a: Expected INTEGER(a) with tag '80', but got '83'. (At offset: 5)")
+
     def test_choice(self):
         foo = asn1tools.compile_string(
             "Foo DEFINITIONS AUTOMATIC TAGS ::= "
@@ -3282,16 +3331,69 @@ class Asn1ToolsBerTest(Asn1ToolsBaseTest):
             "Foo DEFINITIONS IMPLICIT TAGS ::= BEGIN "
             "A ::= [31] INTEGER "
             "B ::= [500] INTEGER "
+            "C ::= CHOICE { a [500] INTEGER, b [501] IA5String } "
+            "D ::= SEQUENCE { a [500] INTEGER OPTIONAL, b [4] BOOLEAN } "
             "END")
 
         datas = [
             ('A', 1, b'\x9f\x1f\x01\x01'),
-            ('B', 1, b'\x9f\x83\x74\x01\x01')
+            ('B', 1, b'\x9f\x83\x74\x01\x01'),
+            ('C', ('a', 1), b'\x9f\x83\x74\x01\x01'),
+            ('C', ('b', 'a'), b'\x9f\x83\x75\x01\x61'),
+            ('D', {'b': True}, b'\x30\x03\x84\x01\xff')
         ]
 
         for type_name, decoded, encoded in datas:
             self.assert_encode_decode(foo, type_name, decoded, encoded)
 
+        # Constructed encoding of a string with a long tag.
+        self.assertEqual(foo.decode('C', b'\xbf\x83\x75\x03\x04\x01\x61'),
+                         ('b', 'a'))
+
+        # Long tag with the last byte missing.
+        with self.assertRaises(asn1tools.DecodeError) as cm:
+            foo.decode('B', b'\x9f\x83')
+
+        self.assertEqual(str(cm.exception),
+                         'B: Ran out of data when reading tag (At offset: 0)')
+
+        with self.assertRaises(asn1tools.DecodeError) as cm:
+            foo.decode('C', b'\x9f\x83')
+
+        self.assertEqual(str(cm.exception),
+                         'C: Ran out of data when reading tag (At offset: 2)')
+
+    def test_decode_long_tag_continuation(self):
+        foo = asn1tools.compile_string(
+            "Foo DEFINITIONS IMPLICIT TAGS ::= BEGIN "
+            "A ::= SEQUENCE { a [500] INTEGER OPTIONAL, b BOOLEAN } "
+            "B ::= CHOICE { a [500] INTEGER, b BOOLEAN } "
+            "END")
+
+        # A tag with a very long run of continuation bytes is rejected
+        # without reading it all.
+        tag = b'\x1f' + 1000000 * b'\xff' + b'\x01'
+
+        with self.assertRaises(asn1tools.DecodeError) as cm:
+            foo.decode('A', tag + b'\x00')
+
+        self.assertEqual(
+            str(cm.exception),
+            "A: Expected SEQUENCE(A) with tag '30', but got '1f'. (At offset: 0)")
+
+        with self.assertRaises(asn1tools.DecodeError) as cm:
+            foo.decode('A', b'\x30\x80' + tag + b'\x00')
+
+        self.assertEqual(
+            str(cm.exception),
+            "A.b: Expected BOOLEAN(b) with tag '01', but got '1f'. (At offset: 2)")
+
+        with self.assertRaises(asn1tools.DecodeError) as cm:
+            foo.decode('B', tag + b'\x00')
+
+        self.assertTrue(str(cm.exception).startswith(
+            "B: Expected CHOICE(B) with tags ['9f8374', '01'], but got '1fff"))
+
     def test_issue_34(self):
         """Test that a choice type with a recursive member can be compiled and
         used.
@@ -3313,6 +3415,37 @@ class Asn1ToolsBerTest(Asn1ToolsBaseTest):
         encoded = b'\x30\x08\xa0\x06\xa0\x04\xa0\x02\x81\x00'
         self.assert_encode_decode(foo, 'A', decoded, encoded)
 
+    def test_long_length_constructed(self):
+        foo = asn1tools.compile_string(
+            "Foo DEFINITIONS IMPLICIT TAGS ::= "
+            "BEGIN "
+            "A ::= SEQUENCE { "
+            "  a [0] EXPLICIT SEQUENCE OF OCTET STRING, "
+            "  ..., "
+            "  [[ "
+            "  b [1] INTEGER, "
+            "  c [2] INTEGER "
+            "  ]] "
+            "} "
+            "END")
+
+        # Long form lengths of all nested constructed encodings.
+        decoded = {'a': [200 * b'\x01']}
+        encoded = (b'\x30\x81\xd1\xa0\x81\xce\x30\x81\xcb\x04\x81\xc8'
+                   + 200 * b'\x01')
+        self.assert_encode_decode(foo, 'A', decoded, encoded)
+
+        # The partially encoded addition group is not part of the
+        # encoding.
+        self.assertEqual(foo.encode('A', {'a': [200 * b'\x01'], 'b': 1}),
+                         encoded)
+
+        # Long form length of the last member only.
+        decoded = {'a': [], 'b': 1, 'c': 128 * 256 ** 126}
+        encoded = (b'\x30\x81\x8a\xa0\x02\x30\x00\x81\x01\x01\x82\x81\x80\x00'
+                   + b'\x80' + 126 * b'\x00')
+        self.assert_encode_decode(foo, 'A', decoded, encoded)
+
     def test_decode_with_length(self):
         foo = asn1tools.compile_string(
             "Foo DEFINITIONS IMPLICIT TAGS ::= "
@@ -3344,6 +3477,151 @@ class Asn1ToolsBerTest(Asn1ToolsBaseTest):
         # Test indefinite length set with end-of-contents tags
         self.assertEqual(foo.decode_with_length('C', b'\x31\x80\xa0\x80\x80\x01\x03\x81\x01\x04\x00\x00\x81\x01\x12\x00\x00'), ({'a': {'a': 3, 'b': 4}, 'b': b'\x12'},17))
 
+    def test_decode_lazy(self):
+        foo = asn1tools.compile_string(
+            "Foo DEFINITIONS AUTOMATIC TAGS ::= "
+            "BEGIN "
+            "A ::= SEQUENCE { "
+            "  a INTEGER, "
+            "  b B OPTIONAL, "
+            "  c BOOLEAN DEFAULT TRUE, "
+            "  d SEQUENCE OF B, "
+            "  ... "
+            "} "
+            "B ::= SET { "
+            "  a IA5String, "
+            "  b CHOICE { a NULL, b A } "
+            "} "
+            "END")
+
+        decoded = {
+            'a': 5,
+            'b': {'a': 'foo', 'b': ('a', None)},
+            'd': [
+                {'a': 'bar', 'b': ('b', {'a': 1, 'd': []})}
+            ]
+        }
+        encoded = foo.encode('A', decoded)
+        decoded_message = foo.decode('A', encoded, lazy=True)
+        self.assertNotIsInstance(decoded_message, dict)
+        self.assertEqual(decoded_message['a'], 5)
+        self.assertEqual(decoded_message['b']['a'], 'foo')
+        self.assertEqual(decoded_message['d'][0]['b'][1]['a'], 1)
+        self.assertEqual(list(decoded_message), ['a', 'b', 'd', 'c'])
+        self.assertEqual(decoded_message, foo.decode('A', encoded))
+        self.assertEqual(
+            repr(decoded_message),
+            "{'a': 5, 'b': {'a': 'foo', 'b': ('a', None)}, "
+            "'d': [{'a': 'bar', 'b': ('b', {'a': 1, 'd': [], 'c': True})}], "
+            "'c': True}")
+
+        # Indefinite length.
+        encoded = (b'\x30\x80\x80\x01\x05\xa3\x80\x31\x80\x80\x00\xa1'
+                   b'\x80\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00')
+        decoded_message = foo.decode('A', encoded, lazy=True)
+        self.assertEqual(decoded_message,
+                         {'a': 5, 'c': True, 'd': [{'a': '', 'b': ('a', None)}]})
+
+        # Member values are not decoded until accessed.
+        encoded = b'\x30\x08\x80\x01\x05\xa1\x01\x00\xa3\x00'
+        decoded_message = foo.decode('A', encoded, lazy=True)
+        self.assertEqual(decoded_message['a'], 5)
+
+        with self.assertRaises(asn1tools.DecodeError) as cm:
+            decoded_message['b']
+
+        self.assertEqual(
+            str(cm.exception),
+            "A.b.a: Expected IA5String(a) with tag '80', but got '00'. (At offset: 7)")
+
+        # Missing mandatory members are found when decoding.
+        with self.assertRaises(asn1tools.DecodeError) as cm:
+            foo.decode('A', b'\x30\x03\x80\x01\x05', lazy=True)
+
+        self.assertEqual(
+            str(cm.exception),
+            "A.d: SequenceOf(d, Set(, [IA5String(a), ExplicitTag(b)])) is missing "
+            "and has no default value (At offset: 5)")
+
+    def test_iter_decode(self):
+        foo = asn1tools.compile_string(
+            "Foo DEFINITIONS IMPLICIT TAGS ::= "
+            "BEGIN "
+            "A ::= SEQUENCE { "
+            "  a [0] INTEGER, "
+            "  b [1] OCTET STRING "
+            "} "
+            "END")
+        decoded = [
+            {'a': 1, 'b': b''},
+            {'a': -5, 'b': 300 * b'\x12'},
+            {'a': 2, 'b': b'\x34'},
+            {'a': 3, 'b': b'\x56\x78'}
+        ]
+        encoded = (b'\x30\x05\x80\x01\x01\x81\x00'
+                   + b'\x30\x82\x01\x33\x80\x01\xfb\x81\x82\x01\x2c'
+                   + 300 * b'\x12'
+                   + b'\x30\x80\x80\x01\x02\x81\x01\x34\x00\x00'
+                   + b'\x30\x07\x80\x01\x03\x81\x02\x56\x78')
+
+        # All data in one chunk.
+        self.assertEqual(list(foo.iter_decode('A', [encoded])), decoded)
+
+        # Chunks of different sizes.
+        for chunk_size in [1, 2, 3, 7, 100]:
+            chunks = [
+                encoded[i:i + chunk_size]
+                for i in range(0, len(encoded), chunk_size)
+            ]
+            self.assertEqual(list(foo.iter_decode('A', chunks)), decoded)
+
+        # File object.
+        self.assertEqual(list(foo.iter_decode('A', BytesIO(encoded))), decoded)
+
+        # Values are yielded as soon as all their data has been read.
+        chunks = iter([encoded[:4], encoded[4:10]])
+        decoded_messages = foo.iter_decode('A', chunks)
+        self.assertEqual(next(decoded_messages), decoded[0])
+
+        # Truncated data.
+        with self.assertRaises(asn1tools.DecodeError) as cm:
+            list(foo.iter_decode('A', [encoded[:-1]]))
+
+        self.assertEqual(str(cm.exception),
+                         'Expected more data after 8 byte(s). (At offset: 328)')
+
+        # Bad data.
+        with self.assertRaises(asn1tools.DecodeError) as cm:
+            list(foo.iter_decode('A', [b'\x31\x00']))
+
+        self.assertEqual(
+            str(cm.exception),
+            "A: Expected SEQUENCE(A) with tag '30', but got '31'. (At offset: 0)")
+
+        # Bad data after the first encoding, in the same or in another
+        # chunk.
+        for chunks in [[encoded[:7] + b'\x31\x00'], [encoded[:7], b'\x31\x00']]:
+            with self.assertRaises(asn1tools.DecodeError) as cm:
+                list(foo.iter_decode('A', chunks))
+
+            self.assertEqual(
+                str(cm.exception),
+                "A: Expected SEQUENCE(A) with tag '30', but got '31'. (At offset: 7)")
+
+        # A long indefinite length encoding is not searched for from its
+        # start for every chunk.
+        encoded = (b'\x30\x80\x80\x01\x02\xa1\x80'
+                   + 1000 * b'\x04\x01\x12'
+                   + b'\x00\x00\x00\x00')
+        chunks = [encoded[i:i + 10] for i in range(0, len(encoded), 10)]
+
+        with patch('asn1tools.codecs.ber.skip_element',
+                   wraps=asn1tools.codecs.ber.skip_element) as skip_element:
+            self.assertEqual(list(foo.iter_decode('A', chunks)),
+                             [{'a': 2, 'b': 1000 * b'\x12'}])
+
+        self.assertLess(skip_element.call_count, 10000)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -704,6 +704,115 @@ class Asn1ToolsCodecsConsistencyTest(Asn1ToolsBaseTest):
         for spec, codec, encoded in zip(specs, CODECS, encoded_messages):
             self.encode_decode_codec(spec, codec, 'Int32', decoded, encoded)
 
+    def test_encode_decode_many(self):
+        spec = (
+            "Foo DEFINITIONS AUTOMATIC TAGS ::= "
+            "BEGIN "
+            "A ::= SEQUENCE { a INTEGER (0..255), b BOOLEAN OPTIONAL } "
+            "END"
+        )
+        decoded = [
+            {'a': 1, 'b': True},
+            {'a': 200},
+            {'a': 0, 'b': False}
+        ]
+
+        for codec in CODECS:
+            foo = asn1tools.compile_string(spec, codec)
+            encoded = list(foo.encode_many('A', decoded))
+            self.assertEqual(encoded,
+                             [foo.encode('A', value) for value in decoded])
+
+            for value in encoded:
+                self.assertEqual(type(value), bytes)
+
+            self.assertEqual(list(foo.decode_many('A',
+                                                  encoded,
+                                                  check_constraints=True)),
+                             decoded)
+
+            # Only the first item is checked.
+            encoded = foo.encode_many('A',
+                                      [{'a': 1}, {'a': 256}],
+                                      check_constraints=True,
+                                      number_of_checks=1)
+            self.assertEqual(next(encoded), foo.encode('A', {'a': 1}))
+
+            with self.assertRaises(asn1tools.ConstraintsError):
+                list(foo.encode_many('A',
+                                     [{'a': 1}, {'a': 256}],
+                                     check_constraints=True))
+
+            with self.assertRaises(asn1tools.EncodeError) as cm:
+                foo.encode_many('B', [])
+
+            self.assertEqual(str(cm.exception),
+                             "Type 'B' not found in types dictionary.")
+
+            with self.assertRaises(asn1tools.DecodeError) as cm:
+                foo.decode_many('B', [])
+
+            self.assertEqual(str(cm.exception),
+                             "Type 'B' not found in types dictionary.")
+
+    def test_extract(self):
+        spec = (
+            "Foo DEFINITIONS AUTOMATIC TAGS ::= "
+            "BEGIN "
+            "A ::= SEQUENCE { "
+            "  a INTEGER, "
+            "  b SEQUENCE OF B, "
+            "  c B OPTIONAL, "
+            "  d BOOLEAN DEFAULT TRUE, "
+            "  e CHOICE { a NULL, b B, ..., c BOOLEAN }, "
+            "  ..., "
+            "  f OCTET STRING, "
+            "  [[ g INTEGER, h B ]] "
+            "} "
+            "B ::= SEQUENCE { "
+            "  a IA5String, "
+            "  b INTEGER (0..7) OPTIONAL "
+            "} "
+            "END"
+        )
+        decoded = {
+            'a': 5,
+            'b': [{'a': 'foo', 'b': 3}, {'a': 'bar'}],
+            'e': ('b', {'a': 'fie', 'b': 1}),
+            'f': b'\x12',
+            'g': 7,
+            'h': {'a': 'fum'}
+        }
+        paths = ['a', 'b', 'c', 'c.a', 'd', 'e.b.a', 'e.a', 'f', 'g', 'h.a', 'i']
+        extracted = {
+            'a': 5,
+            'b': [{'a': 'foo', 'b': 3}, {'a': 'bar'}],
+            'd': True,
+            'e.b.a': 'fie',
+            'f': b'\x12',
+            'g': 7,
+            'h.a': 'fum'
+        }
+
+        for codec in ['ber', 'der', 'per', 'uper']:
+            foo = asn1tools.compile_string(spec, codec)
+            encoded = foo.encode('A', decoded)
+            self.assertEqual(foo.extract('A', encoded, paths), extracted)
+            self.assertEqual(foo.extract('A', encoded, ['e', 'e.b']), {
+                'e': ('b', {'a': 'fie', 'b': 1}),
+                'e.b': {'a': 'fie', 'b': 1}
+            })
+            self.assertEqual(foo.extract('A', encoded, []), {})
+
+            encoded = foo.encode('A', {'a': 1, 'b': [], 'e': ('c', False)})
+            self.assertEqual(foo.extract('A', encoded, ['e.c', 'f', 'd']),
+                             {'e.c': False, 'd': True})
+
+        foo = asn1tools.compile_string(spec, 'oer')
+
+        with self.assertRaises(NotImplementedError):
+            foo.extract('A', b'', ['a'])
+
     def test_c_source(self):
         specs = []
 
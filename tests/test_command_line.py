@@ -1,6 +1,7 @@
 import sys
 import os
 import re
+import shutil
 import unittest
 
 try:
@@ -550,16 +551,28 @@ exit
         )
 
         stdout = StringIO()
+        user_home = 'test_command_line_shell'
+
+        if os.path.exists(user_home):
+            shutil.rmtree(user_home)
+
+        os.mkdir(user_home)
 
         with patch('asn1tools.PromptSession', PromptSession):
             with patch('sys.stdout', stdout):
                 with patch('sys.argv', argv):
-                    asn1tools._main()
+                    with patch('os.path.expanduser', return_value=user_home):
+                        asn1tools._main()
 
         print(stdout.getvalue())
 
         self.assertEqual(expected_output, stdout.getvalue())
 
+        # Compiled specifications are cached in the user's home
+        # directory by default.
+        self.assertTrue(
+            os.path.isdir(os.path.join(user_home, '.asn1tools-cache')))
+
     def test_command_line_shell_compile_without_arguments(self):
         argv = ['asn1tools', 'shell']
         commands = StringIO('''\
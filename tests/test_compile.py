@@ -4,6 +4,7 @@ import asn1tools
 from copy import deepcopy
 import shutil
 import os
+from unittest.mock import patch
 
 sys.path.append('tests/files')
 sys.path.append('tests/files/ietf')
@@ -183,6 +184,244 @@ class Asn1ToolsCompileTest(unittest.TestCase):
 
         self.assertEqual(encoded, encoded_cached)
 
+    def test_cache_options(self):
+        cache_dir = 'test_cache_options'
+
+        if os.path.exists(cache_dir):
+            shutil.rmtree(cache_dir)
+
+        for _ in range(2):
+            foo = asn1tools.compile_files('tests/files/enumerated.asn',
+                                          'uper',
+                                          cache_dir=cache_dir)
+            self.assertEqual(foo.decode('D', b'\x40'), 'z')
+            foo = asn1tools.compile_files('tests/files/enumerated.asn',
+                                          'uper',
+                                          cache_dir=cache_dir,
+                                          numeric_enums=True)
+            self.assertEqual(foo.decode('D', b'\x40'), 25)
+            foo = asn1tools.compile_files('tests/files/enumerated.asn',
+                                          'per',
+                                          cache_dir=cache_dir)
+            self.assertEqual(foo.encode('D', 'z'), b'\x40')
+
+        # Three compiled specifications and one parsed file.
+        self.assertEqual(
+            sorted(name.split('.')[1] for name in os.listdir(cache_dir)),
+            4 * ['index'] + 4 * ['pickle'])
+
+    def test_cache_modified_file(self):
+        cache_dir = 'test_cache_modified_file'
+        filename = os.path.join(cache_dir, 'foo.asn')
+
+        if os.path.exists(cache_dir):
+            shutil.rmtree(cache_dir)
+
+        os.mkdir(cache_dir)
+
+        for type_ in ['BOOLEAN', 'NULL']:
+            with open(filename, 'w') as fout:
+                fout.write('Foo DEFINITIONS ::= BEGIN A ::= {} END'.format(type_))
+
+            # Make sure the modification time differs.
+            os.utime(filename, (0, 0) if type_ == 'NULL' else None)
+            foo = asn1tools.compile_files(filename, cache_dir=cache_dir)
+            self.assertEqual(foo.types['A'].type.type_name, type_)
+
+    def test_cache_eviction(self):
+        cache_dir = 'test_cache_eviction'
+
+        if os.path.exists(cache_dir):
+            shutil.rmtree(cache_dir)
+
+        cache = asn1tools.cache.Cache(cache_dir, size_limit=5000)
+
+        for codec in ['ber', 'per', 'uper', 'ber']:
+            foo = cache.get(['tests/files/foo.asn'],
+                            [codec],
+                            lambda: asn1tools.compile_files('tests/files/foo.asn',
+                                                            codec))
+            self.assertEqual(foo.decode('Question', foo.encode('Question', {
+                'id': 1,
+                'question': 'Is 1+1=3?'
+            })), {'id': 1, 'question': 'Is 1+1=3?'})
+
+        size = sum(os.path.getsize(os.path.join(cache_dir, name))
+                   for name in os.listdir(cache_dir))
+        self.assertLessEqual(size, 5000)
+
+        # Corrupt entries are replaced.
+        for name in os.listdir(cache_dir):
+            with open(os.path.join(cache_dir, name), 'wb') as fout:
+                fout.write(b'corrupt')
+
+        foo = cache.get(['tests/files/foo.asn'],
+                        ['ber'],
+                        lambda: asn1tools.compile_files('tests/files/foo.asn'))
+        self.assertEqual(foo.encode('Question', {'id': 1, 'question': 'Is 1+1=3?'}),
+                         b'0\x0e\x02\x01\x01\x16\x09Is 1+1=3?')
+
+    def test_save_load(self):
+        filename = 'test_save_load.json'
+        datas = [
+            ('ber', {}, 'D', 'z', b'\x0a\x01\x19'),
+            ('uper', {}, 'D', 'z', b'\x40'),
+            ('uper', {'numeric_enums': True}, 'D', 25, b'\x40'),
+            ('per', {'specialize': True}, 'D', 'z', b'\x40'),
+            ('per', {'lazy': True}, 'D', 'z', b'\x40'),
+            ('jer', {}, 'D', 'z', b'"z"')
+        ]
+
+        for codec, options, type_name, decoded, encoded in datas:
+            foo = asn1tools.compile_files('tests/files/enumerated.asn',
+                                          codec,
+                                          **options)
+            foo.save(filename)
+            foo = asn1tools.load(filename)
+            self.assertEqual(foo.encode(type_name, decoded), encoded)
+            self.assertEqual(foo.decode(type_name, encoded), decoded)
+
+            # A loaded specification can be saved as well.
+            foo.save(filename)
+            foo = asn1tools.load(filename)
+            self.assertEqual(foo.decode(type_name, encoded), decoded)
+
+        # Types referring to themselves and values shared by many
+        # types.
+        parsed = asn1tools.parse_files('tests/files/3gpp/rrc_8_6_0.asn')
+        rrc = asn1tools.compile_dict(parsed, 'uper')
+        rrc.save(filename)
+        loaded = asn1tools.load(filename)
+        self.assertEqual(sorted(loaded.types), sorted(rrc.types))
+
+        for name, type_ in rrc.types.items():
+            self.assertEqual(repr(loaded.types[name]), repr(type_))
+
+        # ANY DEFINED BY choices are saved.
+        spec = ('Foo DEFINITIONS ::= BEGIN '
+                'Fie ::= SEQUENCE { bar INTEGER, fum ANY DEFINED BY bar } '
+                'END')
+        foo = asn1tools.compile_string(
+            spec,
+            any_defined_by_choices={('Foo', 'Fie', 'fum'): {1: 'INTEGER'}})
+        foo.save(filename)
+        foo = asn1tools.load(filename)
+        self.assertEqual(foo.encode('Fie', {'bar': 1, 'fum': 5}),
+                         b'\x30\x06\x02\x01\x01\x02\x01\x05')
+
+        # Types no longer matching the compiled types.
+        parsed = asn1tools.parse_string(spec)
+        foo = asn1tools.compile_dict(parsed)
+        del parsed['Foo']['types']['Fie']
+
+        with self.assertRaises(asn1tools.CompileError) as cm:
+            foo.save(filename)
+
+        self.assertEqual(str(cm.exception),
+                         'The specification has been modified since compiled.')
+
+        os.remove(filename)
+
+    def test_lazy(self):
+        spec = ('Foo DEFINITIONS AUTOMATIC TAGS ::= BEGIN '
+                'A ::= SEQUENCE { a B OPTIONAL } '
+                'B ::= SEQUENCE { b A OPTIONAL } '
+                'C ::= INTEGER (0..7) '
+                'END')
+        decoded = {'a': {'b': {'a': {}}}}
+
+        with patch('asn1tools.codecs.uper.Compiler.process_type',
+                   side_effect=asn1tools.codecs.uper.Compiler.process_type,
+                   autospec=True) as process_type:
+            foo = asn1tools.compile_string(spec, 'uper', lazy=True)
+            self.assertEqual(process_type.call_count, 0)
+            self.assertEqual(sorted(foo.types), ['A', 'B', 'C'])
+            self.assertEqual(len(foo.modules['Foo']), 3)
+            self.assertEqual(process_type.call_count, 0)
+
+            # Compiled once on first access.
+            for _ in range(2):
+                encoded = foo.encode('A', decoded)
+                self.assertEqual(foo.decode('A', encoded), decoded)
+
+            self.assertEqual(process_type.call_count, 1)
+            self.assertIs(foo.types['A'], foo.modules['Foo']['A'])
+
+        self.assertEqual(encoded,
+                         asn1tools.compile_string(spec, 'uper').encode('A', decoded))
+
+        with self.assertRaises(asn1tools.ConstraintsError) as cm:
+            foo.encode('C', 8, check_constraints=True)
+
+        self.assertEqual(str(cm.exception),
+                         'C: Expected an integer between 0 and 7, but got 8.')
+
+        with self.assertRaises(asn1tools.EncodeError) as cm:
+            foo.encode('C', None)
+
+        self.assertEqual(str(cm.exception),
+                         'C: Expected data of type int or str, but got None.')
+
+        # Errors are raised when the type is accessed.
+        foo = asn1tools.compile_string('A DEFINITIONS ::= BEGIN A ::= B C ::= NULL END',
+                                       lazy=True)
+        self.assertEqual(foo.encode('C', None), b'\x05\x00')
+
+        with self.assertRaises(asn1tools.CompileError) as cm:
+            foo.types['A']
+
+        self.assertEqual(str(cm.exception), "Type 'B' not found in module 'A'.")
+
+    def test_codecs(self):
+        decoded = {'id': 1, 'question': 'Is 1+1=3?'}
+        cache_dir = 'test_codecs'
+
+        if os.path.exists(cache_dir):
+            shutil.rmtree(cache_dir)
+
+        for kwargs in [{}, {'lazy': True}, {'cache_dir': cache_dir}]:
+            foo = asn1tools.compile_files('tests/files/foo.asn',
+                                          codecs=['ber', 'uper', 'jer'],
+                                          **kwargs)
+            self.assertEqual(sorted(foo), ['ber', 'jer', 'uper'])
+
+            for codec, specification in foo.items():
+                expected = asn1tools.compile_files('tests/files/foo.asn', codec)
+                self.assertEqual(sorted(specification.types), sorted(expected.types))
+                encoded = specification.encode('Question', decoded)
+                self.assertEqual(encoded, expected.encode('Question', decoded))
+                self.assertEqual(specification.decode('Question', encoded), decoded)
+
+            # Type and constraints checkers are shared by all codecs.
+            for attribute in ['type_checker', 'constraints_checker']:
+                self.assertIs(getattr(foo['ber'].types['Question'], attribute),
+                              getattr(foo['jer'].types['Question'], attribute))
+
+        with self.assertRaises(asn1tools.CompileError) as cm:
+            asn1tools.compile_files('tests/files/foo.asn', codecs=['ber', 'foo'])
+
+        self.assertEqual(str(cm.exception), "Unsupported codec 'foo'.")
+
+    def test_load_errors(self):
+        filename = 'test_load_errors.json'
+        datas = [
+            ('corrupt', 'Invalid serialized specification.'),
+            ('{"format":"foo","version":1}', 'Invalid serialized specification.'),
+            ('{"format":"asn1tools-specification","version":2}',
+             'Unsupported serialized specification version 2.')
+        ]
+
+        for data, message in datas:
+            with open(filename, 'w') as fout:
+                fout.write(data)
+
+            with self.assertRaises(asn1tools.CompileError) as cm:
+                asn1tools.load(filename)
+
+            self.assertEqual(str(cm.exception), message)
+
+        os.remove(filename)
+
     def test_missing_parameterized_type(self):
         with self.assertRaises(asn1tools.CompileError) as cm:
             asn1tools.compile_string(
@@ -511,6 +511,57 @@ class Asn1ToolsCheckConstraintsTest(Asn1ToolsBaseTest):
 
         self.assert_encode_decode_bad(foo, datas)
 
+    def test_unconstrained(self):
+        foo = asn1tools.compile_string(
+            "Foo DEFINITIONS AUTOMATIC TAGS ::= "
+            "BEGIN "
+            "A ::= SEQUENCE { a INTEGER, b BOOLEAN, c SEQUENCE OF UTF8String } "
+            "B ::= SEQUENCE { a INTEGER, b SEQUENCE OF INTEGER (0..1) } "
+            "C ::= CHOICE { a INTEGER, b IA5String (SIZE (1)) } "
+            "D ::= CHOICE { a INTEGER, ... } "
+            "END")
+
+        # Types without constraints are not checked.
+        self.assertFalse(foo.types['A'].constraints_checker.is_constrained)
+        self.assertTrue(foo.types['B'].constraints_checker.is_constrained)
+        self.assertTrue(foo.types['C'].constraints_checker.is_constrained)
+        self.assertFalse(foo.types['D'].constraints_checker.is_constrained)
+
+        # Ok.
+        datas = [
+            ('A', {'a': 5, 'b': True, 'c': ['foo']}),
+            ('B', {'a': -1, 'b': [0, 1]}),
+            ('C', ('a', 1000)),
+            ('C', ('b', 'a')),
+            ('D', ('a', 0))
+        ]
+
+        self.assert_encode_decode_ok(foo, datas)
+
+        # Not ok.
+        datas = [
+            ('B',
+             {'a': 0, 'b': [0, 2]},
+             'B.b: Expected an integer between 0 and 1, but got 2.'),
+            ('C',
+             ('b', 'ab'),
+             'C.b: Expected between 1 and 1 characters, but got 2.'),
+            ('C',
+             ('b', '\xe5'),
+             "C.b: Expected a character in '........................"
+             "........ !\"#$%&'()*+,-./0123456789:;<=>?@ABCDEFGHIJKLMNO"
+             "PQRSTUVWXYZ[\\]^_`abcdefghijklmnopqrstuvwxyz{|}~.', but "
+             "got '.' (0xe5).")
+        ]
+
+        self.assert_encode_decode_bad(foo, datas, decode_check=False)
+
+        with self.assertRaises(asn1tools.ConstraintsError) as cm:
+            foo.encode('C', ('c', 1), check_types=False, check_constraints=True)
+
+        self.assertEqual(str(cm.exception),
+                         "C: Expected choice 'a' or 'b', but got 'c'.")
+
 
 if __name__ == '__main__':
     unittest.main()
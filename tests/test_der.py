@@ -223,6 +223,51 @@ class Asn1ToolsDerTest(Asn1ToolsBaseTest):
         for type_name, decoded, encoded in datas:
             self.assert_encode_decode(foo, type_name, decoded, encoded)
 
+    def test_set_of(self):
+        foo = asn1tools.compile_string(
+            "Foo DEFINITIONS IMPLICIT TAGS ::= "
+            "BEGIN "
+            "A ::= SET OF INTEGER "
+            "B ::= SET OF OCTET STRING "
+            "C ::= SEQUENCE { a A, b B } "
+            "END",
+            'der')
+
+        datas = [
+            ('A', [], b'\x31\x00'),
+            ('A',
+             [1, 2, 3],
+             b'\x31\x09\x02\x01\x01\x02\x01\x02\x02\x01\x03'),
+            ('A', [2, 256], b'\x31\x07\x02\x01\x02\x02\x02\x01\x00'),
+            ('B', [b'a', b'ab'], b'\x31\x07\x04\x01\x61\x04\x02\x61\x62'),
+            ('B',
+             [200 * b'\x01', 200 * b'\x02'],
+             b'\x31\x82\x01\x96\x04\x81\xc8' + 200 * b'\x01'
+             + b'\x04\x81\xc8' + 200 * b'\x02'),
+            ('C',
+             {'a': [1, 2], 'b': [b'a', b'b']},
+             b'\x30\x10\x31\x06\x02\x01\x01\x02\x01\x02\x31\x06\x04\x01'
+             b'\x61\x04\x01\x62')
+        ]
+
+        for type_name, decoded, encoded in datas:
+            self.assert_encode_decode(foo, type_name, decoded, encoded)
+
+        # Elements are sorted by their encodings.
+        datas = [
+            ('A', [3, 1, 2], [1, 2, 3]),
+            ('A', [256, 2], [2, 256]),
+            ('B', [b'ab', b'a'], [b'a', b'ab']),
+            ('B', [200 * b'\x02', 200 * b'\x01'], [200 * b'\x01', 200 * b'\x02']),
+            ('C',
+             {'a': [2, 1], 'b': [b'b', b'a']},
+             {'a': [1, 2], 'b': [b'a', b'b']})
+        ]
+
+        for type_name, decoded, sorted_decoded in datas:
+            self.assertEqual(foo.encode(type_name, decoded),
+                             foo.encode(type_name, sorted_decoded))
+
     def test_utf8_string(self):
         foo = asn1tools.compile_string(
             "Foo DEFINITIONS AUTOMATIC TAGS ::= "
@@ -465,6 +465,49 @@ class Asn1ToolsOerTest(Asn1ToolsBaseTest):
         for type_name, decoded, encoded in datas:
             self.assert_encode_decode(foo, type_name, decoded, encoded)
 
+    def test_sequence_of_fixed_size_elements(self):
+        foo = asn1tools.compile_string(
+            "Foo DEFINITIONS AUTOMATIC TAGS ::= "
+            "BEGIN "
+            "A ::= SEQUENCE (SIZE (0..10)) OF INTEGER (-3..3) "
+            "B ::= SEQUENCE OF INTEGER (0..65535) "
+            "C ::= SEQUENCE { "
+            "  a BOOLEAN, "
+            "  b SEQUENCE (SIZE (3)) OF INTEGER (1..300) "
+            "} "
+            "D ::= SEQUENCE (SIZE (0..10)) OF BOOLEAN "
+            "E ::= SEQUENCE OF INTEGER (-128..127) "
+            "END",
+            'oer')
+
+        datas = [
+            ('A', [-3, 0, 3, 1], b'\x01\x04\xfd\x00\x03\x01'),
+            ('B', [1, 2, 65535], b'\x01\x03\x00\x01\x00\x02\xff\xff'),
+            ('C',
+             {'a': True, 'b': [1, 256, 300]},
+             b'\xff\x01\x03\x00\x01\x01\x00\x01\x2c'),
+            ('D', [True, False, True], b'\x01\x03\xff\x00\xff'),
+            ('E', [-128, 0, 127], b'\x01\x03\x80\x00\x7f')
+        ]
+
+        for type_name, decoded, encoded in datas:
+            self.assert_encode_decode(foo, type_name, decoded, encoded)
+
+        # Out of data at the first element that does not fit.
+        datas = [
+            ('A', b'\x01\x04\xfd\x00\x03',
+             'A: out of data (At bit offset: 40)'),
+            ('B', b'\x01\x03\x00\x01\x00\x02\xff',
+             'B: out of data (At bit offset: 48)'),
+            ('D', b'\x01\x03\xff\x00', 'D: out of data (At bit offset: 32)')
+        ]
+
+        for type_name, encoded, message in datas:
+            with self.assertRaises(asn1tools.DecodeError) as cm:
+                foo.decode(type_name, encoded)
+
+            self.assertEqual(str(cm.exception), message)
+
     def test_choice(self):
         foo = asn1tools.compile_string(
             "Foo DEFINITIONS AUTOMATIC TAGS ::= "
@@ -960,6 +1003,10 @@ class Asn1ToolsOerTest(Asn1ToolsBaseTest):
             "  ..., "
             "  a BOOLEAN "
             "} "
+            "D ::= SEQUENCE { "
+            "  a BOOLEAN OPTIONAL, "
+            "  b INTEGER (0..65535) "
+            "} "
             "END",
             'oer')
 
@@ -984,6 +1031,13 @@ class Asn1ToolsOerTest(Asn1ToolsBaseTest):
         self.assertEqual(str(cm.exception),
                          "C: out of data (At bit offset: 0)")
 
+        # Fails trying to read a fixed size integer.
+        with self.assertRaises(asn1tools.DecodeError) as cm:
+            foo.decode('D', b'\x80\x00')
+
+        self.assertEqual(str(cm.exception),
+                         "D.b: out of data (At bit offset: 16)")
+
     def test_c_source(self):
         files = [
             'tests/files/c_source/c_source.asn'
@@ -1019,6 +1073,29 @@ class Asn1ToolsOerTest(Asn1ToolsBaseTest):
 
         self.assertEqual(str(cm.exception), "This codec does not support decode_with_length().")
 
+    def test_large_message(self):
+        foo = asn1tools.compile_string(
+            "Foo DEFINITIONS AUTOMATIC TAGS ::= "
+            "BEGIN "
+            "A ::= SEQUENCE OF SEQUENCE { "
+            "  a INTEGER, "
+            "  b BOOLEAN OPTIONAL, "
+            "  ..., "
+            "  c ENUMERATED { d(0), e(1000) } "
+            "} "
+            "END",
+            'oer')
+
+        decoded = 10000 * [{'a': -129, 'b': True, 'c': 'e'}]
+        encoded = foo.encode('A', decoded)
+
+        self.assertEqual(len(encoded), 3 + 10000 * 12)
+        self.assertEqual(encoded[:16],
+                         b'\x02\x27\x10\xc0\x02\xff\x7f\xff\x02\x07\x80\x03\x82\x03'
+                         b'\xe8\xc0')
+        self.assertEqual(foo.decode('A', encoded), decoded)
+        self.assertEqual(foo.decode('A', memoryview(encoded)), decoded)
+
 
 if __name__ == '__main__':
     unittest.main()
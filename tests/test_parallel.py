@@ -0,0 +1,77 @@
+import unittest
+import asn1tools
+
+
+class Asn1ToolsParallelTest(unittest.TestCase):
+
+    def test_decode_parallel(self):
+        foo = asn1tools.compile_files('tests/files/foo.asn', 'uper')
+        decoded = [
+            {'id': id_, 'question': 'Is {}+1=3?'.format(id_)}
+            for id_ in range(100)
+        ]
+        encoded = list(foo.encode_many('Question', decoded))
+
+        for workers, chunksize in [(1, 1), (2, 7), (3, 256)]:
+            decoded_message = asn1tools.parallel.decode_parallel(
+                'tests/files/foo.asn',
+                'uper',
+                'Question',
+                iter(encoded),
+                workers=workers,
+                chunksize=chunksize,
+                check_constraints=True)
+            self.assertEqual(list(decoded_message), decoded)
+
+    def test_decode_parallel_error(self):
+        decoded_message = asn1tools.parallel.decode_parallel(
+            'tests/files/foo.asn',
+            'ber',
+            'Question',
+            [b'\x30\x0e\x02\x01\x01\x16\x09Is 1+1=3?', b'\x31'],
+            workers=2,
+            chunksize=1)
+
+        self.assertEqual(next(decoded_message),
+                         {'id': 1, 'question': 'Is 1+1=3?'})
+
+        with self.assertRaises(asn1tools.DecodeError):
+            next(decoded_message)
+
+    def test_decode_parallel_consumes_lazily(self):
+        foo = asn1tools.compile_files('tests/files/foo.asn', 'uper')
+        encoded = foo.encode('Question', {'id': 1, 'question': 'Is 1+1=3?'})
+        consumed = []
+
+        def messages():
+            for i in range(1000):
+                consumed.append(i)
+                yield encoded
+
+        decoded_message = asn1tools.parallel.decode_parallel(
+            'tests/files/foo.asn',
+            'uper',
+            'Question',
+            messages(),
+            workers=2,
+            chunksize=1)
+
+        self.assertEqual(next(decoded_message),
+                         {'id': 1, 'question': 'Is 1+1=3?'})
+        self.assertLess(len(consumed), 10)
+        self.assertEqual(len(list(decoded_message)), 999)
+        self.assertEqual(len(consumed), 1000)
+
+    def test_unknown_type(self):
+        with self.assertRaises(asn1tools.DecodeError) as cm:
+            asn1tools.parallel.decode_parallel('tests/files/foo.asn',
+                                               'ber',
+                                               'Foo',
+                                               [])
+
+        self.assertEqual(str(cm.exception),
+                         "Type 'Foo' not found in types dictionary.")
+
+
+if __name__ == '__main__':
+    unittest.main()
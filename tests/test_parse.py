@@ -1,6 +1,9 @@
+import os
 import sys
+import shutil
 import unittest
 import importlib
+from unittest.mock import patch
 
 import asn1tools
 
@@ -30,6 +33,8 @@ class Asn1ToolsParseTest(unittest.TestCase):
 
         module = importlib.import_module(module)
         self.assertEqual(actual, module.EXPECTED)
+        self.assertEqual(asn1tools.parse_files(asn_path, backend='fast'),
+                         module.EXPECTED)
 
     def test_parse_foo(self):
         self.parse_and_verify('foo')
@@ -549,6 +554,169 @@ class Asn1ToolsParseTest(unittest.TestCase):
     def test_parse_encoding(self):
         asn1tools.parse_files('tests/files/foo.asn', encoding='ascii')
 
+    def test_parse_grammar_reused(self):
+        self.assertIs(asn1tools.parser.get_grammar(),
+                      asn1tools.parser.get_grammar())
+        self.assertEqual(asn1tools.parse_files('tests/files/foo.asn'),
+                         asn1tools.parse_files('tests/files/foo.asn'))
+
+    def test_parse_fast_backend(self):
+        specification = ('A DEFINITIONS ::= BEGIN '
+                         'IMPORTS '
+                         'a FROM B '
+                         'c, d FROM E global-module-reference '
+                         'f, g FROM H {iso(1)}; '
+                         'ENDa ::= INTEGER '
+                         'END')
+
+        self.assertEqual(asn1tools.parse_string(specification),
+                         asn1tools.parse_string(specification,
+                                                backend='pyparsing'))
+
+        # The fast backend is the default, and the Pyparsing grammar is
+        # not used when it succeeds.
+        with patch('asn1tools.parser.get_grammar') as get_grammar:
+            asn1tools.parse_string(specification)
+            asn1tools.parse_string(specification, backend='fast')
+
+        self.assertEqual(get_grammar.call_count, 0)
+
+    def test_parse_fast_backend_error(self):
+        # The specification is parsed again by the Pyparsing backend
+        # for its detailed error messages.
+        datas = [
+            ('A DEFINITIONS ::= END',
+             "Invalid ASN.1 syntax at line 1, column 19: "
+             "'A DEFINITIONS ::= >!<END': Expected BEGIN."),
+            ('',
+             "Invalid ASN.1 syntax at line 1, column 1: '>!<': "
+             "Expected modulereference."),
+            ('A DEFINITIONS ::= \n'
+             'BEGIN /* END',
+             "Invalid ASN.1 syntax at line 2, column 7: 'BEGIN >!</* END': "
+             "Missing */ for multi line comment."),
+            ('A DEFINITIONS ::= BEGIN '
+             'E ::= ENUMERATED { a(0), b(0) } '
+             'END',
+             "Duplicated ENUMERATED number 0 at line 1.")
+        ]
+
+        for specification, message in datas:
+            for backend in ['fast', 'pyparsing']:
+                with self.assertRaises(asn1tools.ParseError) as cm:
+                    asn1tools.parse_string(specification, backend=backend)
+
+                self.assertEqual(str(cm.exception), message)
+
+    def test_parse_files_cache(self):
+        directory = 'test_parse_files_cache'
+        filenames = [
+            os.path.join(directory, 'a.asn'),
+            os.path.join(directory, 'b.asn')
+        ]
+
+        if os.path.exists(directory):
+            shutil.rmtree(directory)
+
+        os.mkdir(directory)
+
+        with open(filenames[0], 'w') as fout:
+            fout.write('A DEFINITIONS ::= BEGIN A ::= BOOLEAN END')
+
+        for cache_dir in [None, os.path.join(directory, 'cache')]:
+            for type_ in ['INTEGER', 'NULL']:
+                with open(filenames[1], 'w') as fout:
+                    fout.write('B DEFINITIONS ::= BEGIN B ::= {} END'.format(type_))
+
+                # Make sure the modification time differs.
+                os.utime(filenames[1], (0, 0) if type_ == 'NULL' else None)
+
+                with patch('asn1tools.parser.parse_string',
+                           wraps=asn1tools.parser.parse_string) as parse_string:
+                    parsed = asn1tools.parse_files(filenames, cache_dir=cache_dir)
+
+                self.assertEqual(parsed['A']['types'], {'A': {'type': 'BOOLEAN'}})
+                self.assertEqual(parsed['B']['types'], {'B': {'type': type_}})
+
+                # Without a cache all files are parsed as one
+                # specification. With a cache both files are parsed the
+                # first time, and then only the modified file.
+                if cache_dir is None:
+                    self.assertEqual(parse_string.call_count, 1)
+                else:
+                    self.assertEqual(parse_string.call_count,
+                                     2 if type_ == 'INTEGER' else 1)
+
+                # The cache is not modified when modifying parsed
+                # specifications.
+                del parsed['A']['types']['A']
+                parsed = asn1tools.parse_files(filenames, cache_dir=cache_dir)
+                self.assertEqual(parsed['A']['types'], {'A': {'type': 'BOOLEAN'}})
+
+    def test_parse_files_module_split_over_files(self):
+        directory = 'test_parse_files_module_split_over_files'
+        cache_dir = os.path.join(directory, 'cache')
+        filenames = [
+            os.path.join(directory, 'a.asn'),
+            os.path.join(directory, 'b.asn'),
+            os.path.join(directory, 'c.asn')
+        ]
+
+        if os.path.exists(directory):
+            shutil.rmtree(directory)
+
+        os.mkdir(directory)
+
+        with open(filenames[0], 'w') as fout:
+            fout.write('A DEFINITIONS ::= BEGIN A ::= BOOLEAN END')
+
+        with open(filenames[1], 'w') as fout:
+            fout.write('B DEFINITIONS ::= BEGIN B ::= BOOLEAN')
+
+        with open(filenames[2], 'w') as fout:
+            fout.write('C ::= NULL END')
+
+        for call_count in [3, 2]:
+            with patch('asn1tools.parser.parse_string',
+                       wraps=asn1tools.parser.parse_string) as parse_string:
+                parsed = asn1tools.parse_files(filenames, cache_dir=cache_dir)
+
+            self.assertEqual(parsed['A']['types'], {'A': {'type': 'BOOLEAN'}})
+            self.assertEqual(parsed['B']['types'],
+                             {'B': {'type': 'BOOLEAN'}, 'C': {'type': 'NULL'}})
+
+            # The first file is parsed once and then found in the
+            # cache. The second file can not be parsed on its own, and
+            # is parsed again together with the third file.
+            self.assertEqual(parse_string.call_count, call_count)
+            self.assertEqual(parse_string.call_args_list[-1][0][0],
+                             '\nB DEFINITIONS ::= BEGIN B ::= BOOLEAN\n'
+                             'C ::= NULL END\n')
+
+        self.assertEqual(parsed, asn1tools.parse_files(filenames))
+
+        # Same error as when parsing all files as one specification.
+        with open(filenames[2], 'w') as fout:
+            fout.write('C ::= NULL\nD ::= FOO BAR END')
+
+        with self.assertRaises(asn1tools.ParseError) as cm:
+            asn1tools.parse_files(filenames)
+
+        message = str(cm.exception)
+        self.assertIn('line 4', message)
+
+        with self.assertRaises(asn1tools.ParseError) as cm:
+            asn1tools.parse_files(filenames, cache_dir=cache_dir)
+
+        self.assertEqual(str(cm.exception), message)
+
+    def test_parse_unsupported_backend(self):
+        with self.assertRaises(asn1tools.ParseError) as cm:
+            asn1tools.parse_files('tests/files/foo.asn', backend='foo')
+
+        self.assertEqual(str(cm.exception),
+                         "Unsupported parser backend 'foo'.")
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -743,6 +743,51 @@ class Asn1ToolsPerTest(Asn1ToolsBaseTest):
         for type_name, decoded, encoded in datas:
             self.assert_encode_decode(foo, type_name, decoded, encoded)
 
+    def test_sequence_of_fixed_size_elements(self):
+        foo = asn1tools.compile_string(
+            "Foo DEFINITIONS AUTOMATIC TAGS ::= "
+            "BEGIN "
+            "A ::= SEQUENCE (SIZE (0..10)) OF INTEGER (-3..3) "
+            "B ::= SEQUENCE OF INTEGER (0..65535) "
+            "C ::= SEQUENCE { "
+            "  a BOOLEAN, "
+            "  b SEQUENCE (SIZE (3)) OF INTEGER (1..300) "
+            "} "
+            "D ::= SEQUENCE (SIZE (0..10)) OF BOOLEAN "
+            "E ::= SEQUENCE OF INTEGER (-128..127) "
+            "END",
+            'per')
+
+        datas = [
+            ('A', [-3, 0, 3, 1], b'\x40\xf4'),
+            ('B', [1, 2, 65535], b'\x03\x00\x01\x00\x02\xff\xff'),
+            ('B', 16384 * [1], b'\xc1' + 16384 * b'\x00\x01' + b'\x00'),
+            ('C',
+             {'a': True, 'b': [1, 256, 300]},
+             b'\x80\x00\x00\x00\xff\x01\x2b'),
+            ('D', [True, False, True], b'\x3a'),
+            ('E', [-128, 0, 127], b'\x03\x00\x80\xff')
+        ]
+
+        for type_name, decoded, encoded in datas:
+            self.assert_encode_decode(foo, type_name, decoded, encoded)
+
+        # Out of data at the first element that does not fit.
+        datas = [
+            ('A', b'\x40', 'A: out of data (At bit offset: 7)'),
+            ('B', b'\x03\x00\x01\x00\x02\xff',
+             'B: out of data (At bit offset: 40)'),
+            ('C',
+             b'\x80\x00\x00\x00\xff\x01',
+             'C.b: out of data (At bit offset: 40)')
+        ]
+
+        for type_name, encoded, message in datas:
+            with self.assertRaises(asn1tools.DecodeError) as cm:
+                foo.decode(type_name, encoded)
+
+            self.assertEqual(str(cm.exception), message)
+
     def test_choice(self):
         foo = asn1tools.compile_string(
             "Foo DEFINITIONS AUTOMATIC TAGS ::= "
@@ -1168,6 +1213,7 @@ class Asn1ToolsPerTest(Asn1ToolsBaseTest):
             "  a BMPString (SIZE(1..128)), "
             "  b BMPString (SIZE(1..256)) "
             "} "
+            "D ::= BMPString (FROM (\"\ud7f0\"..\"\ud80f\")) "
             "END",
             'per')
 
@@ -1191,6 +1237,12 @@ class Asn1ToolsPerTest(Asn1ToolsBaseTest):
                          "A: Expected a value in %s, but got %d." % (valid_chars,
                                                                   0xd800,))
 
+        # Surrogates are not characters.
+        self.assertEqual(foo.decode('D', b'\x01\x0f'), '\ud7ff')
+
+        with self.assertRaises(UnicodeDecodeError):
+            foo.decode('D', b'\x01\x10')
+
     def test_graphic_string(self):
         foo = asn1tools.compile_string(
             "Foo DEFINITIONS AUTOMATIC TAGS ::= "
@@ -0,0 +1,258 @@
+import unittest
+import pickle
+import asn1tools
+
+try:
+    from unittest.mock import patch
+except ImportError:
+    from mock import patch
+
+from . import test_per
+from . import test_uper
+
+
+def specialized(compile_function):
+    def wrapper(specification, codec='ber', *args, **kwargs):
+        return compile_function(specification,
+                                codec,
+                                *args,
+                                specialize=(codec in ['per', 'uper']),
+                                **kwargs)
+
+    return wrapper
+
+
+class SpecializeMixin(object):
+    """Run the tests with specialized encoders and decoders.
+
+    """
+
+    def setUp(self):
+        for name in ['compile_dict', 'compile_string', 'compile_files']:
+            patcher = patch.object(asn1tools,
+                                   name,
+                                   specialized(getattr(asn1tools, name)))
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def assert_encode_decode(self,
+                             specification,
+                             type_name,
+                             decoded_message,
+                             encoded_message):
+        super(SpecializeMixin, self).assert_encode_decode(specification,
+                                                          type_name,
+                                                          decoded_message,
+                                                          encoded_message)
+
+        # The generated functions must not fail and fall back to the
+        # generic encoder and decoder.
+        compiled_type = specification.types[type_name]
+        encode, decode = compiled_type.specialized()
+        encoder = compiled_type.ENCODER()
+        encode(decoded_message, encoder)
+        self.assertEqual(encoder.as_bytearray(), encoded_message)
+        self.assertEqual(decode(compiled_type.DECODER(encoded_message)),
+                         decoded_message)
+
+        # Same for the type checking encode function.
+        encode = compiled_type.specialized_checked()
+        encoder = compiled_type.ENCODER()
+        encode(decoded_message, encoder)
+        self.assertEqual(encoder.as_bytearray(), encoded_message)
+
+
+class Asn1ToolsPerSpecializedTest(SpecializeMixin,
+                                  test_per.Asn1ToolsPerTest):
+    pass
+
+
+class Asn1ToolsUPerSpecializedTest(SpecializeMixin,
+                                   test_uper.Asn1ToolsUPerTest):
+    pass
+
+
+class Asn1ToolsSpecializerTest(unittest.TestCase):
+
+    def test_unsupported_codec(self):
+        with self.assertRaises(asn1tools.CompileError) as cm:
+            asn1tools.compile_string(
+                "Foo DEFINITIONS ::= BEGIN A ::= BOOLEAN END",
+                'ber',
+                specialize=True)
+
+        self.assertEqual(str(cm.exception),
+                         "Specialization is not supported by codec 'ber'.")
+
+    def test_pickle(self):
+        foo = asn1tools.compile_files('tests/files/foo.asn',
+                                      'uper',
+                                      specialize=True)
+        decoded = {'id': 1, 'question': 'Is 1+1=3?'}
+        encoded = foo.encode('Question', decoded)
+        foo = pickle.loads(pickle.dumps(foo))
+        self.assertEqual(foo.encode('Question', decoded), encoded)
+        self.assertEqual(foo.decode('Question', encoded), decoded)
+
+    def test_errors(self):
+        foo = asn1tools.compile_string(
+            "Foo DEFINITIONS AUTOMATIC TAGS ::= "
+            "BEGIN "
+            "A ::= SEQUENCE { "
+            "  a CHOICE { "
+            "    b ENUMERATED { c, d, e }, "
+            "    c BOOLEAN, "
+            "    d NULL "
+            "  } "
+            "} "
+            "END",
+            'uper',
+            specialize=True)
+        compiled_type = foo.types['A']
+
+        # Errors are raised by the generated functions, with the same
+        # messages as the generic encoder and decoder, which are not
+        # called.
+        with patch.object(compiled_type._type, 'encode') as encode:
+            datas = [
+                ({}, "A: Sequence member 'a' not found in {}."),
+                ({'a': ('x', None)},
+                 "A.a: Expected choice 'b', 'c' or 'd', but got 'x'.")
+            ]
+
+            for data, message in datas:
+                with self.assertRaises(asn1tools.EncodeError) as cm:
+                    foo.encode('A', data, check_types=False)
+
+                self.assertEqual(str(cm.exception), message)
+
+            self.assertEqual(encode.call_count, 0)
+
+        with patch.object(compiled_type._type, 'decode') as decode:
+            datas = [
+                (b'\xc0', 'A.a: Expected choice index 0, 1 or 2, but got 3.'),
+                (b'\x30',
+                 'A.a.b: Expected enumeration index 0, 1 or 2, but got 3.')
+            ]
+
+            for encoded, message in datas:
+                with self.assertRaises(asn1tools.DecodeError) as cm:
+                    foo.decode('A', encoded)
+
+                self.assertEqual(str(cm.exception), message)
+
+            self.assertEqual(decode.call_count, 0)
+
+        # Other exceptions are not hidden.
+        with patch.object(compiled_type,
+                          'specialized',
+                          return_value=(None, None)):
+            with self.assertRaises(TypeError):
+                foo.encode('A', {'a': ('c', True)}, check_types=False)
+
+            with self.assertRaises(TypeError):
+                foo.decode('A', b'\x40')
+
+    def test_truncated(self):
+        # Decoding truncated data fails with the same error as the
+        # generic decoder.
+        datas = [
+            ('DRB-ToAddModList', b'\x8b'),
+            ('AS-Config', b'\xfc'),
+            ('MeasConfig', b'\xb3'),
+            ('SystemInformationBlockType5', b';'),
+            ('MeasConfig', b''),
+            ('AS-Config', b'\xfc\x00\x00')
+        ]
+
+        for codec in ['per', 'uper']:
+            generic = asn1tools.compile_files(
+                'tests/files/3gpp/rrc_8_6_0.asn',
+                codec)
+            specialized = asn1tools.compile_files(
+                'tests/files/3gpp/rrc_8_6_0.asn',
+                codec,
+                specialize=True)
+
+            for type_name, encoded in datas:
+                with self.assertRaises(asn1tools.DecodeError) as cm:
+                    generic.decode(type_name, encoded)
+
+                message = str(cm.exception)
+
+                with self.assertRaises(asn1tools.DecodeError) as cm:
+                    specialized.decode(type_name, encoded)
+
+                self.assertEqual(str(cm.exception), message)
+
+    def test_check_types(self):
+        foo = asn1tools.compile_string(
+            "Foo DEFINITIONS AUTOMATIC TAGS ::= "
+            "BEGIN "
+            "A ::= SEQUENCE { "
+            "  a INTEGER (0..7), "
+            "  b SEQUENCE (SIZE (1..2)) OF CHOICE { "
+            "    c BOOLEAN, "
+            "    d OCTET STRING (SIZE (2)), "
+            "    ..., "
+            "    e UTF8String "
+            "  } OPTIONAL, "
+            "  ..., "
+            "  f NULL "
+            "} "
+            "END",
+            'uper',
+            specialize=True)
+        decoded = {'a': 5, 'b': [('c', True), ('d', b'\x01\x02')], 'f': None}
+
+        # Types are checked while encoding, without calling the type
+        # checker.
+        with patch.object(foo.types['A'],
+                          'check_types',
+                          side_effect=foo.types['A'].check_types) as check_types:
+            self.assertEqual(foo.encode('A', decoded),
+                             b'\xec\xa0 @ \x00')
+            self.assertEqual(check_types.call_count, 0)
+
+        datas = [
+            ([], 'A: Expected data of type dict, but got [].'),
+            ({'a': None},
+             'A.a: Expected data of type int or str, but got None.'),
+            ({'a': 1, 'b': ('c', True)},
+             'A.b: Expected data of type list, but got (\'c\', True).'),
+            ({'a': 1, 'b': [('c', 1)]},
+             'A.b.c: Expected data of type bool, but got 1.'),
+            ({'a': 1, 'b': [('d', '12')]},
+             'A.b.d: Expected data of type bytes or bytearray, but got 12.'),
+            ({'a': 1, 'b': [('e', b'')]},
+             "A.b.e: Expected data of type str, but got b''."),
+            ({'a': 1, 'b': [('g', None)]},
+             "A.b: Expected choice 'c', 'd' or 'e', but got 'g'."),
+            ({'a': 1, 'f': 1}, 'A.f: Expected None, but got 1.'),
+            ({'b': [('c', True)]}, "A: Sequence member 'a' not found in "
+             "{'b': [('c', True)]}.")
+        ]
+
+        # Errors are raised while encoding, without calling the type
+        # checker afterwards.
+        with patch.object(foo.types['A'],
+                          'check_types',
+                          side_effect=foo.types['A'].check_types) as check_types:
+            for data, message in datas:
+                with self.assertRaises(asn1tools.EncodeError) as cm:
+                    foo.encode('A', data)
+
+                self.assertEqual(str(cm.exception), message)
+
+            self.assertEqual(check_types.call_count, 0)
+
+        # Other exceptions are not hidden.
+        with patch.object(foo.types['A'],
+                          'specialized_checked',
+                          return_value=None):
+            with self.assertRaises(TypeError):
+                foo.encode('A', decoded)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -7,6 +7,11 @@ import datetime
 import asn1tools.codecs.type_checker
 from copy import deepcopy
 
+try:
+    from unittest.mock import patch
+except ImportError:
+    from mock import patch
+
 sys.path.append('tests/files')
 sys.path.append('tests/files/3gpp')
 
@@ -518,6 +523,79 @@ class Asn1ToolsEncodeTypeCheckerTest(unittest.TestCase):
         information_object['InformationObject']['ErrorReturn'].encode(
             decoded)
 
+    def test_check_types_and_encode(self):
+        spec = (
+            "Foo DEFINITIONS AUTOMATIC TAGS ::= "
+            "BEGIN "
+            "A ::= SEQUENCE { "
+            "  a INTEGER, "
+            "  b BIT STRING DEFAULT '80'H, "
+            "  c SEQUENCE OF CHOICE { "
+            "    d BOOLEAN, "
+            "    e A, "
+            "    ..., "
+            "    f OCTET STRING "
+            "  } OPTIONAL, "
+            "  g [8] EXPLICIT INTEGER OPTIONAL, "
+            "  ..., "
+            "  h UTF8String, "
+            "  [[ i BOOLEAN, j INTEGER ]] "
+            "} "
+            "END")
+        decoded = {
+            'a': 1,
+            'b': (b'\x40', 2),
+            'c': [('d', True), ('e', {'a': 2}), ('f', b'\x01')],
+            'g': 3,
+            'h': 'x',
+            'i': True,
+            'j': 4
+        }
+        datas = [
+            ([], 'A: Expected data of type dict, but got [].'),
+            ({'a': None},
+             'A.a: Expected data of type int or str, but got None.'),
+            ({'a': 1, 'b': 5},
+             'A.b: Expected data of type tuple(bytes, int), but got 5.'),
+            ({'a': 1, 'c': ()},
+             'A.c: Expected data of type list, but got ().'),
+            ({'a': 1, 'c': [('d', 1)]},
+             'A.c.d: Expected data of type bool, but got 1.'),
+            ({'a': 1, 'c': [('e', {'a': 1, 'c': [('d', None)]})]},
+             'A.c.e.A.c.d: Expected data of type bool, but got None.'),
+            ({'a': 1, 'c': [('f', 'x')]},
+             'A.c.f: Expected data of type bytes or bytearray, but got x.'),
+            ({'a': 1, 'c': [('g', None)]},
+             "A.c: Expected choice 'd', 'e' or 'f', but got 'g'."),
+            ({'a': 1, 'c': [None]},
+             'A.c: Expected data of type tuple(str, object), but got None.'),
+            ({'a': 1, 'h': 1},
+             'A.h: Expected data of type str, but got 1.'),
+            ({'a': 1, 'h': 'x', 'i': True, 'j': None},
+             'A.j: Expected data of type int or str, but got None.'),
+            ({'c': []}, "A: Sequence member 'a' not found in {'c': []}.")
+        ]
+
+        # Types are checked while encoding with the generic encoders,
+        # without calling the type checker.
+        for codec in ['ber', 'der', 'per', 'uper']:
+            foo = asn1tools.compile_string(spec, codec)
+            compiled_type = foo.types['A']
+
+            with patch.object(compiled_type,
+                              'check_types',
+                              side_effect=compiled_type.check_types) as check_types:
+                self.assertEqual(foo.encode('A', decoded),
+                                 foo.encode('A', decoded, check_types=False))
+
+                for data, message in datas:
+                    with self.assertRaises(asn1tools.EncodeError) as cm:
+                        foo.encode('A', data)
+
+                    self.assertEqual(str(cm.exception), message)
+
+                self.assertEqual(check_types.call_count, 0)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -775,6 +775,47 @@ class Asn1ToolsUPerTest(Asn1ToolsBaseTest):
         for type_name, decoded, encoded in datas:
             self.assert_encode_decode(foo, type_name, decoded, encoded)
 
+    def test_sequence_of_fixed_size_elements(self):
+        foo = asn1tools.compile_string(
+            "Foo DEFINITIONS AUTOMATIC TAGS ::= "
+            "BEGIN "
+            "A ::= SEQUENCE (SIZE (0..10)) OF INTEGER (-3..3) "
+            "B ::= SEQUENCE OF INTEGER (0..65535) "
+            "C ::= SEQUENCE { "
+            "  a BOOLEAN, "
+            "  b SEQUENCE (SIZE (3)) OF INTEGER (1..300) "
+            "} "
+            "D ::= SEQUENCE (SIZE (0..10)) OF BOOLEAN "
+            "E ::= SEQUENCE OF INTEGER (-128..127) "
+            "END",
+            'uper')
+
+        datas = [
+            ('A', [-3, 0, 3, 1], b'\x40\xf4'),
+            ('B', [1, 2, 65535], b'\x03\x00\x01\x00\x02\xff\xff'),
+            ('B', 16384 * [1], b'\xc1' + 16384 * b'\x00\x01' + b'\x00'),
+            ('C', {'a': True, 'b': [1, 256, 300]}, b'\x80\x1f\xf2\xb0'),
+            ('D', [True, False, True], b'\x3a'),
+            ('E', [-128, 0, 127], b'\x03\x00\x80\xff')
+        ]
+
+        for type_name, decoded, encoded in datas:
+            self.assert_encode_decode(foo, type_name, decoded, encoded)
+
+        # Out of data at the first element that does not fit.
+        datas = [
+            ('A', b'\x40', 'A: out of data (At bit offset: 7)'),
+            ('B', b'\x03\x00\x01\x00\x02\xff',
+             'B: out of data (At bit offset: 40)'),
+            ('C', b'\x80\x1f\xf2', 'C.b: out of data (At bit offset: 19)')
+        ]
+
+        for type_name, encoded, message in datas:
+            with self.assertRaises(asn1tools.DecodeError) as cm:
+                foo.decode(type_name, encoded)
+
+            self.assertEqual(str(cm.exception), message)
+
     def test_choice(self):
         foo = asn1tools.compile_string(
             "Foo DEFINITIONS AUTOMATIC TAGS ::= "
@@ -1247,6 +1288,8 @@ class Asn1ToolsUPerTest(Asn1ToolsBaseTest):
             "  a BMPString (SIZE(1..128)), "
             "  b BMPString (SIZE(1..256)) "
             "} "
+            "D ::= BMPString (FROM (\"a\"..\"z\")) (SIZE (3)) "
+            "E ::= BMPString (FROM (\"\ud7f0\"..\"\ud80f\")) "
             "END",
             'uper')
 
@@ -1257,11 +1300,26 @@ class Asn1ToolsUPerTest(Asn1ToolsBaseTest):
             ('C',
              {'a': '123', 'b': '123'},
              b'\x04\x00\x62\x00\x64\x00\x66\x04\x00\x62\x00\x64\x00\x66'),
+            ('D', 'abc', b'\x00\x44')
         ]
 
         for type_name, decoded, encoded in datas:
             self.assert_encode_decode(foo, type_name, decoded, encoded)
 
+        # Invalid characters are found before running out of data.
+        with self.assertRaises(asn1tools.DecodeError) as cm:
+            foo.decode('D', b'\xff\xff')
+
+        self.assertEqual(str(cm.exception),
+                         'D: Expected a value in {}, but got 31.'.format(
+                             list(range(26))))
+
+        # Surrogates are not characters.
+        self.assertEqual(foo.decode('E', b'\x01\x78'), '\ud7ff')
+
+        with self.assertRaises(UnicodeDecodeError):
+            foo.decode('E', b'\x01\x80')
+
     def test_graphic_string(self):
         foo = asn1tools.compile_string(
             "Foo DEFINITIONS AUTOMATIC TAGS ::= "
@@ -2566,6 +2624,32 @@ class Asn1ToolsUPerTest(Asn1ToolsBaseTest):
 
             self.assertEqual(str(cm.exception), message)
 
+    def test_extension_bit_after_long_root(self):
+        foo = asn1tools.compile_string(
+            "Foo DEFINITIONS AUTOMATIC TAGS ::= "
+            "BEGIN "
+            "A ::= SEQUENCE { "
+            "  a OCTET STRING (SIZE(20)), "
+            "  b BIT STRING (SIZE(3)), "
+            "  ..., "
+            "  c BOOLEAN "
+            "} "
+            "END",
+            'uper')
+
+        decoded = {
+            'a': bytes(range(20)),
+            'b': (b'\xa0', 3),
+            'c': True
+        }
+        encoded = (
+            b'\x80\x00\x81\x01\x82\x02\x83\x03\x84\x04\x85\x05\x86\x06\x87\x07'
+            b'\x88\x08\x89\x09\xd0\x10\x18\x00'
+        )
+
+        self.assert_encode_decode(foo, 'A', decoded, encoded)
+        self.assertEqual(foo.decode('A', memoryview(encoded)), decoded)
+
     def test_oma_ulp(self):
         ulp = asn1tools.compile_dict(deepcopy(OMA_ULP), 'uper')
 